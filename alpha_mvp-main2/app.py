@@ -2,13 +2,19 @@
 정부지원사업 맞춤 추천 MVP
 Streamlit Cloud 배포용 메인 애플리케이션
 """
+import os
+import sys
 import streamlit as st
 import pandas as pd
 import altair as alt
-from datetime import datetime, timedelta
+from datetime import timedelta
 from supabase import create_client
 from config_cloud import SUPABASE_URL, SUPABASE_KEY
 
+# 신청기간 파서는 github/period_parser.py를 함께 사용
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'github'))
+from period_parser import days_until_end, parse_period_series
+
 # 페이지 설정
 st.set_page_config(
     page_title="정부지원사업 맞춤 추천 MVP",
@@ -36,45 +42,12 @@ def calculate_dday(application_period):
     if pd.isna(application_period) or not application_period:
         return None
     
-    try:
-        period_str = str(application_period).strip()
-        if not period_str or period_str in ['', '세부사업별 상이', '-']:
-            return None
-        
-        # YYYYMMDD 형식 처리
-        if len(period_str) == 8 and period_str.isdigit():
-            year = int(period_str[:4])
-            month = int(period_str[4:6])
-            day = int(period_str[6:8])
-            end_date = datetime(year, month, day)
-        elif '~' in period_str:
-            end_date_str = period_str.split('~')[1].strip()
-            date_formats = ['%Y-%m-%d', '%Y.%m.%d', '%m/%d/%Y', '%d/%m/%Y', '%Y%m%d']
-            end_date = None
-            for fmt in date_formats:
-                try:
-                    end_date = datetime.strptime(end_date_str, fmt)
-                    break
-                except ValueError:
-                    continue
-        else:
-            date_formats = ['%Y-%m-%d', '%Y.%m.%d', '%m/%d/%Y', '%d/%m/%Y', '%Y%m%d']
-            end_date = None
-            for fmt in date_formats:
-                try:
-                    end_date = datetime.strptime(period_str, fmt)
-                    break
-                except ValueError:
-                    continue
-        
-        if end_date:
-            today = datetime.now()
-            delta = end_date - today
-            return delta.days
-    except Exception:
-        pass
-    
-    return None
+    period_str = str(application_period).strip()
+    if not period_str or period_str in ['', '세부사업별 상이', '-']:
+        return None
+    
+    # 종료일(기간이 아니면 해당 날짜)까지 남은 일수
+    return days_until_end(period_str)
 
 def load_company_data():
     """회사 데이터 로드"""
@@ -436,60 +409,23 @@ def render_roadmap(company_name: str):
     
     recommendations_df = recommendations_df.rename(columns=column_mapping)
     
-    # 로드맵 데이터 생성
-    roadmap_data = []
-    
-    for idx, row in recommendations_df.iterrows():
-        if pd.notna(row['application_period']):
-            try:
-                period_str = str(row['application_period']).strip()
-                if not period_str or period_str in ['', '세부사업별 상이', '-']:
-                    continue
-                
-                if len(period_str) == 8 and period_str.isdigit():
-                    year = int(period_str[:4])
-                    month = int(period_str[4:6])
-                    day = int(period_str[6:8])
-                    start_date = datetime(year, month, day)
-                elif '~' in period_str:
-                    start_date_str = period_str.split('~')[0].strip()
-                    date_formats = ['%Y-%m-%d', '%Y.%m.%d', '%m/%d/%Y', '%d/%m/%Y', '%Y%m%d']
-                    start_date = None
-                    for fmt in date_formats:
-                        try:
-                            start_date = datetime.strptime(start_date_str, fmt)
-                            break
-                        except ValueError:
-                            continue
-                else:
-                    date_formats = ['%Y-%m-%d', '%Y.%m.%d', '%m/%d/%Y', '%d/%m/%Y', '%Y%m%d']
-                    start_date = None
-                    for fmt in date_formats:
-                        try:
-                            start_date = datetime.strptime(period_str, fmt)
-                            break
-                        except ValueError:
-                            continue
-                
-                if start_date:
-                    month = start_date.month
-                    roadmap_data.append({
-                        'month': month,
-                        'title': row['announcement_title'],
-                        'agency': row['agency'],
-                        'score': row['score'],
-                        'period': row['application_period'],
-                        'url': row['url'],
-                        'date': start_date
-                    })
-            except Exception as e:
-                continue
-    
-    if not roadmap_data:
+    # 로드맵 데이터 생성 (신청기간 시작일을 한 번에 파싱, 시작일을 알 수 없는 공고는 제외)
+    start_dates = parse_period_series(recommendations_df['application_period'])['start_date']
+    roadmap_df = pd.DataFrame({
+        'month': start_dates.dt.month,
+        'title': recommendations_df['announcement_title'],
+        'agency': recommendations_df['agency'],
+        'score': recommendations_df['score'],
+        'period': recommendations_df['application_period'],
+        'url': recommendations_df['url'],
+        'date': start_dates
+    }).dropna(subset=['date'])
+    
+    if roadmap_df.empty:
         st.info("로드맵을 생성할 수 있는 데이터가 없습니다.")
         return
     
-    roadmap_df = pd.DataFrame(roadmap_data)
+    roadmap_df['month'] = roadmap_df['month'].astype(int)
     
     # 월별 공고 수 현황
     st.subheader("📊 월별 공고 수 현황")
@@ -6,13 +6,43 @@ from datetime import datetime, date, timedelta
 import json
 import os
 import sys
-import re
 
 # 상위 디렉토리의 모듈 import를 위해 경로 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Supabase 클라이언트 import
-from supabase_client import supabase_client
+from company_store import CompanyStore
+from company_directory import company_directory, SOURCE_SUPABASE, SOURCE_LAST_KNOWN_GOOD, SOURCE_SAMPLE
+from supabase_client import (
+    supabase_client,
+    RecommendationContext,
+    RECOMMENDATION_VIEW,
+    NEW_ANNOUNCEMENT_VIEW,
+    DEADLINE_VIEW,
+    COMPANY_STORE_KEY,
+)
+from async_supabase_client import dashboard_loader
+from metrics import metrics
+from prefetch import prefetcher
+from health import health_probe
+from session_memory import enforce_budget, session_memory_report
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from period_parser import parse_period, parse_period_series
+
+# 처음 실행 시 기본으로 선택되는 회사
+DEFAULT_COMPANY_NAME = "대박드림스"
+
+# 사이드바 회사 검색 결과 최대 개수 (순위순)
+SEARCH_RESULT_LIMIT = 50
+
+# ?admin=<토큰>으로 접속하면 계측 패널 표시 (ADMIN_PANEL_TOKEN을 설정하지 않으면 패널 비활성화)
+ADMIN_PANEL_TOKEN = os.environ.get("ADMIN_PANEL_TOKEN") or None
+
+# SUPABASE_METRICS_PATH가 설정되어 있으면 Prometheus 텍스트 파일을 주기적으로 기록
+metrics.start_exporter()
+
+# Supabase 상태를 백그라운드에서 주기적으로 확인 (화면 코드는 보관된 상태만 읽음)
+health_probe.start()
 
 # Supabase 기반 추천 시스템 사용
 
@@ -69,29 +99,63 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-def load_company_list():
-    """Supabase에서 회사 목록을 로드하는 함수"""
+def prefetch_dashboard(company_name, include_companies=False):
+    """대시보드에 필요한 조회를 동시에 실행해 캐시를 채우는 함수 (실패 시 빈 결과)"""
+    if supabase_client.mirror is not None or supabase_client.is_degraded():
+        # 로컬 미러를 읽거나 Supabase 장애로 서킷이 열려 있으면 네트워크 동시 조회를 건너뜀
+        return {}
     try:
-        # Supabase 연결 테스트
-        if hasattr(supabase_client, 'test_connection'):
-            connection_ok = supabase_client.test_connection()
-            if not connection_ok:
-                st.warning("⚠️ Supabase 연결에 실패했습니다. 샘플 데이터를 사용합니다.")
-                return get_sample_companies()
+        return dashboard_loader.load_dashboard(company_name, include_companies)
+    except Exception as e:
+        print(f"⚠️ 대시보드 동시 조회 실패, 순차 조회로 진행합니다: {e}")
+        return {}
+
+def load_company_list(dashboard=None):
+    """Supabase에서 회사 목록(CompanyStore)을 로드해 공유 회사 목록으로 등록하는 함수 (dashboard: 동시 조회 결과)"""
+    dashboard = dashboard or {}
+    try:
+        # 별도 연결 테스트 없이 백그라운드 probe가 보관한 상태만 확인 (네트워크 I/O 없음)
+        if health_probe.is_down():
+            return load_fallback_company_list()
         
-        # Supabase에서 회사 목록 가져오기
-        companies = supabase_client.get_companies()
+        # Supabase에서 회사 목록 가져오기 (실패하면 서킷 브레이커가 마지막 정상 목록으로 응답)
+        if dashboard.get('companies'):
+            companies = dashboard['companies']
+        else:
+            companies = supabase_client.get_company_store()
         
+        if companies and 'alpha_companies_final' in supabase_client.serving_stale():
+            st.warning("⚠️ Supabase 연결에 실패했습니다. 마지막으로 불러온 회사 목록을 사용합니다.")
+            return company_directory.publish(companies, SOURCE_LAST_KNOWN_GOOD)
         if companies:
             st.success(f"✅ {len(companies)}개 회사 데이터를 Supabase에서 로드했습니다.")
-            return companies
+            return company_directory.publish(companies, SOURCE_SUPABASE)
         else:
             st.warning("⚠️ Supabase에서 회사 데이터를 가져올 수 없습니다. 샘플 데이터를 사용합니다.")
-            return get_sample_companies()
+            return company_directory.publish(CompanyStore.from_records(get_sample_companies()), SOURCE_SAMPLE)
             
     except Exception as e:
         st.error(f"회사 목록 로드 중 오류: {str(e)}")
-        return get_sample_companies()
+        return company_directory.publish(CompanyStore.from_records(get_sample_companies()), SOURCE_SAMPLE)
+
+def load_fallback_company_list():
+    """Supabase 장애 중: 마지막으로 성공한 회사 목록, 없으면 샘플 데이터를 공유 회사 목록으로 등록"""
+    last_companies = supabase_client.last_known_good(COMPANY_STORE_KEY)
+    if last_companies:
+        st.warning("⚠️ Supabase 연결에 실패했습니다. 마지막으로 불러온 회사 목록을 사용합니다.")
+        return company_directory.publish(last_companies, SOURCE_LAST_KNOWN_GOOD)
+    st.warning("⚠️ Supabase 연결에 실패했습니다. 샘플 데이터를 사용합니다.")
+    return company_directory.publish(CompanyStore.from_records(get_sample_companies()), SOURCE_SAMPLE)
+
+# 재실행마다 새로 만들어지는 요청 범위 데이터 컨텍스트
+_data_context = None
+
+def get_data_context():
+    """현재 재실행의 데이터 컨텍스트 반환 (회사별 추천 공고를 한 번만 조회)"""
+    global _data_context
+    if _data_context is None:
+        _data_context = RecommendationContext(supabase_client)
+    return _data_context
 
 def get_sample_companies():
     """샘플 회사 목록 반환"""
@@ -138,24 +202,28 @@ def get_company_info_for_recommendation(selected_company):
     }
 
 def main():
+    # 재실행마다 데이터 컨텍스트 초기화
+    global _data_context
+    _data_context = RecommendationContext(supabase_client)
+    
     # 메인 헤더
     st.markdown('<h1 class="main-header">🚀 스타트업 정부지원사업 추천 시스템</h1>', unsafe_allow_html=True)
+    stale_banner = st.empty()
     
-    # 회사 목록 로드
-    if 'company_list' not in st.session_state:
-        st.session_state.company_list = load_company_list()
+    # 회사 목록은 모든 세션이 공유하는 프로세스 전역 목록을 참조 (세션마다 복사하지 않음)
+    # 프로세스에서 처음에만 회사 목록과 기본 회사 추천 공고를 동시에 조회 (연결 상태는 health_probe가 확인)
+    if not company_directory.loaded:
+        dashboard = prefetch_dashboard(DEFAULT_COMPANY_NAME, include_companies=True)
+        load_company_list(dashboard)
+    company_list = company_directory.current()
     
     # 선택된 회사 정보 (세션 상태에 저장)
     if 'selected_company' not in st.session_state:
         st.session_state.selected_company = None
         
         # 처음 실행 시 "대박드림스"를 기본으로 선택
-        if st.session_state.company_list:
-            default_company = next(
-                (company for company in st.session_state.company_list 
-                 if company['name'] == "대박드림스"), 
-                None
-            )
+        if company_list:
+            default_company = company_list.get(DEFAULT_COMPANY_NAME)
             if default_company:
                 st.session_state.selected_company = default_company
     
@@ -164,14 +232,16 @@ def main():
         st.markdown("### 🏢 회사 선택")
         
         # 회사 검색 및 선택
-        search_term = st.text_input("🔍 회사명 검색", placeholder="회사명을 입력하세요...")
+        search_term = st.text_input("🔍 회사명 검색", placeholder="회사명 또는 초성(예: ㄷㅂㄷㄹ)을 입력하세요...")
         
-        # 검색 결과 필터링
+        # 검색 결과 필터링 (초성 검색 가능, 예: ㄷㅂㄷㄹ)
         if search_term:
-            filtered_companies = [company for company in st.session_state.company_list 
-                                if search_term.lower() in company['name'].lower()]
+            filtered_companies = company_list.search(search_term, limit=SEARCH_RESULT_LIMIT)
         else:
-            filtered_companies = st.session_state.company_list[:20]  # 처음 20개만 표시
+            filtered_companies = company_list.head(20)  # 처음 20개만 표시
+        
+        # 보이는 회사와 자주 선택되는 회사의 추천 공고를 백그라운드에서 미리 조회
+        prefetcher.prefetch([company['name'] for company in filtered_companies] + prefetcher.most_selected())
         
         # 회사 선택 드롭다운
         if filtered_companies:
@@ -182,7 +252,7 @@ def main():
             default_index = 0
             if not search_term:  # 검색 중이 아닐 때만 기본값 적용
                 for i, option in enumerate(company_options):
-                    if "대박드림스" in option:
+                    if DEFAULT_COMPANY_NAME in option:
                         default_index = i + 1  # +1 because of "회사를 선택하세요..." option
                         break
             
@@ -195,13 +265,12 @@ def main():
             if selected_option != "회사를 선택하세요...":
                 # 선택된 회사 정보 추출
                 selected_company_name = selected_option.split(" (")[0]
-                selected_company = next(
-                    (company for company in filtered_companies 
-                     if company['name'] == selected_company_name), 
-                    None
-                )
+                selected_company = company_list.get(selected_company_name)
                 
                 if selected_company:
+                    previous = st.session_state.selected_company
+                    if previous is None or previous['name'] != selected_company_name:
+                        prefetcher.record_selection(selected_company_name)
                     st.session_state.selected_company = selected_company
                     st.success(f"✅ {selected_company_name} 선택됨")
         else:
@@ -235,6 +304,84 @@ def main():
     
     with tab3:
         show_roadmap_tab()
+    
+    # 이번 화면에서 장애로 저장된 데이터를 사용했다면 헤더 아래에 표시
+    show_stale_banner(stale_banner)
+    
+    # 세션 메모리 예산을 넘은 산출물 정리 및 세션별 사용량 기록
+    enforce_session_budget()
+    
+    if is_admin_request():
+        show_admin_panel()
+
+def enforce_session_budget():
+    """이 세션의 session_state가 메모리 예산을 넘으면 큰 산출물부터 제거"""
+    ctx = get_script_run_ctx(suppress_warning=True)
+    session_id = ctx.session_id if ctx is not None else 'local'
+    enforce_budget(session_id, st.session_state, shared=(company_directory.current(),))
+
+def is_admin_request():
+    """URL 쿼리 파라미터 admin이 관리자 토큰과 일치하는지 여부 (토큰이 없으면 항상 False)"""
+    if not ADMIN_PANEL_TOKEN:
+        return False
+    if hasattr(st, 'query_params'):
+        value = st.query_params.get('admin')
+    else:
+        value = (st.experimental_get_query_params().get('admin') or [None])[0]
+    return value == ADMIN_PANEL_TOKEN
+
+def show_admin_panel():
+    """SupabaseClient 계측 결과를 보여주는 숨은 관리자 패널"""
+    st.markdown("---")
+    with st.expander("🛠️ 데이터 조회 계측 (관리자)", expanded=True):
+        snapshot = metrics.snapshot()
+        if snapshot:
+            st.dataframe(pd.DataFrame(snapshot), width='stretch', hide_index=True)
+        else:
+            st.info("아직 기록된 조회가 없습니다.")
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.markdown("**조회 캐시**")
+            st.json(supabase_client.cache.stats())
+        with col2:
+            st.markdown("**서킷 브레이커**")
+            st.json({name: breaker.state for name, breaker in supabase_client.breakers.items()})
+        with col3:
+            st.markdown("**동시 조회 합치기**")
+            st.json(supabase_client.flights.stats())
+        with col4:
+            st.markdown("**추천 공고 prefetch**")
+            st.json(prefetcher.stats())
+        
+        st.markdown("**Supabase 상태 (백그라운드 확인)**")
+        st.json(health_probe.status())
+        
+        st.markdown(
+            f"**세션 메모리** (공유 회사 목록 {company_directory.nbytes() / 1024 / 1024:.1f} MiB, "
+            f"출처 {company_directory.source}, 예산 초과 제거 {session_memory_report.evictions}회)"
+        )
+        session_rows = session_memory_report.rows()
+        if session_rows:
+            st.dataframe(pd.DataFrame(session_rows), width='stretch', hide_index=True)
+        
+        st.download_button(
+            "Prometheus 텍스트 다운로드",
+            metrics.to_prometheus(),
+            file_name="supabase_client.prom",
+            mime="text/plain",
+        )
+        if st.button("계측 초기화"):
+            metrics.reset()
+            st.rerun()
+
+def show_stale_banner(placeholder):
+    """Supabase 장애로 마지막 정상 데이터를 보여주는 중이면 안내 문구 표시"""
+    stale = supabase_client.serving_stale()
+    if not stale:
+        return
+    saved_at = datetime.fromtimestamp(min(stale.values())).strftime('%Y-%m-%d %H:%M')
+    placeholder.warning(f"⚠️ Supabase 응답이 원활하지 않아 {saved_at} 기준으로 저장된 데이터를 표시합니다.")
 
 def show_recommendation_tab():
     """맞춤 추천 탭"""
@@ -337,8 +484,9 @@ def show_notification_tab():
         selected_company_name = st.session_state.selected_company['name'] if st.session_state.selected_company else None
         
         if selected_company_name:
-            all_recommendations = supabase_client.get_recommendations(company_name=selected_company_name, is_active_only=False)
-            new_announcements = supabase_client.get_recommendations(company_name=selected_company_name, is_new_announcements=True)
+            data_context = get_data_context()
+            all_recommendations = data_context.rows(selected_company_name)
+            new_announcements = data_context.new(selected_company_name)
         else:
             all_recommendations = []
             new_announcements = []
@@ -358,26 +506,16 @@ def show_notification_tab():
             for item in all_recommendations:
                 period_str = item.get('사업 연도', '')
                 if period_str:
-                    # 마감일 추출
-                    end_date_match = re.search(r'~\s*(\d{8})', period_str)
-                    if end_date_match:
-                        try:
-                            end_date = datetime.strptime(end_date_match.group(1), '%Y%m%d').date()
-                            days_left = (end_date - today).days
-                            if 0 <= days_left <= 7:
-                                urgent_count += 1
-                        except ValueError:
-                            pass
+                    start_date, end_date, _ = parse_period(period_str)
+                    # 마감일 기준 마감 임박 여부
+                    if end_date:
+                        days_left = (end_date - today).days
+                        if 0 <= days_left <= 7:
+                            urgent_count += 1
                     
                     # 이번 달 공고 수 계산 (시작일 기준)
-                    start_date_match = re.search(r'(\d{8})\s*~', period_str)
-                    if start_date_match:
-                        try:
-                            start_date = datetime.strptime(start_date_match.group(1), '%Y%m%d').date()
-                            if start_date.month == current_month and start_date.year == current_year:
-                                this_month_count += 1
-                        except ValueError:
-                            pass
+                    if start_date and start_date.month == current_month and start_date.year == current_year:
+                        this_month_count += 1
                 
                 # 고점수 공고 (80점 이상)
                 score = item.get('최종 점수', 0)
@@ -440,50 +578,33 @@ def get_recommendations(startup_info, recommendation_type, min_score, support_fi
     """Supabase에서 추천 공고 생성"""
     try:
         # Supabase에서 추천 데이터 가져오기
-        is_active_only = (recommendation_type == "활성 공고만")
-        recommendations = supabase_client.get_recommendations(
-            company_name=startup_info['company_name'],
-            is_active_only=is_active_only
-        )
+        data_context = get_data_context()
+        if recommendation_type == "활성 공고만":
+            recommendations = data_context.active(startup_info['company_name'])
+        else:
+            recommendations = data_context.rows(startup_info['company_name'])
         
         if not recommendations:
             st.warning(f"⚠️ '{startup_info['company_name']}'에 대한 추천 공고가 없습니다.")
             return None
         
-        # DataFrame으로 변환
-        df = pd.DataFrame(recommendations)
+        # 표시용 컬럼명으로 변환된 DataFrame (데이터소스/지원분야 등 기본값 포함)
+        df = RECOMMENDATION_VIEW.to_frame(recommendations)
         
         # 최종 점수 기준으로 정렬
-        df = df.sort_values('최종 점수', ascending=False)
+        df = df.sort_values('총점수', ascending=False)
         
         # 최소 점수 필터링
         if min_score > 0:
-            df = df[df['최종 점수'] >= min_score]
+            df = df[df['총점수'] >= min_score]
         
         # 최대 결과 수 제한
         if max_results > 0:
             df = df.head(max_results)
         
-        # 컬럼명을 기존 형식에 맞게 변경
-        df = df.rename(columns={
-            '사업명': '공고명',
-            '최종 점수': '총점수',
-            '지역': '지역명',
-            '사업 연도': '신청기간',
-            '상세페이지 URL': '공고URL'
-        })
-        
         # 순위 추가
         df['순위'] = range(1, len(df) + 1)
         
-        # 데이터소스 컬럼 추가 (기본값)
-        df['데이터소스'] = 'recommend_final'
-        
-        # 지원분야, 지원대상, 소관기관 컬럼 추가 (기본값)
-        df['지원분야'] = '기타'
-        df['지원대상'] = '중소기업'
-        df['소관기관'] = '정부기관'
-        
         st.success(f"✅ '{startup_info['company_name']}'에 대한 {len(df)}개 추천 공고를 찾았습니다!")
         
         return df
@@ -631,7 +752,7 @@ def display_new_announcements():
         selected_company_name = st.session_state.selected_company['name'] if st.session_state.selected_company else None
         
         if selected_company_name:
-            new_announcements = supabase_client.get_recommendations(company_name=selected_company_name, is_new_announcements=True)
+            new_announcements = get_data_context().new(selected_company_name)
         else:
             new_announcements = []
         
@@ -639,25 +760,12 @@ def display_new_announcements():
             st.info("신규 공고가 없습니다.")
             return
         
-        # DataFrame으로 변환
-        df = pd.DataFrame(new_announcements)
-        
-        # 컬럼명 변경
-        df = df.rename(columns={
-            '사업명': '공고명',
-            '최종 점수': '추천점수',
-            '지역': '지역',
-            '사업 연도': '신청기간',
-            '상세페이지 URL': '공고URL'
-        })
-        
-        # 등록일 컬럼 추가 (사업 연도에서 추출)
-        df['등록일'] = df['신청기간'].apply(lambda x: extract_start_date(x))
+        # 표시용 컬럼명으로 변환된 DataFrame (지원분야/지원대상/소관기관 기본값 포함)
+        df = NEW_ANNOUNCEMENT_VIEW.to_frame(new_announcements)
         
-        # 지원분야, 지원대상, 소관기관 컬럼 추가 (기본값)
-        df['지원분야'] = '기타'
-        df['지원대상'] = '중소기업'
-        df['소관기관'] = '정부기관'
+        # 등록일 컬럼 추가 (사업 연도의 시작일, 없으면 오늘)
+        start_dates = parse_period_series(df['신청기간'])['start_date']
+        df['등록일'] = start_dates.dt.strftime('%Y-%m-%d').fillna(datetime.now().strftime('%Y-%m-%d'))
         
         # 추천 점수에 따른 색상 코딩
         def highlight_high_score(row):
@@ -676,23 +784,6 @@ def display_new_announcements():
         st.info("샘플 데이터를 표시합니다.")
         display_sample_new_announcements()
 
-def extract_start_date(business_period):
-    """사업 연도에서 시작 날짜 추출"""
-    if not business_period:
-        return datetime.now().strftime('%Y-%m-%d')
-    
-    import re
-    date_match = re.search(r'(\d{8})', business_period)
-    if date_match:
-        try:
-            start_date_str = date_match.group(1)
-            start_date = datetime.strptime(start_date_str, '%Y%m%d')
-            return start_date.strftime('%Y-%m-%d')
-        except:
-            return datetime.now().strftime('%Y-%m-%d')
-    
-    return datetime.now().strftime('%Y-%m-%d')
-
 def display_sample_new_announcements():
     """샘플 신규 공고 표시"""
     sample_new_announcements = pd.DataFrame({
@@ -752,8 +843,8 @@ def display_deadline_announcements():
         selected_company_name = st.session_state.selected_company['name'] if st.session_state.selected_company else None
         
         if selected_company_name:
-            # 특정 회사의 모든 추천 공고 가져오기
-            all_recommendations = supabase_client.get_recommendations(company_name=selected_company_name, is_active_only=False)
+            # 특정 회사의 모든 추천 공고 가져오기 (이번 재실행에서 이미 조회했다면 재사용)
+            all_recommendations = get_data_context().rows(selected_company_name)
         else:
             # 모든 공고 가져오기 (전체 데이터에서 마감 임박 공고만 필터링)
             # 임시로 빈 리스트 반환 (전체 공고 조회는 성능상 권장하지 않음)
@@ -766,28 +857,22 @@ def display_deadline_announcements():
         # 마감 임박 공고 필터링 (7일 이내 또는 상시)
         today = datetime.now().date()
         deadline_announcements = []
+        remaining_days = []
         
         for item in all_recommendations:
             period_str = item.get('사업 연도', '')
             if not period_str:
                 continue
             
-            # 마감일 추출
-            end_date_match = re.search(r'~\s*(\d{8})', period_str)
-            days_left = None
-            
-            if end_date_match:
-                try:
-                    end_date = datetime.strptime(end_date_match.group(1), '%Y%m%d').date()
-                    days_left = (end_date - today).days
-                except ValueError:
-                    pass
+            # 마감일 및 상시(예산 소진시까지 포함) 여부 추출
+            _, end_date, is_always_open = parse_period(period_str)
+            days_left = (end_date - today).days if end_date else None
             
             # 마감 임박 공고 조건: 7일 이내 또는 상시/예산 소진시까지
             is_urgent = False
             remaining_days_str = '상시'
             
-            if '예산 소진시까지' in period_str or '상시' in period_str:
+            if is_always_open:
                 is_urgent = True
                 remaining_days_str = '상시'
             elif days_left is not None and 0 <= days_left <= 7:
@@ -795,23 +880,17 @@ def display_deadline_announcements():
                 remaining_days_str = str(days_left)
             
             if is_urgent:
-                deadline_announcements.append({
-                    '공고명': item.get('사업명', ''),
-                    '지원분야': '기타',  # 기본값
-                    '지원대상': '중소기업',  # 기본값
-                    '지역': item.get('지역', ''),
-                    '마감일': period_str,
-                    '남은일수': remaining_days_str,
-                    '추천점수': item.get('최종 점수', 0),
-                    '공고URL': item.get('상세페이지 URL', '')
-                })
+                deadline_announcements.append(item)
+                remaining_days.append(remaining_days_str)
         
         if not deadline_announcements:
             st.info("마감 임박 공고가 없습니다.")
             return
         
-        # DataFrame으로 변환
-        deadline_data = pd.DataFrame(deadline_announcements)
+        # 추천 공고 레코드를 컬럼 단위로 DataFrame으로 변환
+        deadline_data = DEADLINE_VIEW.to_frame(deadline_announcements)
+        deadline_data['남은일수'] = remaining_days
+        deadline_data = deadline_data[['공고명', '지원분야', '지원대상', '지역', '마감일', '남은일수', '추천점수', '공고URL']]
         
         # 추천점수 기준으로 정렬
         deadline_data = deadline_data.sort_values('추천점수', ascending=False)
@@ -890,13 +969,13 @@ def display_roadmap():
         
         # 월별 공고 수 시각화 먼저 표시
         
-        # Supabase에서 선택된 회사의 월별 데이터 가져오기
-        monthly_data = supabase_client.get_monthly_recommendations(company_name=selected_company['name'])
+        # 선택된 회사의 추천 공고를 시작 월별로 나눈 프레임 (월 클릭 시 추가 조회 없음)
+        monthly_frame = supabase_client.get_monthly_frame(selected_company['name'])
         
         # 월별 데이터를 DataFrame으로 변환
         months = ['1월', '2월', '3월', '4월', '5월', '6월', 
                  '7월', '8월', '9월', '10월', '11월', '12월']
-        counts = [monthly_data[i] for i in range(1, 13)]
+        counts = [monthly_frame.counts[i] for i in range(1, 13)]
         
         monthly_df = pd.DataFrame({
             '월': months,
@@ -934,10 +1013,9 @@ def display_roadmap():
         # 선택된 월의 상세 정보 표시
         if selected_month:
             st.markdown(f"### {months[selected_month-1]} 상세 공고")
-            monthly_details = supabase_client.get_monthly_details(selected_month, company_name=selected_company['name'])
+            details_df = monthly_frame.month(selected_month)
             
-            if monthly_details:
-                details_df = pd.DataFrame(monthly_details)
+            if not details_df.empty:
                 st.dataframe(details_df, width='stretch', hide_index=True)
             else:
                 st.info(f"{months[selected_month-1]}에는 공고가 없습니다.")
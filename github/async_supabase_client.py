@@ -0,0 +1,69 @@
+import asyncio
+import threading
+
+from supabase_client import supabase_client
+
+
+class AsyncSupabaseClient:
+    """SupabaseClient의 asyncio 버전. 여러 조회를 asyncio.gather로 동시에 실행할 수 있습니다.
+
+    각 조회는 동기 클라이언트(SupabaseClient)를 작업 스레드에서 실행하므로 같은 캐시 키와
+    페이지네이션, 서킷 브레이커, 동시 조회 합치기, 백그라운드 갱신, 계측을 그대로 공유합니다.
+    """
+
+    def __init__(self, sync_client=None):
+        self.sync_client = sync_client if sync_client is not None else supabase_client
+
+    async def get_company_store(self):
+        """alpha_companies_final 테이블을 컬럼형 CompanyStore로 가져옵니다 (SupabaseClient.get_company_store)."""
+        return await asyncio.to_thread(self.sync_client.get_company_store)
+
+    async def get_recommendations(self, company_name: str, is_active_only: bool = False, is_new_announcements: bool = False):
+        """recommend_final 테이블에서 추천 공고를 가져옵니다 (SupabaseClient.get_recommendations)."""
+        return await asyncio.to_thread(
+            self.sync_client.get_recommendations, company_name, is_active_only, is_new_announcements
+        )
+
+    async def load_dashboard(self, company_name: str = None, include_companies: bool = False):
+        """대시보드 한 화면에 필요한 조회를 동시에 실행합니다."""
+        tasks = {}
+        if include_companies:
+            # 연결 상태는 health.health_probe가 백그라운드에서 확인하므로 별도 연결 테스트는 하지 않음
+            tasks['companies'] = self.get_company_store()
+        if company_name:
+            # 로드맵(get_monthly_frame)도 이 추천 공고 캐시에서 만들어지므로 월별 집계는 따로 조회하지 않음
+            tasks['recommendations'] = self.get_recommendations(company_name)
+        results = await asyncio.gather(*tasks.values())
+        return dict(zip(tasks.keys(), results))
+
+
+class DashboardLoader:
+    """Streamlit(동기) 코드에서 AsyncSupabaseClient를 호출하기 위한 동기 래퍼.
+
+    전용 이벤트 루프 스레드 하나를 두고 모든 세션이 같은 비동기 클라이언트를 공유합니다.
+    """
+
+    def __init__(self, timeout_seconds: float = 30):
+        self.timeout_seconds = timeout_seconds
+        self._loop = None
+        self._lock = threading.Lock()
+        self.client = AsyncSupabaseClient()
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name='supabase-async-loop', daemon=True).start()
+        return self._loop
+
+    def run(self, coro):
+        """코루틴을 이벤트 루프 스레드에서 실행하고 결과를 기다립니다."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        return future.result(timeout=self.timeout_seconds)
+
+    def load_dashboard(self, company_name: str = None, include_companies: bool = False):
+        """회사 목록/추천 공고를 한 번의 왕복 시간으로 가져옵니다."""
+        return self.run(self.client.load_dashboard(company_name, include_companies))
+
+
+dashboard_loader = DashboardLoader()
@@ -0,0 +1,56 @@
+"""
+회사명 검색 인덱스(company_search) 생성 시간과 검색어별 응답 시간 (합성 회사명)
+
+사용법:
+    python benchmarks/bench_company_search.py               # 100,000개 회사
+    python benchmarks/bench_company_search.py --companies 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from company_search import CompanySearchIndex  # noqa: E402
+from synthetic import DEFAULT_COMPANY_NAME  # noqa: E402
+
+SUFFIXES = ['테크', '바이오', '랩스', '솔루션', '코리아', '에너지', '푸드', '헬스', '소프트', '로보틱스', 'AI', '']
+QUERIES = ['ㄷㅂㄷㄹ', '대박ㄷㄹ', '대박드림스', '대박', '테크', '바이오', '(주)', 'ㅅㄹㅅ', 'ai', '대박드림즈']
+
+
+def company_names(count, rng):
+    """실제와 비슷하게 2~4음절 + 흔한 접미사, 일부는 '(주)' 접두사"""
+    syllables = [chr(0xAC00 + rng.randrange(11172)) for _ in range(400)]
+    names = [DEFAULT_COMPANY_NAME]
+    for _ in range(count - 1):
+        name = ''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) + rng.choice(SUFFIXES)
+        names.append('(주)' + name if rng.random() < 0.1 else name)
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description='회사명 검색 인덱스의 검색 시간을 측정합니다.')
+    parser.add_argument('--companies', type=int, default=100_000)
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    names = company_names(args.companies, random.Random(args.seed))
+    started = time.perf_counter()
+    index = CompanySearchIndex(names)
+    print(f'인덱스 생성: {args.companies:,}개 회사, {time.perf_counter() - started:.2f}초')
+    for query in QUERIES:
+        index.search(query, args.limit)
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            positions = index.search(query, args.limit)
+        elapsed = (time.perf_counter() - started) / args.repeat * 1000
+        top = ', '.join(names[position] for position in positions[:3])
+        print(f'  {query!r:<14} {elapsed:7.3f} ms  {len(positions):>3}건  {top}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+PostgREST 응답 디코딩 + DataFrame 구성 CPU 비교 (합성 데이터, 10,000행당)
+
+    - postgrest: postgrest-py 기본 경로 (pydantic TypeAdapter 검증 디코딩 + 배치별 pd.DataFrame 후 concat)
+    - fast:      fast_json 경로 (orjson 디코딩 + 모든 행을 컬럼 단위로 한 번에 DataFrame 구성)
+응답은 1000행 페이지로 나눠 측정하고, 페이지 본문의 gzip 압축 크기도 함께 출력합니다.
+
+사용법:
+    python benchmarks/bench_decode.py               # 100,000행
+    python benchmarks/bench_decode.py --rows 10000 --repeat 5
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..'))
+
+import pandas as pd  # noqa: E402
+from postgrest.types import JSONAdapter  # noqa: E402
+
+import fast_json  # noqa: E402
+from supabase_client import COMPANY_VIEW, PERIOD_VIEW  # noqa: E402
+from synthetic import make_companies, make_recommendations  # noqa: E402
+
+PAGE_ROWS = 1000
+
+
+def pages(frame, columns):
+    """PostgREST가 보내는 것과 같은 JSON 본문(1000행 페이지) 목록"""
+    rows = json.loads(frame[list(columns)].to_json(orient='records', force_ascii=False))
+    return [
+        json.dumps(rows[i:i + PAGE_ROWS], ensure_ascii=False).encode('utf-8')
+        for i in range(0, len(rows), PAGE_ROWS)
+    ]
+
+
+def postgrest_path(bodies):
+    frames = [pd.DataFrame(JSONAdapter.validate_json(body)) for body in bodies]
+    return pd.concat(frames, ignore_index=True)
+
+
+def fast_path(bodies):
+    rows = [row for body in bodies for row in fast_json.loads(body)]
+    return fast_json.rows_to_frame(rows)
+
+
+def cpu_ms(func, bodies, repeat):
+    """repeat번 실행 중 가장 짧은 CPU 시간(ms)"""
+    best = None
+    for _ in range(repeat):
+        started = time.process_time()
+        func(bodies)
+        elapsed = (time.process_time() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PostgREST 응답 디코딩 경로의 CPU 시간을 비교합니다.')
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    if fast_json.orjson is None:
+        print('⚠️ orjson이 설치되어 있지 않아 fast 경로도 표준 json을 사용합니다.')
+
+    per = args.rows / 10_000
+    for label, frame, view in (
+        ('alpha_companies_final (get_companies)', make_companies(args.rows), COMPANY_VIEW),
+        ("recommend_final '사업 연도' (전체 월별 집계 폴백)", make_recommendations(args.rows, args.rows), PERIOD_VIEW),
+    ):
+        bodies = pages(frame, view.columns)
+        raw = sum(len(body) for body in bodies)
+        compressed = sum(len(gzip.compress(body)) for body in bodies)
+        baseline = cpu_ms(postgrest_path, bodies, args.repeat)
+        fast = cpu_ms(fast_path, bodies, args.repeat)
+        print(
+            f'{label}: {args.rows:,}행 | 본문 {raw / per / 1024:.0f} KiB → gzip {compressed / per / 1024:.0f} KiB /1만행 | '
+            f'postgrest {baseline / per:.1f} ms | fast {fast / per:.1f} ms /1만행 | {1 - fast / baseline:.0%} 절감'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+dict 행 vs __slots__ 레코드 메모리 비교 (합성 데이터)
+
+사용법:
+    python benchmarks/bench_records_memory.py            # 100,000행
+    python benchmarks/bench_records_memory.py --rows 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from records import Company, Recommendation  # noqa: E402
+
+REGIONS = ['서울특별시', '경기도', '부산광역시', '대전광역시', '전국']
+INDUSTRIES = ['IT/소프트웨어', '바이오/헬스케어', '제조', '유통', '기타']
+
+
+def recommendation_rows(count, rng):
+    return [
+        {
+            '사업명': f'2025년 창업지원사업 {i}차 공고',
+            '최종 점수': round(rng.uniform(0, 100), 2),
+            '지역': rng.choice(REGIONS),
+            '사업 연도': f'2025{rng.randint(1, 12):02d}01 ~ 2025{rng.randint(1, 12):02d}28',
+            '상세페이지 URL': f'https://www.k-startup.go.kr/web/contents/bizpbanc-ongoing.do?pbancSn={i}',
+            '기업명': f'회사{i % 5000}',
+        }
+        for i in range(count)
+    ]
+
+
+def company_rows(count, rng):
+    return [
+        {
+            'name': f'회사{i}',
+            'business_type': '법인사업자',
+            'industry': rng.choice(INDUSTRIES),
+            'region': rng.choice(REGIONS),
+            'founding_year': rng.randint(1990, 2025),
+            'employee_count': '11-50명',
+            'business_stage': '성장기(3-7년)',
+            'technology_fields': ['AI', '데이터분석'],
+            'certifications': [],
+        }
+        for i in range(count)
+    ]
+
+
+def measure(build):
+    """build()가 만든 객체가 차지하는 메모리(바이트)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    value = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, value
+
+
+def main():
+    parser = argparse.ArgumentParser(description='dict 행과 __slots__ 레코드의 행당 메모리를 비교합니다.')
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for label, make_rows, record_type in (
+        ('recommend_final', recommendation_rows, Recommendation),
+        ('company_list', company_rows, Company),
+    ):
+        # 값(문자열 등)은 양쪽이 공유하도록 원본 행을 먼저 만들고, 컨테이너 비용만 비교
+        rows = make_rows(args.rows, random.Random(args.seed))
+        dict_bytes, dicts = measure(lambda: [dict(row) for row in rows])
+        record_bytes, records = measure(lambda: record_type.from_rows(rows))
+        print(
+            f'{label}: {args.rows:,}행 | dict {dict_bytes / args.rows:.0f} B/행 | '
+            f'{record_type.__name__} {record_bytes / args.rows:.0f} B/행 | '
+            f'{1 - record_bytes / dict_bytes:.0%} 절감'
+        )
+        del dicts, records
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,231 @@
+"""
+벤치마크용 PostgREST 호환 가짜 Supabase 클라이언트 (pandas 기반, 네트워크 없음)
+
+SupabaseClient가 사용하는 범위만 구현합니다.
+    - table(name).select(*columns)
+    - eq / neq / gt / gte / lt / lte / in_ / is_ / or_ (and(...) 중첩 포함)
+    - order / limit / range / execute
+    - rpc('recommend_monthly_counts', {'p_company': ...})
+Supabase처럼 한 응답의 최대 행 수(max_rows)를 제한하고, 선택적으로 요청당 지연(latency_ms)을 넣을 수 있습니다.
+"""
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from period_parser import parse_period_series  # noqa: E402
+
+
+class Response:
+    def __init__(self, data):
+        self.data = data
+
+
+def _split_terms(text):
+    """쉼표로 구분된 PostgREST 조건을 괄호 깊이를 고려해 나눕니다."""
+    terms, depth, current = [], 0, ''
+    for char in text:
+        if char == ',' and depth == 0:
+            terms.append(current)
+            current = ''
+            continue
+        depth += char == '('
+        depth -= char == ')'
+        current += char
+    if current:
+        terms.append(current)
+    return terms
+
+
+class FakeQuery:
+    def __init__(self, backend, table):
+        self.backend = backend
+        self.table = table
+        self.columns = ('*',)
+        self.filters = []
+        self.order_by = None
+        self.row_limit = None
+        self.row_range = None
+
+    # --- 빌더 ---
+
+    def select(self, *columns):
+        self.columns = tuple(column.strip().strip('"') for column in columns) or ('*',)
+        return self
+
+    def _add(self, op, column, value):
+        self.filters.append((op, column, value))
+        return self
+
+    def eq(self, column, value):
+        return self._add('eq', column, value)
+
+    def neq(self, column, value):
+        return self._add('neq', column, value)
+
+    def gt(self, column, value):
+        return self._add('gt', column, value)
+
+    def gte(self, column, value):
+        return self._add('gte', column, value)
+
+    def lt(self, column, value):
+        return self._add('lt', column, value)
+
+    def lte(self, column, value):
+        return self._add('lte', column, value)
+
+    def in_(self, column, values):
+        return self._add('in', column, tuple(values))
+
+    def is_(self, column, value):
+        return self._add('is', column, value)
+
+    def or_(self, expression):
+        return self._add('or', None, expression)
+
+    def order(self, column, desc=False):
+        self.order_by = (self.order_by or ()) + ((column.strip('"'), desc),)
+        return self
+
+    def limit(self, count):
+        self.row_limit = count
+        return self
+
+    def range(self, start, end):
+        self.row_range = (start, end)
+        return self
+
+    # --- 실행 ---
+
+    def execute(self):
+        self.backend.requests += 1
+        if self.backend.latency_seconds:
+            time.sleep(self.backend.latency_seconds)
+        frame = self.backend.tables[self.table]
+        if self.columns == ('count',):
+            return Response([{'count': len(frame)}])
+        selected = self.backend.filtered(self.table, tuple(self.filters), self.order_by, self._mask)
+        start, stop = 0, len(selected)
+        if self.row_range is not None:
+            start, stop = self.row_range[0], self.row_range[1] + 1
+        if self.row_limit is not None:
+            stop = min(stop, start + self.row_limit)
+        stop = min(stop, start + self.backend.max_rows)
+        page = selected.iloc[start:stop]
+        if '*' not in self.columns:
+            page = page[list(self.columns)]
+        return Response(page.to_dict('records'))
+
+    def _mask(self, frame, filters):
+        mask = pd.Series(True, index=frame.index)
+        for op, column, value in filters:
+            mask &= _condition(frame, op, column, value)
+        return mask
+
+
+def _coerce(series, value):
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return pd.Timestamp(value)
+    if pd.api.types.is_numeric_dtype(series) and isinstance(value, str):
+        return pd.to_numeric(value)
+    return value
+
+
+def _condition(frame, op, column, value):
+    if op == 'or':
+        return _expression(frame, value, any_of=True)
+    series = frame[column]
+    if op == 'is':
+        if value in (None, 'null'):
+            return series.isna()
+        return series == (str(value).lower() == 'true')
+    if op == 'in':
+        return series.isin(value)
+    value = _coerce(series, value)
+    if op == 'eq':
+        return series == value
+    if op == 'neq':
+        return series != value
+    valid = series.notna()
+    if op == 'gt':
+        return valid & (series > value)
+    if op == 'gte':
+        return valid & (series >= value)
+    if op == 'lt':
+        return valid & (series < value)
+    if op == 'lte':
+        return valid & (series <= value)
+    raise ValueError(f'지원하지 않는 연산자: {op}')
+
+
+def _expression(frame, text, any_of):
+    """'col.op.value,and(col.op.value,...)' 형식의 or_/and 조건"""
+    result = None
+    for term in _split_terms(text):
+        if term.startswith(('and(', 'or(')):
+            name, inner = term.split('(', 1)
+            mask = _expression(frame, inner[:-1], any_of=(name == 'or'))
+        else:
+            column, op, value = term.split('.', 2)
+            mask = _condition(frame, op, column, value)
+        if result is None:
+            result = mask
+        else:
+            result = (result | mask) if any_of else (result & mask)
+    return result
+
+
+class FakeSupabase:
+    """테이블(DataFrame)을 메모리에 들고 PostgREST처럼 응답하는 가짜 클라이언트"""
+
+    def __init__(self, tables, max_rows=1000, latency_ms=0):
+        self.tables = tables
+        self.max_rows = max_rows
+        self.latency_seconds = latency_ms / 1000
+        self.requests = 0
+        self._last = None  # 페이지네이션 중 같은 조건을 반복 계산하지 않도록 마지막 결과 보관
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def filtered(self, table, filters, order_by, make_mask):
+        key = (table, filters, order_by)
+        if self._last is not None and self._last[0] == key:
+            return self._last[1]
+        frame = self.tables[table]
+        if filters:
+            frame = frame[make_mask(frame, filters)]
+        if order_by:
+            frame = frame.sort_values(
+                [column for column, _ in order_by], ascending=[not desc for _, desc in order_by], kind='stable'
+            )
+        self._last = (key, frame)
+        return frame
+
+    def rpc(self, name, params):
+        if name != 'recommend_monthly_counts':
+            raise ValueError(f'알 수 없는 RPC: {name}')
+        backend = self
+
+        class _Rpc:
+            def execute(self):
+                backend.requests += 1
+                if backend.latency_seconds:
+                    time.sleep(backend.latency_seconds)
+                frame = backend.tables['recommend_final']
+                company = params.get('p_company')
+                if company is not None:
+                    frame = frame[frame['기업명'] == company]
+                # sql/005와 같이 start_date가 비어 있으면 '사업 연도'를 파싱해 집계
+                start = frame['start_date'].fillna(parse_period_series(frame['사업 연도'])['start_date']).dropna()
+                counts = start.groupby([start.dt.year, start.dt.month]).size()
+                return Response([
+                    {'start_year': int(year), 'start_month': int(month), 'announcement_count': int(count)}
+                    for (year, month), count in counts.items()
+                ])
+
+        return _Rpc()
@@ -0,0 +1,171 @@
+"""
+데이터 조회 계층(SupabaseClient) 벤치마크
+
+합성 데이터를 가짜 PostgREST 백엔드(fake_backend.FakeSupabase)에 올리고
+get_companies / get_recommendations(전체·활성·신규) / get_recommendations_bulk / get_monthly_recommendations / get_monthly_details를
+캐시가 빈 상태(cold)와 캐시된 상태(warm)로 측정해 JSON으로 저장합니다.
+
+사용법:
+    python benchmarks/run_benchmarks.py                          # 1k, 10k, 100k, 1M
+    python benchmarks/run_benchmarks.py --sizes 1000 10000 --repeat 3
+    python benchmarks/run_benchmarks.py --latency-ms 20          # 요청당 네트워크 지연 흉내
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/이전결과.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..'))
+
+import pandas as pd  # noqa: E402
+
+from fake_backend import FakeSupabase  # noqa: E402
+from synthetic import DEFAULT_COMPANY_NAME, make_tables  # noqa: E402
+from supabase_client import SupabaseClient, QueryCache  # noqa: E402
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _row_count(result):
+    if isinstance(result, dict):
+        # 월별 건수 {월: 건수} 또는 일괄 조회 {회사명: 공고 목록}
+        return sum(value if isinstance(value, int) else len(value) for value in result.values())
+    return len(result)
+
+
+def _typical_company(tables):
+    """추천 공고 수가 중간값인 회사 (대박드림스는 가장 많은 공고를 가진 회사)"""
+    counts = tables['recommend_final']['기업명'].value_counts()
+    return counts.index[len(counts) // 2]
+
+
+def _portfolio(tables, size=200):
+    """추천 공고가 많은 순으로 size개 회사 (포트폴리오 일괄 조회용)"""
+    return list(tables['recommend_final']['기업명'].value_counts().index[:size])
+
+
+def operations(typical_company, portfolio):
+    """(이름, 호출 함수) 목록"""
+    month = datetime.now().month
+    return [
+        ('get_companies', lambda client: client.get_companies()),
+        ('get_recommendations[all,hot]', lambda client: client.get_recommendations(DEFAULT_COMPANY_NAME)),
+        ('get_recommendations[active,hot]', lambda client: client.get_recommendations(DEFAULT_COMPANY_NAME, is_active_only=True)),
+        ('get_recommendations[new,hot]', lambda client: client.get_recommendations(DEFAULT_COMPANY_NAME, is_new_announcements=True)),
+        ('get_recommendations[all,typical]', lambda client: client.get_recommendations(typical_company)),
+        (f'get_recommendations_bulk[{len(portfolio)}]', lambda client: client.get_recommendations_bulk(portfolio)),
+        ('get_monthly_recommendations[hot]', lambda client: client.get_monthly_recommendations(DEFAULT_COMPANY_NAME)),
+        ('get_monthly_recommendations[global]', lambda client: client.get_monthly_recommendations()),
+        ('get_monthly_details[hot]', lambda client: client.get_monthly_details(month, DEFAULT_COMPANY_NAME)),
+        ('get_monthly_details[global]', lambda client: client.get_monthly_details(month)),
+    ]
+
+
+def measure(backend, operation, repeat):
+    """캐시가 빈 클라이언트로 repeat번(cold), 같은 클라이언트로 repeat번(warm) 측정"""
+    cold, warm, requests = [], [], []
+    result = None
+    for _ in range(repeat):
+        client = SupabaseClient(cache=QueryCache(), stale_cache=QueryCache(), mirror_path=None)
+        client._client = backend
+        backend._last = None
+        before = backend.requests
+        started = time.perf_counter()
+        result = operation(client)
+        cold.append(time.perf_counter() - started)
+        requests.append(backend.requests - before)
+        for _ in range(repeat):
+            started = time.perf_counter()
+            operation(client)
+            warm.append(time.perf_counter() - started)
+    return {
+        'rows': _row_count(result),
+        'requests': statistics.median(requests),
+        'cold_ms': round(statistics.median(cold) * 1000, 3),
+        'cold_min_ms': round(min(cold) * 1000, 3),
+        'warm_ms': round(statistics.median(warm) * 1000, 4),
+    }
+
+
+def run(sizes, repeat, latency_ms, max_rows):
+    results = {}
+    for size in sizes:
+        print(f'📦 {size:,}행 데이터 생성 중...')
+        tables = make_tables(size)
+        backend = FakeSupabase(tables, max_rows=max_rows, latency_ms=latency_ms)
+        typical = _typical_company(tables)
+        results[str(size)] = {}
+        for name, operation in operations(typical, _portfolio(tables)):
+            result = measure(backend, operation, repeat)
+            results[str(size)][name] = result
+            print(f'  {name:<40} cold {result["cold_ms"]:>10.2f}ms  warm {result["warm_ms"]:>8.4f}ms  '
+                  f'rows {result["rows"]:>8,}  requests {result["requests"]:g}')
+    return results
+
+
+def compare(current, previous_path):
+    """이전 결과 대비 cold 시간 비율을 출력합니다 (1.10 이상이면 표시)."""
+    with open(previous_path, encoding='utf-8') as f:
+        previous = json.load(f)['results']
+    print(f'\n📈 {previous_path} 대비 cold 시간 비율')
+    for size, ops in current.items():
+        for name, result in ops.items():
+            before = previous.get(size, {}).get(name)
+            if not before or not before['cold_ms']:
+                continue
+            ratio = result['cold_ms'] / before['cold_ms']
+            flag = '  ⚠️ 느려짐' if ratio >= 1.10 else ''
+            print(f'  {size:>8} {name:<40} {ratio:5.2f}x{flag}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SupabaseClient 조회 성능을 합성 데이터로 측정합니다.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--repeat', type=int, default=3, help='측정 반복 횟수 (중간값 사용)')
+    parser.add_argument('--latency-ms', type=float, default=0, help='가짜 백엔드의 요청당 지연(ms)')
+    parser.add_argument('--max-rows', type=int, default=1000, help='응답당 최대 행 수 (Supabase 기본값 1000)')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: benchmarks/results/<시각>_<커밋>.json)')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat, args.latency_ms, args.max_rows)
+    commit = _git_commit()
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'settings': {'repeat': args.repeat, 'latency_ms': args.latency_ms, 'max_rows': args.max_rows},
+        'results': results,
+    }
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f'{datetime.now():%Y%m%d_%H%M%S}_{commit or "unknown"}.json')
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f'\n💾 결과 저장: {output}')
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
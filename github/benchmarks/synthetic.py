@@ -0,0 +1,95 @@
+"""
+벤치마크용 합성 alpha_companies_final / recommend_final 데이터
+
+'사업 연도'는 실제 데이터에서 관측된 여러 형식(yyyymmdd 범위, 따옴표, yyyy-mm-dd, yyyy년 m월,
+상시/예산 소진시까지)을 섞어 만들고, start_date/end_date/is_always_open은
+sql/001 마이그레이션과 같은 방식(period_parser)으로 채웁니다.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from period_parser import parse_period_series  # noqa: E402
+
+DEFAULT_COMPANY_NAME = '대박드림스'
+REGIONS = ['서울특별시', '경기도', '부산광역시', '대구광역시', '인천광역시', '광주광역시', '대전광역시', '전국']
+INDUSTRIES = ['IT/소프트웨어', '바이오/헬스케어', '제조', '유통/물류', '콘텐츠', '에너지', '농식품', '기타']
+BUSINESS_TYPES = ['법인사업자', '개인사업자', '예비창업자']
+STAGES = ['예비창업', '3년 미만', '초기', '3-7년', '성장기', '7년 이상', '성숙기']
+PATENTS = ['', 'AI', 'AI, 데이터분석', '바이오, 의료기기', 'IoT, 로봇', '친환경 소재']
+CERTIFICATIONS = ['', '벤처기업확인서', '이노비즈', '벤처기업확인서, 메인비즈', '연구개발전담부서']
+PROGRAMS = ['창업성장기술개발', '초기창업패키지', '청년창업사관학교', '수출바우처', '스마트공장 구축', 'R&D 바우처', '관광벤처 공모전']
+
+
+def _period_strings(rng, count, today):
+    """실제와 비슷한 분포의 '사업 연도' 문자열"""
+    start = today + pd.to_timedelta(rng.integers(-300, 120, count), unit='D')
+    end = start + pd.to_timedelta(rng.integers(7, 90, count), unit='D')
+    s, e = start.strftime('%Y%m%d'), end.strftime('%Y%m%d')
+    kind = rng.choice(6, size=count, p=[0.55, 0.1, 0.1, 0.1, 0.08, 0.07])
+    periods = np.where(kind == 0, s + ' ~ ' + e, '')
+    periods = np.where(kind == 1, '"' + s + '" ~ "' + e + '"', periods)
+    periods = np.where(kind == 2, start.strftime('%Y-%m-%d') + ' ~ ' + end.strftime('%Y-%m-%d'), periods)
+    periods = np.where(kind == 3, start.strftime('%Y년 %-m월'), periods)
+    periods = np.where(kind == 4, '상시', periods)
+    periods = np.where(kind == 5, s + ' ~ 예산 소진시까지', periods)
+    return periods
+
+
+def company_names(count):
+    names = [f'스타트업{i:07d}' for i in range(count)]
+    names[0] = DEFAULT_COMPANY_NAME
+    return names
+
+
+def make_companies(count, seed=0):
+    rng = np.random.default_rng(seed)
+    founded = rng.integers(1995, 2026, count)
+    founding = np.where(rng.random(count) < 0.7, founded.astype(str), pd.Series(founded).astype(str) + '.03.01.')
+    return pd.DataFrame({
+        'id': np.arange(1, count + 1),
+        '기업명': company_names(count),
+        '기업형태': rng.choice(BUSINESS_TYPES, count),
+        '업종': rng.choice(INDUSTRIES, count),
+        '지역': rng.choice(REGIONS, count),
+        '설립일': founding,
+        '고용': pd.Series(rng.integers(0, 500, count)).astype(str) + '명',
+        '업력': rng.choice(STAGES, count),
+        '기술특허': rng.choice(PATENTS, count),
+        '기업인증': rng.choice(CERTIFICATIONS, count),
+    })
+
+
+def make_recommendations(count, company_count, seed=0, today=None):
+    """company_count개 회사에 치우치게(Zipf) 배분된 추천 공고 count건. 0번 회사(대박드림스)가 가장 많습니다."""
+    rng = np.random.default_rng(seed)
+    today = pd.Timestamp(today or pd.Timestamp.now().normalize())
+    names = np.array(company_names(company_count))
+    owners = np.minimum(rng.zipf(1.3, count) - 1, company_count - 1)
+    periods = _period_strings(rng, count, today)
+    frame = pd.DataFrame({
+        'id': np.arange(1, count + 1),
+        '기업명': names[owners],
+        '사업명': pd.Series(rng.choice(PROGRAMS, count)) + ' ' + pd.Series(np.arange(count)).astype(str) + '차 공고',
+        '최종 점수': np.round(rng.uniform(30, 100, count), 2),
+        '지역': rng.choice(REGIONS, count),
+        '사업 연도': periods,
+        '상세페이지 URL': 'https://www.k-startup.go.kr/web/contents/bizpbanc-ongoing.do?pbancSn=' + pd.Series(np.arange(count)).astype(str),
+    })
+    derived = parse_period_series(frame['사업 연도'])
+    frame['start_date'] = derived['start_date']
+    frame['end_date'] = derived['end_date']
+    frame['is_always_open'] = derived['is_always_open']
+    return frame
+
+
+def make_tables(rows, seed=0):
+    """회사 rows개와 추천 공고 rows건 (공고는 회사별로 치우치게 배분)"""
+    return {
+        'alpha_companies_final': make_companies(rows, seed),
+        'recommend_final': make_recommendations(rows, rows, seed),
+    }
@@ -0,0 +1,89 @@
+"""
+Supabase 엔드포인트(테이블/RPC)별 서킷 브레이커
+
+    closed    : 정상. 연속 실패가 failure_threshold번이 되면 open
+    open      : 호출하지 않고 바로 실패 (reset_timeout 동안)
+    half_open : reset_timeout이 지나면 한 요청만 시험 호출. 성공하면 closed, 실패하면 다시 open
+"""
+import os
+import threading
+import time
+
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get("SUPABASE_BREAKER_FAILURES", "3"))
+BREAKER_RESET_SECONDS = float(os.environ.get("SUPABASE_BREAKER_RESET_SECONDS", "30"))
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 호출하지 않은 경우"""
+
+    def __init__(self, name):
+        super().__init__(f"{name} 서킷이 열려 있어 Supabase를 호출하지 않습니다.")
+        self.name = name
+
+
+class CircuitBreaker:
+    """스레드 안전 서킷 브레이커"""
+
+    def __init__(self, name, failure_threshold=BREAKER_FAILURE_THRESHOLD, reset_timeout=BREAKER_RESET_SECONDS):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """지금 호출해도 되는지 여부. half_open에서는 시험 호출 하나만 허용합니다."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            if self.state != CLOSED:
+                print(f"✅ {self.name} 서킷 복구 (closed)")
+            self.state = CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    print(f"⚠️ {self.name} 서킷 열림: {self.reset_timeout:.0f}초 동안 호출을 건너뜁니다.")
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+    def call(self, fetch):
+        """회로 상태를 확인하고 fetch()를 실행합니다. 회로가 열려 있으면 CircuitOpenError."""
+        if not self.allow():
+            raise CircuitOpenError(self.name)
+        try:
+            value = fetch()
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return value
+
+    @property
+    def is_closed(self):
+        return self.state == CLOSED
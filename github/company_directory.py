@@ -0,0 +1,72 @@
+"""
+프로세스 전역 읽기 전용 회사 목록(CompanyStore)
+
+세션마다 회사 목록을 session_state에 담지 않고, 모든 세션이 이 디렉터리의 CompanyStore 하나를
+참조로 공유합니다. CompanyStore는 조회 전용이므로(get/search/head가 새 Company 레코드를 반환)
+세션이 늘어나도 회사 목록 메모리는 한 벌만 듭니다.
+
+DIRECTORY_RECHECK_SECONDS마다 조회 캐시를 확인해 백그라운드 갱신(soft TTL)으로 바뀐 목록이 있거나
+샘플 데이터를 쓰던 중 Supabase가 복구되었으면 교체합니다. 교체 전 목록을 쓰던 재실행은 끝까지 그 목록을 씁니다.
+"""
+import threading
+import time
+
+from supabase_client import CACHE_SOFT_TTL_SECONDS, supabase_client
+
+DIRECTORY_RECHECK_SECONDS = CACHE_SOFT_TTL_SECONDS
+
+# 목록 출처
+SOURCE_SUPABASE = 'supabase'
+SOURCE_LAST_KNOWN_GOOD = 'last_known_good'
+SOURCE_SAMPLE = 'sample'
+
+
+class CompanyDirectory:
+    """모든 세션이 공유하는 회사 목록 (스레드 안전)"""
+
+    def __init__(self, client, recheck_seconds=DIRECTORY_RECHECK_SECONDS):
+        self.client = client
+        self.recheck_seconds = recheck_seconds
+        self.source = None
+        self.version = 0
+        self._store = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        return self._store is not None
+
+    def publish(self, store, source):
+        """새 회사 목록을 공유 목록으로 등록하고 검색 인덱스를 백그라운드에서 만듭니다."""
+        with self._lock:
+            if store is not self._store:
+                self._store = store
+                self.source = source
+                self.version += 1
+            self._checked_at = time.monotonic()
+        store.build_search_index_in_background()
+        return store
+
+    def current(self):
+        """공유 회사 목록 (없으면 None). Supabase 목록은 주기적으로 캐시의 최신 목록으로 교체합니다."""
+        with self._lock:
+            store, source = self._store, self.source
+            recheck = store is not None and time.monotonic() - self._checked_at >= self.recheck_seconds
+            if recheck:
+                self._checked_at = time.monotonic()
+        # 샘플/마지막 정상 목록을 쓰는 중이면 Supabase가 복구되었을 때 다시 불러옴
+        if recheck and (source == SOURCE_SUPABASE or not self.client.is_degraded()):
+            # 캐시에 있으면 바로 반환되고, soft TTL이 지났으면 백그라운드에서 갱신됩니다.
+            latest = self.client.get_company_store()
+            if latest and latest is not store:
+                store = self.publish(latest, SOURCE_SUPABASE)
+        return store
+
+    def nbytes(self):
+        store = self._store
+        return 0 if store is None else store.nbytes
+
+
+# 모든 세션이 공유하는 회사 목록
+company_directory = CompanyDirectory(supabase_client)
@@ -0,0 +1,198 @@
+"""
+회사명 검색 인덱스 (n-gram 포스팅 + 한글 초성 검색)
+
+    - 회사명을 소문자/공백 제거로 정규화하고 글자 단위 1-gram, 2-gram 포스팅을 만듭니다.
+    - 한글 음절을 초성으로 바꾼 이름('대박드림스' → 'ㄷㅂㄷㄹㅅ')에도 같은 포스팅을 만들어
+      'ㄷㅂㄷㄹ', '대박ㄷㄹ'처럼 초성이 섞인 검색어도 찾습니다.
+    - 결과는 정확히 일치 > 앞부분 일치 > 부분 일치 > 2-gram 유사(오타) 순이고,
+      같은 순위 안에서는 짧은 이름, 원래 순서가 먼저입니다.
+
+포스팅은 (이름 길이, 원래 위치) 순서의 순위 번호로 저장하므로 상위 k개를 찾으면 바로 멈춥니다.
+인덱스는 CompanyStore마다 처음 검색할 때 한 번 만들어지고, 저장소를 공유하는 모든 세션이 함께 씁니다.
+"""
+from collections import defaultdict
+
+import numpy as np
+
+_HANGUL_START = 0xAC00
+_HANGUL_END = 0xD7A3
+_JUNG_JONG = 21 * 28  # 초성 하나당 음절 수
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_CHOSUNG_SET = frozenset(CHOSUNG)
+
+# 포스팅을 하나씩 확인하는 대신 교집합을 먼저 구하는 기준 길이
+_INTERSECT_THRESHOLD = 4096
+# 오타 허용 검색에서 확인할 최대 포스팅 길이 (너무 흔한 글자 조합은 제외)
+_FUZZY_MAX_POSTING = 20_000
+
+
+def normalize(text):
+    """검색용 정규화: 소문자, 공백 제거"""
+    return ''.join(str(text).lower().split())
+
+
+def to_chosung(text):
+    """한글 음절을 초성으로 바꿉니다 (그 외 글자는 그대로)."""
+    chars = []
+    for char in text:
+        code = ord(char)
+        if _HANGUL_START <= code <= _HANGUL_END:
+            chars.append(CHOSUNG[(code - _HANGUL_START) // _JUNG_JONG])
+        else:
+            chars.append(char)
+    return ''.join(chars)
+
+
+def _grams(text):
+    """1-gram과 2-gram (중복 제거)"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def _query_grams(text):
+    """검색어를 대표하는 gram (2글자 이상이면 2-gram만)"""
+    if len(text) < 2:
+        return set(text)
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _find(name, query):
+    start = name.find(query)
+    return None if start == -1 else start
+
+
+def _finalize(postings):
+    return {gram: np.asarray(ranks, dtype=np.int32) for gram, ranks in postings.items()}
+
+
+class CompanySearchIndex:
+    """회사명 목록에 대한 읽기 전용 검색 인덱스"""
+
+    def __init__(self, names):
+        normalized = [normalize(name) for name in names]
+        # 순위 번호 = (정규화 이름 길이, 원래 위치) 순서
+        self._order = np.array(sorted(range(len(normalized)), key=lambda i: (len(normalized[i]), i)), dtype=np.int64)
+        self._names = [normalized[position] for position in self._order]
+        self._chosung = [to_chosung(name) for name in self._names]
+        self._exact = {}
+        name_postings, name_prefixes = defaultdict(list), defaultdict(list)
+        chosung_postings, chosung_prefixes = defaultdict(list), defaultdict(list)
+        for rank, (name, chosung) in enumerate(zip(self._names, self._chosung)):
+            self._exact.setdefault(name, rank)
+            for gram in _grams(name):
+                name_postings[gram].append(rank)
+            for gram in _grams(chosung):
+                chosung_postings[gram].append(rank)
+            # 앞 1글자/2글자로 앞부분 일치 후보를 바로 찾기
+            for prefix in {name[:1], name[:2]}:
+                name_prefixes[prefix].append(rank)
+            for prefix in {chosung[:1], chosung[:2]}:
+                chosung_prefixes[prefix].append(rank)
+        self._name_postings = _finalize(name_postings)
+        self._name_prefixes = _finalize(name_prefixes)
+        self._chosung_postings = _finalize(chosung_postings)
+        self._chosung_prefixes = _finalize(chosung_prefixes)
+
+    def __len__(self):
+        return len(self._names)
+
+    def search(self, term, limit=20):
+        """검색어와 맞는 회사의 원래 위치(행 번호) 목록을 순위대로 반환합니다 (limit=None이면 전체)."""
+        query = normalize(term)
+        if not query or not self._names:
+            return []
+        limit = len(self._names) if limit is None else limit
+        if any(char in _CHOSUNG_SET for char in query):
+            key = to_chosung(query)
+            ranks = self._matches(
+                key, self._chosung_postings, self._chosung_prefixes,
+                lambda rank: self._chosung_match(rank, query, key), limit, set(),
+            )
+        else:
+            ranks = []
+            exact = self._exact.get(query)
+            if exact is not None:
+                ranks.append(exact)
+            seen = set(ranks)
+            ranks += self._matches(
+                query, self._name_postings, self._name_prefixes,
+                lambda rank: _find(self._names[rank], query), limit - len(ranks), seen,
+            )
+            if not ranks:
+                # 일치하는 이름이 없을 때만 오타 허용 검색
+                ranks = self._fuzzy(query, limit)
+        return [int(self._order[rank]) for rank in ranks[:limit]]
+
+    def _matches(self, key, postings, prefixes, match, limit, seen):
+        """앞부분 일치 → 부분 일치 순서로 limit개까지 찾습니다. match(rank)는 일치 위치 또는 None."""
+        results = []
+        if limit <= 0:
+            return results
+        candidates = self._candidates(postings, key)
+        if candidates is None:
+            return results
+        # key 앞 2글자로 시작하는 이름이 없으면 앞부분 일치도 없음
+        head = prefixes.get(key[:2])
+        if head is not None and len(head) > len(candidates):
+            head = candidates
+        for accept_prefix in (True, False):
+            ranks = head if accept_prefix else candidates
+            if ranks is None:
+                continue
+            for rank in ranks.tolist():
+                if rank in seen:
+                    continue
+                start = match(rank)
+                if start is None or (accept_prefix and start != 0):
+                    continue
+                results.append(rank)
+                seen.add(rank)
+                if len(results) >= limit:
+                    return results
+        return results
+
+    def _chosung_match(self, rank, query, key):
+        """초성 이름에서 key가 나오는 위치 중 음절까지 맞는 첫 위치 (없으면 None)"""
+        chosung, name = self._chosung[rank], self._names[rank]
+        start = chosung.find(key)
+        while start != -1:
+            if all(q == n or q in _CHOSUNG_SET for q, n in zip(query, name[start:start + len(query)])):
+                return start
+            start = chosung.find(key, start + 1)
+        return None
+
+    @staticmethod
+    def _candidates(postings, text):
+        """text의 gram 포스팅 교집합 후보 (gram이 하나라도 없으면 None).
+
+        포스팅이 짧으면 가장 짧은 포스팅만 반환하고 나머지는 문자열 비교로 확인합니다.
+        """
+        lists = []
+        for gram in _query_grams(text):
+            ranks = postings.get(gram)
+            if ranks is None:
+                return None
+            lists.append(ranks)
+        lists.sort(key=len)
+        candidates = lists[0]
+        for ranks in lists[1:]:
+            if len(candidates) <= _INTERSECT_THRESHOLD:
+                break
+            candidates = np.intersect1d(candidates, ranks, assume_unique=True)
+        return candidates
+
+    def _fuzzy(self, query, limit):
+        """검색어의 2-gram을 절반 이상 공유하는 이름을 공유 개수 순으로 (오타 허용)"""
+        grams = _query_grams(query)
+        if limit <= 0 or len(grams) < 2:
+            return []
+        postings = [self._name_postings.get(gram) for gram in grams]
+        postings = [ranks for ranks in postings if ranks is not None and len(ranks) <= _FUZZY_MAX_POSTING]
+        if not postings:
+            return []
+        ranks, counts = np.unique(np.concatenate(postings), return_counts=True)
+        keep = counts >= (len(grams) + 1) // 2
+        ranks, counts = ranks[keep], counts[keep]
+        # 공유 개수 내림차순, 같으면 순위 번호(짧은 이름, 원래 순서) 오름차순
+        return ranks[np.lexsort((ranks, -counts))][:limit].tolist()
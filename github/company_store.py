@@ -0,0 +1,221 @@
+"""
+alpha_companies_final 회사 목록을 담는 컬럼형(pandas) 저장소
+
+행마다 dict를 만드는 대신 테이블 전체를 한 번에 정규화합니다.
+    - 업종/지역/기업형태/직원 수/창업 단계: category dtype
+    - 직원 수 구간: pd.cut, 창업 단계: 키워드 조건을 순서대로 적용
+    - 회사명 → 행 위치 인덱스로 O(1) 조회
+화면에는 기존 company_list 형식으로 읽을 수 있는 Company 레코드로 꺼내 씁니다.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from company_search import CompanySearchIndex
+from fast_json import rows_to_frame
+from records import Company, Record
+
+# 직원 수 구간 (0명 또는 숫자가 아닌 값은 '0명')
+EMPLOYEE_BINS = [-1, 5, 10, 50, 100, 300, np.inf]
+EMPLOYEE_LABELS = ['1-5명', '6-10명', '11-50명', '51-100명', '101-300명', '300명 이상']
+EMPLOYEE_UNKNOWN = '0명'
+
+# '업력' 키워드 → 창업 단계 (앞에 있을수록 우선)
+BUSINESS_STAGE_RULES = (
+    (('3년 미만', '초기'), '초기창업(3년 미만)'),
+    (('3-7년', '성장'), '성장기(3-7년)'),
+    (('7년 이상', '성숙'), '성숙기(7년 이상)'),
+)
+DEFAULT_BUSINESS_STAGE = '예비창업자'
+BUSINESS_STAGES = [stage for _, stage in BUSINESS_STAGE_RULES] + [DEFAULT_BUSINESS_STAGE]
+
+# alpha_companies_final 컬럼 → 저장소 컬럼 (없을 때 기본값)
+SOURCE_COLUMNS = {
+    '기업명': ('name', '알 수 없음'),
+    '기업형태': ('business_type', '법인사업자'),
+    '업종': ('industry', '기타'),
+    '지역': ('region', '전국'),
+}
+# from_batches가 한 번에 정규화하는 행 수 (원본 행 dict는 이만큼만 메모리에 둠)
+NORMALIZE_CHUNK_ROWS = 10000
+CATEGORY_COLUMNS = ('business_type', 'industry', 'region')
+LIST_COLUMNS = ('technology_fields', 'certifications')
+RECORD_COLUMNS = (
+    'name', 'business_type', 'industry', 'region', 'founding_year',
+    'employee_count', 'business_stage', 'technology_fields', 'certifications',
+)
+
+
+def _text(frame, column, default=''):
+    if column not in frame:
+        return pd.Series(default, index=frame.index, dtype=object)
+    return frame[column].where(frame[column].notna(), default).astype(str)
+
+
+def _founding_year(values: pd.Series) -> pd.Series:
+    """'설립일'에서 연도만 추출합니다 (숫자나 숫자만 있는 문자열이면 그대로, 'YYYY.MM.DD.'이면 연도)."""
+    # 숫자 컬럼은 NULL이 섞이면 float(2020.0)이 되어 문자열로 바꾸면 맞지 않으므로 문자열이 아닌 값은 숫자로 변환
+    is_text = values.map(lambda value: isinstance(value, str)).astype(bool)
+    numbers = pd.to_numeric(values.where(~is_text), errors='coerce')
+    numbers = numbers.where(numbers == numbers.round())
+    text = values.where(is_text, '').astype(str)
+    digits = text.where(text.str.fullmatch(r'\d+'))
+    dotted = text.str.extract(r'^(\d{4})\.\d{2}\.\d{2}\.$', expand=False)
+    years = pd.to_numeric(digits.fillna(dotted), errors='coerce')
+    return numbers.fillna(years).astype('Int64')
+
+
+def _employee_bucket(values: pd.Series) -> pd.Series:
+    """'6명' 같은 '고용' 값을 직원 수 구간으로 변환합니다."""
+    text = values.str.replace('명', '', regex=False).str.strip()
+    count = pd.to_numeric(text.where(text.str.fullmatch(r'\d+')), errors='coerce')
+    buckets = pd.cut(count, bins=EMPLOYEE_BINS, labels=EMPLOYEE_LABELS)
+    return buckets.cat.add_categories([EMPLOYEE_UNKNOWN]).fillna(EMPLOYEE_UNKNOWN)
+
+
+def _business_stage(values: pd.Series) -> pd.Series:
+    """'업력' 값을 창업 단계로 변환합니다."""
+    conditions = [
+        values.str.contains('|'.join(keywords), regex=True)
+        for keywords, _ in BUSINESS_STAGE_RULES
+    ]
+    choices = [stage for _, stage in BUSINESS_STAGE_RULES]
+    stages = np.select(conditions, choices, default=DEFAULT_BUSINESS_STAGE)
+    return pd.Categorical(stages, categories=BUSINESS_STAGES)
+
+
+def _split_list(value):
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def normalize_companies(frame: pd.DataFrame) -> pd.DataFrame:
+    """alpha_companies_final 원본 DataFrame을 저장소 형식으로 한 번에 변환합니다."""
+    columns = {}
+    for source, (target, default) in SOURCE_COLUMNS.items():
+        columns[target] = _text(frame, source, default)
+    founded = frame['설립일'] if '설립일' in frame else pd.Series(None, index=frame.index, dtype=object)
+    columns['founding_year'] = _founding_year(founded)
+    columns['employee_count'] = _employee_bucket(_text(frame, '고용', EMPLOYEE_UNKNOWN))
+    columns['business_stage'] = _business_stage(_text(frame, '업력'))
+    # 기술특허/기업인증은 원문(쉼표 구분)으로 두고 record로 꺼낼 때 리스트로 변환
+    columns['technology_fields'] = _text(frame, '기술특허')
+    columns['certifications'] = _text(frame, '기업인증')
+    normalized = pd.DataFrame(columns, index=frame.index).reset_index(drop=True)
+    for column in CATEGORY_COLUMNS + LIST_COLUMNS:
+        normalized[column] = normalized[column].astype('category')
+    return normalized
+
+
+class CompanyStore:
+    """정규화된 회사 목록 (컬럼형) + 회사명 인덱스"""
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        names = frame['name'].tolist()
+        # 같은 이름이 여러 개면 먼저 나온 회사를 사용 (기존 next(...) 선형 검색과 동일)
+        self._positions = {}
+        for position, name in enumerate(names):
+            self._positions.setdefault(name, position)
+        self._search_index = None
+        self._search_lock = threading.Lock()
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Supabase 원본 행 목록으로 저장소를 만듭니다."""
+        return cls(normalize_companies(pd.DataFrame(list(rows))))
+
+    @classmethod
+    def from_batches(cls, batches):
+        """iter_rows 배치들을 이어 붙여 저장소를 만듭니다."""
+        # 테이블 전체 행(dict)을 모아 두지 않고 NORMALIZE_CHUNK_ROWS행마다 정규화(category)한 뒤 원본 행은 버림
+        frames, pending = [], []
+        for batch in batches:
+            pending.extend(batch)
+            if len(pending) >= NORMALIZE_CHUNK_ROWS:
+                frames.append(normalize_companies(rows_to_frame(pending)))
+                pending = []
+        if pending or not frames:
+            frames.append(normalize_companies(rows_to_frame(pending)))
+        if len(frames) == 1:
+            return cls(frames[0])
+        frame = pd.concat(frames, ignore_index=True)
+        # 조각마다 카테고리 값이 달라 object로 합쳐진 컬럼을 다시 category로 변환
+        for column in CATEGORY_COLUMNS + LIST_COLUMNS:
+            frame[column] = frame[column].astype('category')
+        return cls(frame)
+
+    @classmethod
+    def from_records(cls, records):
+        """이미 company_list 형식인 dict/Company 목록(샘플 데이터 등)으로 저장소를 만듭니다."""
+        rows = [record.to_dict() if isinstance(record, Record) else record for record in records]
+        frame = pd.DataFrame(rows, columns=RECORD_COLUMNS)
+        for column in LIST_COLUMNS:
+            frame[column] = frame[column].map(lambda values: ', '.join(values or []))
+        frame['founding_year'] = frame['founding_year'].astype('Int64')
+        for column in CATEGORY_COLUMNS + LIST_COLUMNS + ('employee_count', 'business_stage'):
+            frame[column] = frame[column].astype('category')
+        return cls(frame)
+
+    def __len__(self):
+        return len(self.frame)
+
+    def __bool__(self):
+        return len(self.frame) > 0
+
+    def __contains__(self, name):
+        return name in self._positions
+
+    @property
+    def nbytes(self):
+        return int(self.frame.memory_usage(deep=True).sum())
+
+    def records(self, positions):
+        """주어진 행 위치의 회사들을 Company 레코드 목록으로 반환합니다."""
+        rows = self.frame.iloc[positions]
+        founding_years = rows['founding_year'].astype(object).where(rows['founding_year'].notna(), None)
+        columns = [rows[column].tolist() for column in RECORD_COLUMNS if column != 'founding_year']
+        records = []
+        for (name, business_type, industry, region, employee_count, business_stage,
+             technology_fields, certifications), founding_year in zip(zip(*columns), founding_years.tolist()):
+            records.append(Company(
+                name,
+                business_type,
+                industry,
+                region,
+                None if founding_year is None else int(founding_year),
+                employee_count,
+                business_stage,
+                _split_list(technology_fields),
+                _split_list(certifications),
+            ))
+        return records
+
+    def get(self, name):
+        """회사명으로 회사를 찾습니다 (없으면 None)."""
+        position = self._positions.get(name)
+        return None if position is None else self.records([position])[0]
+
+    def head(self, limit: int = 20):
+        return self.records(np.arange(min(limit, len(self.frame))))
+
+    @property
+    def search_index(self):
+        """회사명 검색 인덱스 (처음 검색할 때 한 번 생성)"""
+        if self._search_index is None:
+            with self._search_lock:
+                if self._search_index is None:
+                    self._search_index = CompanySearchIndex(self.frame['name'].fillna('').tolist())
+        return self._search_index
+
+    def build_search_index_in_background(self):
+        """첫 검색이 인덱스 생성을 기다리지 않도록 백그라운드 스레드에서 미리 만듭니다."""
+        if self._search_index is None:
+            threading.Thread(target=lambda: self.search_index, name='company-search-index', daemon=True).start()
+
+    def search(self, term: str, limit: int = None):
+        """회사명 검색 결과를 순위대로 반환합니다 (초성 검색, 오타 허용; company_search 참고)."""
+        return self.records(self.search_index.search(term, limit))
+
+    def to_records(self):
+        return self.records(np.arange(len(self.frame)))
@@ -0,0 +1,75 @@
+"""
+큰 PostgREST 응답을 빠르게 받는 경로 (선택 의존성: orjson, brotli)
+
+postgrest-py는 응답 본문을 pydantic TypeAdapter로 검증하며 디코딩하는데, 회사 목록처럼
+전체 테이블을 받는 조회에서는 이 디코딩이 CPU 대부분을 차지합니다.
+orjson이 설치되어 있으면 같은 요청을 보내고 본문을 orjson으로 바로 디코딩합니다.
+압축은 공유 httpx 클라이언트가 Accept-Encoding(gzip, brotli 설치 시 br)으로 요청하고 httpx가 풀어 줍니다.
+
+SUPABASE_FAST_DECODE=0으로 끌 수 있습니다. 설치된 postgrest-py에 send_with_retry가 없으면 자동으로 꺼집니다.
+"""
+import json
+import os
+
+import pandas as pd
+from postgrest.exceptions import APIError
+
+try:
+    # postgrest-py 내부 함수 (없는 버전이면 빠른 경로를 쓰지 않고 query.execute()로 처리)
+    from postgrest._sync.request_builder import send_with_retry
+except ImportError:
+    send_with_retry = None
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+try:
+    import brotli  # noqa: F401  httpx가 br 응답을 풀 때 사용
+    ACCEPT_ENCODING = 'br, gzip'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip'
+
+FAST_DECODE = (
+    os.environ.get("SUPABASE_FAST_DECODE", "1") != "0" and orjson is not None and send_with_retry is not None
+)
+
+
+def loads(content):
+    """JSON 바이트를 디코딩합니다 (orjson이 없으면 표준 json)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def execute_rows(query):
+    """PostgREST 쿼리를 실행하고 행 목록을 반환합니다.
+
+    빠른 경로를 쓸 수 없는 쿼리(미러, 가짜 백엔드, orjson 미설치, send_with_retry가 없는 postgrest)는
+    query.execute().data로 처리합니다.
+    """
+    request = getattr(query, 'request', None)
+    if not FAST_DECODE or request is None or not hasattr(request, 'send'):
+        return query.execute().data
+
+    # postgrest-py의 execute()와 같은 요청/재시도, 디코딩만 orjson으로
+    response = send_with_retry(request)
+    if not response.is_success:
+        try:
+            error = loads(response.content)
+        except ValueError:
+            error = None
+        if not isinstance(error, dict):
+            error = {'message': response.text, 'code': str(response.status_code)}
+        raise APIError(error)
+    if not response.content:
+        return []
+    return loads(response.content)
+
+
+def rows_to_frame(rows, columns=None):
+    """dict 행 목록을 컬럼 단위로 DataFrame으로 만듭니다 (columns가 없으면 첫 행의 키)."""
+    if columns is None:
+        columns = list(rows[0]) if rows else []
+    return pd.DataFrame.from_records(rows, columns=list(columns))
@@ -0,0 +1,114 @@
+"""
+Supabase 상태 확인 (백그라운드 probe + 캐시된 상태)
+
+화면 코드가 세션마다 test_connection()으로 왕복하지 않도록, 프로세스 전역 HealthProbe가
+HEALTH_INTERVAL_SECONDS마다 백그라운드 스레드에서 상태를 확인하고 결과를 보관합니다.
+화면 코드는 status()/is_down()으로 보관된 상태만 읽으므로 네트워크 I/O가 없습니다.
+
+    - 최근 interval 안에 실제 조회가 성공했으면 probe 조회를 건너뜁니다 (조회 성공 = 정상).
+    - 그렇지 않으면 supabase_client.ping()(한 행 조회)의 성공 여부와 마지막 성공 지연 시간을 기록합니다.
+    - 마지막 확인이 HEALTH_TTL_SECONDS보다 오래되었으면 상태를 알 수 없음(unknown)으로 봅니다.
+"""
+import os
+import threading
+import time
+
+from supabase_client import supabase_client
+
+HEALTH_INTERVAL_SECONDS = float(os.environ.get("SUPABASE_HEALTH_INTERVAL_SECONDS", "30"))
+HEALTH_TTL_SECONDS = float(os.environ.get("SUPABASE_HEALTH_TTL_SECONDS", "90"))
+
+HEALTH_OK = 'ok'
+HEALTH_DOWN = 'down'
+HEALTH_UNKNOWN = 'unknown'
+
+
+class HealthProbe:
+    """Supabase 상태를 주기적으로 확인해 보관하는 probe (프로세스 전역, 스레드 안전)"""
+
+    def __init__(self, client, interval_seconds=HEALTH_INTERVAL_SECONDS, ttl_seconds=HEALTH_TTL_SECONDS):
+        self.client = client
+        self.interval_seconds = interval_seconds
+        self.ttl_seconds = ttl_seconds
+        self.checked_at = None
+        self.latency_ms = None
+        self.probes = 0
+        self.skipped = 0
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """probe 스레드를 한 번만 시작합니다."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._loop, name='supabase-health', daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while True:
+            # 첫 화면의 조회와 겹치지 않도록 첫 probe도 interval 뒤에 실행
+            time.sleep(self.interval_seconds)
+            try:
+                self.check()
+            except Exception as e:
+                print(f"⚠️ Supabase 상태 확인 실패: {e}")
+
+    def check(self):
+        """상태를 한 번 확인합니다. 최근 조회가 성공했으면 네트워크 조회 없이 정상으로 기록합니다."""
+        last_success = self.client.last_success_at
+        if last_success is not None and time.time() - last_success < self.interval_seconds:
+            with self._lock:
+                self.checked_at = time.time()
+                self.skipped += 1
+            return
+        started = time.perf_counter()
+        try:
+            self.client.ping()
+            latency_ms = (time.perf_counter() - started) * 1000
+        except Exception:
+            # 실패는 client.last_failure_at/last_error에 기록됨
+            latency_ms = None
+        with self._lock:
+            self.checked_at = time.time()
+            if latency_ms is not None:
+                self.latency_ms = latency_ms
+            self.probes += 1
+
+    def state(self):
+        """보관된 상태: ok / down / unknown (네트워크 I/O 없음)"""
+        now = time.time()
+        last_success, last_failure = self.client.last_success_at, self.client.last_failure_at
+        latest = max(t for t in (last_success, last_failure, self.checked_at, 0) if t is not None)
+        if not latest or now - latest > self.ttl_seconds:
+            return HEALTH_UNKNOWN
+        if last_failure is not None and (last_success is None or last_failure > last_success):
+            return HEALTH_DOWN
+        return HEALTH_OK if last_success is not None else HEALTH_UNKNOWN
+
+    def is_down(self):
+        """Supabase가 응답하지 않는 것으로 확인되었는지 여부 (unknown이면 False)"""
+        return self.client.is_degraded() or self.state() == HEALTH_DOWN
+
+    def status(self):
+        """관리자 패널용 상태 요약"""
+        def seconds_ago(moment):
+            return None if moment is None else round(time.time() - moment, 1)
+
+        with self._lock:
+            checked_at, latency_ms, probes, skipped = self.checked_at, self.latency_ms, self.probes, self.skipped
+        return {
+            'state': self.state(),
+            'degraded': self.client.is_degraded(),
+            'last_success_seconds_ago': seconds_ago(self.client.last_success_at),
+            'last_failure_seconds_ago': seconds_ago(self.client.last_failure_at),
+            'last_error': self.client.last_error,
+            'latency_ms': None if latency_ms is None else round(latency_ms, 1),
+            'checked_seconds_ago': seconds_ago(checked_at),
+            'probes': probes,
+            'skipped': skipped,
+        }
+
+
+# 모든 세션이 공유하는 Supabase 상태
+health_probe = HealthProbe(supabase_client)
@@ -0,0 +1,265 @@
+"""
+SupabaseClient 메서드별 계측 (프로세스 내 히스토그램/카운터)
+
+메서드마다 호출 수, 소요 시간, 반환 행 수, 수신 바이트, 캐시 적중/미스, 오류 수를 모읍니다.
+    - snapshot(): 관리자 패널용 요약
+    - to_prometheus(): Prometheus 텍스트 형식
+    - start_exporter(): SUPABASE_METRICS_PATH 파일에 주기적으로 기록 (node_exporter textfile collector 용)
+"""
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+
+METRICS_PATH = os.environ.get("SUPABASE_METRICS_PATH") or None
+METRICS_INTERVAL_SECONDS = float(os.environ.get("SUPABASE_METRICS_INTERVAL_SECONDS", "15"))
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+ROW_BUCKETS = (0, 1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+BYTE_BUCKETS = (0, 1_024, 10_240, 102_400, 1_048_576, 10_485_760, 104_857_600)
+
+_PREFIX = 'supabase_client'
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus histogram과 같은 le 버킷)"""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q):
+        """버킷 상한으로 근사한 분위수 (관측값이 없으면 None)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return float('inf')
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            yield bound, total
+
+
+class MethodStats:
+    __slots__ = ('calls', 'errors', 'cache_hits', 'cache_misses', 'bytes', 'latency', 'rows', 'payload')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.bytes = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.rows = Histogram(ROW_BUCKETS)
+        self.payload = Histogram(BYTE_BUCKETS)
+
+
+class _Call:
+    """진행 중인 메서드 호출 하나에 모이는 값"""
+    __slots__ = ('cache_hit', 'errors', 'bytes')
+
+    def __init__(self):
+        self.cache_hit = None
+        self.errors = 0
+        self.bytes = 0
+
+
+class MetricsRegistry:
+    """메서드별 통계 저장소 (스레드 안전)"""
+
+    def __init__(self):
+        self._methods = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._exporter = None
+
+    # --- 호출 중 기록 ---
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def mark_cache(self, hit):
+        """현재 호출의 캐시 적중 여부 (중첩 호출은 가장 안쪽 호출에 기록)"""
+        stack = self._stack()
+        if stack and stack[-1].cache_hit is None:
+            stack[-1].cache_hit = hit
+
+    def mark_error(self):
+        for call in self._stack():
+            call.errors += 1
+
+    def add_bytes(self, count):
+        """수신한 응답 바이트를 현재 스레드에서 진행 중인 모든 호출에 더합니다."""
+        for call in self._stack():
+            call.bytes += count
+
+    def instrument(self, name=None):
+        """메서드 호출을 계측하는 데코레이터"""
+        def decorator(func):
+            method = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                stack = self._stack()
+                call = _Call()
+                stack.append(call)
+                result = None
+                started = time.perf_counter()
+                try:
+                    result = func(*args, **kwargs)
+                    return result
+                except Exception:
+                    call.errors += 1
+                    raise
+                finally:
+                    elapsed = time.perf_counter() - started
+                    stack.pop()
+                    self.observe(method, elapsed, _row_count(result), call)
+            return wrapper
+        return decorator
+
+    def observe(self, method, seconds, rows, call):
+        with self._lock:
+            stats = self._methods.get(method)
+            if stats is None:
+                stats = self._methods[method] = MethodStats()
+            stats.calls += 1
+            stats.errors += call.errors
+            if call.cache_hit is True:
+                stats.cache_hits += 1
+            elif call.cache_hit is False:
+                stats.cache_misses += 1
+            stats.bytes += call.bytes
+            stats.latency.observe(seconds)
+            stats.rows.observe(rows)
+            stats.payload.observe(call.bytes)
+
+    # --- 조회 ---
+
+    def snapshot(self):
+        """메서드별 요약 (관리자 패널 표시용)"""
+        with self._lock:
+            rows = []
+            for method, stats in sorted(self._methods.items()):
+                latency = stats.latency
+                rows.append({
+                    'method': method,
+                    'calls': stats.calls,
+                    'errors': stats.errors,
+                    'cache_hits': stats.cache_hits,
+                    'cache_misses': stats.cache_misses,
+                    'avg_ms': round(latency.sum / latency.count * 1000, 2) if latency.count else None,
+                    'p50_ms<=': _ms(latency.quantile(0.5)),
+                    'p99_ms<=': _ms(latency.quantile(0.99)),
+                    'avg_rows': round(stats.rows.sum / stats.rows.count, 1) if stats.rows.count else None,
+                    'bytes': stats.bytes,
+                })
+            return rows
+
+    def reset(self):
+        with self._lock:
+            self._methods.clear()
+
+    def to_prometheus(self):
+        """Prometheus 텍스트 형식 (exposition format 0.0.4)"""
+        lines = []
+        with self._lock:
+            items = sorted(self._methods.items())
+            for metric, help_text, attr in (
+                ('calls_total', 'SupabaseClient 메서드 호출 수', 'calls'),
+                ('errors_total', '조회 실패 수', 'errors'),
+            ):
+                lines.append(f'# HELP {_PREFIX}_{metric} {help_text}')
+                lines.append(f'# TYPE {_PREFIX}_{metric} counter')
+                for method, stats in items:
+                    lines.append(f'{_PREFIX}_{metric}{{method="{method}"}} {getattr(stats, attr)}')
+            lines.append(f'# HELP {_PREFIX}_cache_requests_total 캐시 적중/미스 수')
+            lines.append(f'# TYPE {_PREFIX}_cache_requests_total counter')
+            for method, stats in items:
+                lines.append(f'{_PREFIX}_cache_requests_total{{method="{method}",result="hit"}} {stats.cache_hits}')
+                lines.append(f'{_PREFIX}_cache_requests_total{{method="{method}",result="miss"}} {stats.cache_misses}')
+            for metric, help_text, attr in (
+                ('duration_seconds', '메서드 소요 시간', 'latency'),
+                ('rows', '반환 행 수', 'rows'),
+                ('response_bytes', '호출당 응답 수신 바이트', 'payload'),
+            ):
+                lines.append(f'# HELP {_PREFIX}_{metric} {help_text}')
+                lines.append(f'# TYPE {_PREFIX}_{metric} histogram')
+                for method, stats in items:
+                    histogram = getattr(stats, attr)
+                    for bound, count in histogram.cumulative():
+                        le = '+Inf' if bound == float('inf') else f'{bound:g}'
+                        lines.append(f'{_PREFIX}_{metric}_bucket{{method="{method}",le="{le}"}} {count}')
+                    lines.append(f'{_PREFIX}_{metric}_sum{{method="{method}"}} {histogram.sum:g}')
+                    lines.append(f'{_PREFIX}_{metric}_count{{method="{method}"}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path=METRICS_PATH):
+        """Prometheus 텍스트를 파일에 원자적으로 기록합니다."""
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+
+    def start_exporter(self, path=METRICS_PATH, interval_seconds=METRICS_INTERVAL_SECONDS):
+        """path가 지정되어 있으면 interval_seconds마다 파일로 내보내는 스레드를 한 번만 시작합니다."""
+        if not path:
+            return
+        with self._lock:
+            if self._exporter is not None:
+                return
+            self._exporter = threading.Thread(
+                target=self._export_loop, args=(path, interval_seconds), name='supabase-metrics', daemon=True
+            )
+        self._exporter.start()
+
+    def _export_loop(self, path, interval_seconds):
+        while True:
+            try:
+                self.write_prometheus(path)
+            except OSError as e:
+                print(f"⚠️ 메트릭 파일 기록 실패: {e}")
+            time.sleep(interval_seconds)
+
+
+def _ms(seconds):
+    if seconds is None:
+        return None
+    return '+Inf' if seconds == float('inf') else round(seconds * 1000, 1)
+
+
+def _row_count(result):
+    """반환값의 행 수 (월별 건수 dict는 건수 합계)"""
+    if result is None or isinstance(result, bool):
+        return 0
+    if isinstance(result, dict):
+        return sum(value for value in result.values() if isinstance(value, int))
+    counts = getattr(result, 'counts', None)
+    if isinstance(counts, dict):
+        return sum(counts.values())
+    try:
+        return len(result)
+    except TypeError:
+        return 0
+
+
+# 모든 SupabaseClient 인스턴스가 공유하는 계측 저장소
+metrics = MetricsRegistry()
@@ -0,0 +1,307 @@
+"""
+Supabase 테이블 로컬 미러 (SQLite) 및 증분 동기화
+
+처음에는 테이블 전체를 복사하고, 이후에는 워터마크 컬럼(updated_at, 없으면 id)보다
+큰 행만 가져와 upsert합니다. 고유 키(id)가 없는 테이블은 매번 전체를 다시 복사합니다.
+원본에서 삭제된 행은 증분 동기화로 반영되지 않으므로 가끔 --full로 다시 복사합니다.
+
+사용법:
+    python mirror_sync.py                 # 한 번 동기화
+    python mirror_sync.py --interval 300  # 5분마다 동기화
+    python mirror_sync.py --full          # 동기화 상태를 지우고 전체 복사
+
+SupabaseClient는 SUPABASE_MIRROR_PATH가 설정되어 있으면 동기화된 테이블을 미러에서 읽습니다.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import NamedTuple
+
+MIRROR_PATH = os.environ.get("SUPABASE_MIRROR_PATH") or None
+
+
+class TableSpec(NamedTuple):
+    """미러링할 테이블과 행 식별/증분 기준 컬럼"""
+    name: str
+    key: str = 'id'
+    watermark_candidates: tuple = ('updated_at', 'id')
+
+
+# github 앱(alpha_companies_final/recommend_final)과 alpha 앱(alpha_companies3/recommend_5) 테이블
+MIRROR_TABLES = (
+    TableSpec('alpha_companies_final'),
+    TableSpec('recommend_final'),
+    TableSpec('alpha_companies3'),
+    TableSpec('recommend_5'),
+)
+
+_ROW_KEY = '_row_key'
+_STAGING_SUFFIX = '__staging'
+_SQL_OPERATORS = {'eq': '=', 'neq': '!=', 'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<='}
+
+
+def _quote(identifier):
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _to_sqlite(value):
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class LocalMirror:
+    """Supabase 테이블을 그대로 복사해 두는 SQLite 파일 (스레드 안전)"""
+
+    def __init__(self, path=MIRROR_PATH):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                'create table if not exists _sync_state ('
+                'table_name text primary key, key_column text, watermark_column text, '
+                'watermark text, synced_at real, row_count integer)'
+            )
+
+    # --- 동기화 상태 ---
+
+    def sync_state(self, table):
+        """테이블의 마지막 동기화 상태 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute('select * from _sync_state where table_name = ?', (table,)).fetchone()
+        return dict(row) if row else None
+
+    def has_table(self, table):
+        """한 번 이상 동기화된 테이블인지 여부"""
+        return self.sync_state(table) is not None
+
+    def save_sync_state(self, table, key_column, watermark_column, watermark):
+        with self._lock, self._conn:
+            self._write_sync_state(table, key_column, watermark_column, watermark)
+
+    def _write_sync_state(self, table, key_column, watermark_column, watermark):
+        row_count = self._conn.execute(f'select count(*) from {_quote(table)}').fetchone()[0]
+        self._conn.execute(
+            'insert or replace into _sync_state values (?, ?, ?, ?, ?, ?)',
+            (table, key_column, watermark_column, watermark, time.time(), row_count),
+        )
+
+    # --- 쓰기 ---
+
+    def _ensure_columns(self, table, columns):
+        self._conn.execute(f'create table if not exists {_quote(table)} ({_quote(_ROW_KEY)} text primary key)')
+        existing = {row[1] for row in self._conn.execute(f'pragma table_info({_quote(table)})')}
+        for column in columns:
+            if column not in existing:
+                self._conn.execute(f'alter table {_quote(table)} add column {_quote(column)}')
+
+    def upsert(self, table, rows, key=None):
+        """행을 추가/갱신합니다. key가 없으면 행 내용의 해시를 식별자로 사용합니다."""
+        if not rows:
+            return 0
+        columns = sorted({column for row in rows for column in row})
+        placeholders = ', '.join('?' for _ in range(len(columns) + 1))
+        sql = (
+            f'insert or replace into {_quote(table)} '
+            f'({", ".join(_quote(c) for c in [_ROW_KEY] + columns)}) values ({placeholders})'
+        )
+        values = []
+        for row in rows:
+            if key:
+                row_key = str(row[key])
+            else:
+                row_key = hashlib.sha1(json.dumps(row, sort_keys=True, ensure_ascii=False, default=str).encode()).hexdigest()
+            values.append([row_key] + [_to_sqlite(row.get(column)) for column in columns])
+        with self._lock, self._conn:
+            self._ensure_columns(table, columns)
+            self._conn.executemany(sql, values)
+        return len(rows)
+
+    def truncate(self, table):
+        with self._lock, self._conn:
+            self._conn.execute(f'drop table if exists {_quote(table)}')
+
+    def replace_table(self, table, staging, key_column, watermark_column, watermark):
+        """staging에 복사해 둔 테이블로 table을 바꾸고 동기화 상태를 한 트랜잭션에서 저장합니다.
+
+        읽는 쪽(다른 프로세스 포함)은 이전 테이블 또는 새 테이블 전체만 보고, 비어 있거나 없는 테이블은 보지 않습니다.
+        """
+        with self._lock, self._conn:
+            self._conn.execute('begin')
+            # 복사한 행이 없으면 빈 테이블로 교체
+            self._conn.execute(f'create table if not exists {_quote(staging)} ({_quote(_ROW_KEY)} text primary key)')
+            self._conn.execute(f'drop table if exists {_quote(table)}')
+            self._conn.execute(f'alter table {_quote(staging)} rename to {_quote(table)}')
+            self._write_sync_state(table, key_column, watermark_column, watermark)
+
+    def reset(self, table):
+        """테이블과 동기화 상태를 지워 다음 동기화 때 전체 복사하도록 합니다."""
+        self.truncate(table)
+        with self._lock, self._conn:
+            self._conn.execute('delete from _sync_state where table_name = ?', (table,))
+
+    # --- 읽기 ---
+
+    def iter_rows(self, table, columns=('*',), filters=(), page_size=1000):
+        """SupabaseClient.iter_rows와 같은 형식으로 미러에서 행 배치를 반환합니다.
+
+        columns는 PostgREST select 인자(큰따옴표 포함 가능), filters는 (연산자, 컬럼, 값) 튜플입니다.
+        """
+        names = [column.strip('"') for column in columns]
+        select = '*' if '*' in names else ', '.join(_quote(name) for name in names)
+        where, params = [], []
+        for op, column, value in filters:
+            if op == 'in_':
+                where.append(f'{_quote(column)} in ({", ".join("?" for _ in value)})')
+                params.extend(value)
+            elif op == 'is_' and value in (None, 'null'):
+                where.append(f'{_quote(column)} is null')
+            elif op in _SQL_OPERATORS:
+                where.append(f'{_quote(column)} {_SQL_OPERATORS[op]} ?')
+                params.append(_to_sqlite(value))
+            else:
+                raise ValueError(f'미러에서 지원하지 않는 조건입니다: {op}')
+        sql = f'select {select} from {_quote(table)}'
+        if where:
+            sql += ' where ' + ' and '.join(where)
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+        try:
+            while True:
+                # 결과 전체를 메모리에 올리지 않도록 page_size씩 읽음 (다른 스레드가 기다리지 않도록 배치마다 잠금)
+                with self._lock:
+                    rows = cursor.fetchmany(page_size)
+                if not rows:
+                    return
+                batch = [dict(row) for row in rows]
+                for row in batch:
+                    row.pop(_ROW_KEY, None)
+                yield batch
+        finally:
+            with self._lock:
+                cursor.close()
+
+    def select(self, table, columns=('*',), filters=()):
+        """조건에 맞는 행 전체를 리스트로 반환합니다."""
+        return [row for batch in self.iter_rows(table, columns, filters) for row in batch]
+
+
+class MirrorSync:
+    """Supabase → LocalMirror 증분 동기화"""
+
+    def __init__(self, client, mirror, tables=MIRROR_TABLES, page_size=1000):
+        self.client = client
+        self.mirror = mirror
+        self.tables = tables
+        self.page_size = page_size
+
+    def sync_table(self, spec: TableSpec):
+        """테이블 하나를 동기화하고 가져온 행 수를 반환합니다."""
+        state = self.mirror.sync_state(spec.name)
+        if state and not state['key_column']:
+            # 고유 키가 없는 테이블은 매번 전체 복사
+            return self._copy_table(spec, None)
+        if not (state and state['watermark_column']):
+            return self._full_sync(spec)
+        key, watermark_column, watermark = state['key_column'], state['watermark_column'], state['watermark']
+        filters = [('gt', watermark_column, watermark)] if watermark is not None else []
+        moved = 0
+        for batch in self.client.iter_rows(spec.name, filters=filters, page_size=self.page_size, key=key):
+            moved += self.mirror.upsert(spec.name, batch, key)
+            watermark = _max_watermark(watermark, batch, watermark_column)
+        self.mirror.save_sync_state(spec.name, key, watermark_column, watermark)
+        return moved
+
+    def _full_sync(self, spec: TableSpec):
+        """테이블을 처음 전체 복사합니다. 고유 키 컬럼이 없으면 range 페이지네이션으로 복사합니다."""
+        from supabase_client import is_api_error, UNDEFINED_COLUMN_CODES
+        try:
+            return self._copy_table(spec, spec.key)
+        except Exception as e:
+            # 고유 키 컬럼이 없을 때만 range 페이지네이션으로 전환 (네트워크 오류 등은 다음 동기화에서 다시 시도)
+            if not is_api_error(e, UNDEFINED_COLUMN_CODES):
+                raise
+            print(f"⚠️ {spec.name}: '{spec.key}' 컬럼이 없어 전체 복사로 전환합니다: {e}")
+            return self._copy_table(spec, None)
+
+    def _table_columns(self, spec: TableSpec):
+        """첫 행에서 테이블의 컬럼 목록을 PostgREST select 인자로 가져옵니다 (빈 테이블이면 빈 튜플)."""
+        first = next(self.client.iter_rows(spec.name, page_size=1, key=None), [])
+        if not first:
+            return ()
+        return tuple(f'"{column}"' if ' ' in column else column for column in first[0])
+
+    def _copy_table(self, spec: TableSpec, key):
+        """테이블 전체를 staging 테이블에 복사한 뒤 한 번에 교체합니다 (복사 중에도 이전 미러를 읽을 수 있음)."""
+        staging = spec.name + _STAGING_SUFFIX
+        self.mirror.truncate(staging)
+        watermark_column = watermark = None
+        moved = 0
+        # 고유 키가 없으면 range 페이지가 모든 컬럼으로 정렬되도록 컬럼을 지정 ('*'이면 페이지 순서가 보장되지 않음)
+        columns = ('*',) if key else self._table_columns(spec)
+        batches = self.client.iter_rows(spec.name, columns, page_size=self.page_size, key=key) if columns else ()
+        for batch in batches:
+            if moved == 0 and key:
+                watermark_column = next((c for c in spec.watermark_candidates if c in batch[0]), None)
+            moved += self.mirror.upsert(staging, batch, key)
+            if watermark_column:
+                watermark = _max_watermark(watermark, batch, watermark_column)
+        self.mirror.replace_table(spec.name, staging, key, watermark_column, watermark)
+        return moved
+
+    def sync_all(self):
+        """모든 테이블을 동기화하고 테이블별 가져온 행 수를 반환합니다."""
+        results = {}
+        for spec in self.tables:
+            try:
+                results[spec.name] = self.sync_table(spec)
+                print(f"🔄 {spec.name}: {results[spec.name]}개 행 동기화")
+            except Exception as e:
+                print(f"❌ {spec.name} 동기화 실패: {e}")
+                results[spec.name] = None
+        return results
+
+
+def _watermark_sort_key(value):
+    """숫자(id) 워터마크는 숫자로, 그 외(updated_at)는 문자열로 비교합니다."""
+    try:
+        return (0, float(value), '')
+    except (TypeError, ValueError):
+        return (1, 0, str(value))
+
+
+def _max_watermark(current, rows, column):
+    values = [row[column] for row in rows if row.get(column) is not None]
+    if current is not None:
+        values.append(current)
+    return str(max(values, key=_watermark_sort_key)) if values else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Supabase 테이블을 로컬 SQLite 미러로 동기화합니다.')
+    parser.add_argument('--path', default=MIRROR_PATH or 'supabase_mirror.sqlite3', help='미러 SQLite 파일 경로')
+    parser.add_argument('--interval', type=float, default=0, help='주기적 동기화 간격(초). 0이면 한 번만 실행')
+    parser.add_argument('--full', action='store_true', help='동기화 상태를 지우고 전체 테이블을 다시 복사')
+    args = parser.parse_args()
+
+    from supabase_client import SupabaseClient
+    mirror = LocalMirror(args.path)
+    if args.full:
+        for spec in MIRROR_TABLES:
+            mirror.reset(spec.name)
+    sync = MirrorSync(SupabaseClient(mirror_path=None), mirror)
+    while True:
+        sync.sync_all()
+        if not args.interval:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == '__main__':
+    main()
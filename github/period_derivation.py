@@ -0,0 +1,144 @@
+"""
+recommend_final '사업 연도' → start_date / end_date / is_always_open 파생 컬럼 배치 작업
+
+period_parsed_at이 비어 있는 행(새로 들어왔거나 '사업 연도'가 바뀐 행, sql/003·004 트리거가 SQL로 먼저 채움)만
+id 순서로 읽어 period_parser 규칙으로 한 번 파싱하고, 배치마다 apply_recommend_periods RPC로 한 번에 반영합니다.
+RPC가 없으면 같은 결과를 가진 행끼리 묶어 update ... in_('id', ...)로 반영합니다.
+
+사용법:
+    python period_derivation.py                  # 처리되지 않은 행만 한 번 처리
+    python period_derivation.py --interval 300   # 5분마다 처리
+    python period_derivation.py --all            # 파서 규칙이 바뀌었을 때 전체 다시 파싱
+
+쓰기 권한이 필요하므로 SUPABASE_SERVICE_ROLE_KEY가 있어야 합니다 (anon 키로는 RLS 때문에 갱신되지 않음).
+"""
+import argparse
+import sys
+import time
+from collections import defaultdict
+
+import pandas as pd
+
+from period_parser import parse_period_series
+from supabase_client import is_api_error, UNDEFINED_FUNCTION_CODES
+
+APPLY_PERIODS_RPC = 'apply_recommend_periods'
+BATCH_SIZE = 1000
+
+
+def _iso_date(value):
+    return None if pd.isna(value) else value.date().isoformat()
+
+
+def derive_periods(rows):
+    """[{'id', '사업 연도'}, ...] 배치를 RPC 인자 형식의 파싱 결과 목록으로 변환합니다."""
+    if not rows:
+        return []
+    frame = pd.DataFrame(rows, columns=['id', '사업 연도'])
+    derived = parse_period_series(frame['사업 연도'])
+    return [
+        {
+            'id': row_id,
+            'start_date': _iso_date(start),
+            'end_date': _iso_date(end),
+            'is_always_open': bool(always_open),
+        }
+        for row_id, start, end, always_open in zip(
+            frame['id'].tolist(), derived['start_date'], derived['end_date'], derived['is_always_open']
+        )
+    ]
+
+
+class PeriodDerivation:
+    """recommend_final 파생 날짜 컬럼 증분 채우기"""
+
+    def __init__(self, client, batch_size=BATCH_SIZE):
+        # client: SupabaseClient (iter_rows와 쓰기 권한이 있는 _client 사용)
+        self.client = client
+        self.batch_size = batch_size
+        self.use_rpc = True
+
+    def run(self, reparse=False):
+        """처리할 행을 모두 파싱해 반영하고 처리한 행 수를 반환합니다."""
+        filters = [] if reparse else [('is_', 'period_parsed_at', 'null')]
+        processed = 0
+        # 반영된 행은 필터에서 빠지지만 id 키셋으로 읽으므로 페이지가 밀리지 않습니다.
+        for batch in self.client.iter_rows(
+            'recommend_final', ('id', '"사업 연도"'), filters, page_size=self.batch_size, key='id'
+        ):
+            processed += self.apply(derive_periods(batch))
+            print(f"🗓️ recommend_final: {processed}개 행 파싱")
+        return processed
+
+    def apply(self, derived):
+        """파싱 결과 배치를 반영하고 실제로 갱신된 행 수를 반환합니다."""
+        if not derived:
+            return 0
+        if self.use_rpc:
+            try:
+                updated = int(self.client._client.rpc(APPLY_PERIODS_RPC, {'p_rows': derived}).execute().data)
+                _warn_if_short(updated, len(derived))
+                return updated
+            except Exception as e:
+                # sql/003 마이그레이션 전(RPC 함수 없음)일 때만 이후로는 묶음 update 사용 (그 외 오류는 그대로 전달)
+                if not is_api_error(e, UNDEFINED_FUNCTION_CODES):
+                    raise
+                print(f"⚠️ {APPLY_PERIODS_RPC} RPC가 없어 묶음 update로 전환합니다: {e}")
+                self.use_rpc = False
+        return self._apply_grouped(derived)
+
+    def _apply_grouped(self, derived):
+        # 같은 (시작일, 종료일, 상시 여부)를 가진 행은 update 한 번으로 반영
+        groups = defaultdict(list)
+        for row in derived:
+            groups[(row['start_date'], row['end_date'], row['is_always_open'])].append(row['id'])
+        parsed_at = pd.Timestamp.now(tz='UTC').isoformat()
+        updated = 0
+        for (start, end, always_open), ids in groups.items():
+            values = {'start_date': start, 'end_date': end, 'is_always_open': always_open, 'period_parsed_at': parsed_at}
+            # update는 갱신된 행을 돌려주므로 그 수로 실제 반영 여부를 확인
+            response = self.client._client.table('recommend_final').update(values).in_('id', ids).execute()
+            updated += len(response.data or [])
+        _warn_if_short(updated, len(derived))
+        return updated
+
+
+def _warn_if_short(updated, expected):
+    """갱신된 행이 요청보다 적으면 (RLS로 막혔거나 행이 삭제된 경우) 경고를 출력합니다."""
+    if updated < expected:
+        print(f"⚠️ recommend_final: {expected}개 중 {updated}개 행만 갱신되었습니다 (service_role 키와 RLS 정책을 확인하세요).")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="recommend_final '사업 연도'를 파싱해 날짜 컬럼을 채웁니다.")
+    parser.add_argument('--interval', type=float, default=0, help='주기적 실행 간격(초). 0이면 한 번만 실행')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help='배치당 행 수')
+    parser.add_argument('--all', action='store_true', help='이미 처리된 행까지 전체 다시 파싱')
+    args = parser.parse_args()
+
+    from supabase import create_client
+    from supabase_client import SupabaseClient, SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY
+
+    if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
+        # anon 키로는 RLS 때문에 update가 0행으로 끝나 아무것도 갱신되지 않으므로 실행하지 않음
+        print("❌ SUPABASE_URL과 SUPABASE_SERVICE_ROLE_KEY 환경변수가 필요합니다.")
+        sys.exit(1)
+    client = SupabaseClient(mirror_path=None)
+    client._client = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
+    job = PeriodDerivation(client, args.batch_size)
+    reparse = args.all
+    while True:
+        try:
+            count = job.run(reparse=reparse)
+            print(f"✅ recommend_final 날짜 컬럼 {count}개 행 갱신")
+        except Exception as e:
+            print(f"❌ 날짜 컬럼 갱신 실패: {e}")
+        if not args.interval:
+            break
+        # --all은 첫 실행에만 적용하고 이후에는 새 행만 처리
+        reparse = False
+        time.sleep(args.interval)
+
+
+if __name__ == '__main__':
+    main()
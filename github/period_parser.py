@@ -0,0 +1,161 @@
+"""
+'사업 연도' / application_period 신청기간 문자열 파서
+
+관측된 형식:
+    - 'yyyymmdd ~ yyyymmdd', '"yyyymmdd" ~ "yyyymmdd"', 'yyyymmdd'
+    - 'yyyy-mm-dd', 'yyyy.mm.dd', 'yyyy/mm/dd' (범위 포함)
+    - 'mm/dd/yyyy', 'dd/mm/yyyy'
+    - 'yyyy년 m월', 'yyyy년 m월 d일'
+    - '상시', '예산 소진시까지' (상시 접수)
+
+단건 파싱은 parse_period, 대량 파싱은 parse_period_series(pandas 벡터 연산)를 사용합니다.
+"""
+import re
+from datetime import date, datetime
+from typing import NamedTuple, Optional
+
+import pandas as pd
+
+# 상시 접수 공고를 나타내는 표현
+ALWAYS_OPEN_KEYWORDS = ('상시', '예산 소진시까지')
+
+# 날짜 하나를 나타내는 토큰 (앞에 있을수록 우선)
+DATE_TOKEN_PATTERN = (
+    r'(?<!\d)(?P<ymd>\d{8})(?!\d)'  # yyyymmdd
+    r'|(?<!\d)(?P<y>\d{4})\s*[.\-/년]\s*(?P<m>\d{1,2})(?!\d)(?:\s*[.\-/월]\s*(?:(?P<d>\d{1,2})(?!\d))?)?'  # yyyy.mm.dd / yyyy년 m월
+    r'|(?<!\d)(?P<m2>\d{1,2})/(?P<d2>\d{1,2})/(?P<y2>\d{4})(?!\d)'  # mm/dd/yyyy (월이 12보다 크면 dd/mm/yyyy)
+)
+_DATE_TOKEN_RE = re.compile(DATE_TOKEN_PATTERN)
+_ALWAYS_OPEN_RE = re.compile('|'.join(re.escape(keyword) for keyword in ALWAYS_OPEN_KEYWORDS))
+_RANGE_SEPARATOR = '~'
+# 가장 흔한 'yyyymmdd ~ yyyymmdd' / '"yyyymmdd" ~ "yyyymmdd"' / 'yyyymmdd' 형식 (parse_period_series의 빠른 경로)
+_COMPACT_PERIOD_PATTERN = r'^\s*"?([0-9]{8})"?\s*(?:~\s*"?([0-9]{8})"?\s*)?$'
+
+
+class Period(NamedTuple):
+    """신청기간 파싱 결과 (날짜가 없으면 None)"""
+    start: Optional[date]
+    end: Optional[date]
+    is_always_open: bool
+
+
+EMPTY_PERIOD = Period(None, None, False)
+
+
+def _to_date(year, month, day):
+    try:
+        return date(int(year), int(month), int(day))
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_date(text) -> Optional[date]:
+    """문자열에서 처음 나오는 날짜를 반환합니다. 일이 없으면 1일로 봅니다."""
+    if not text:
+        return None
+    match = _DATE_TOKEN_RE.search(text)
+    if not match:
+        return None
+    groups = match.groupdict()
+    if groups['ymd']:
+        value = groups['ymd']
+        return _to_date(value[:4], value[4:6], value[6:])
+    if groups['y']:
+        return _to_date(groups['y'], groups['m'], groups['d'] or 1)
+    month, day = int(groups['m2']), int(groups['d2'])
+    if month > 12:
+        month, day = day, month
+    return _to_date(groups['y2'], month, day)
+
+
+def parse_period(value) -> Period:
+    """신청기간 문자열 하나를 (시작일, 종료일, 상시 여부)로 파싱합니다.
+
+    범위가 아닌 날짜 하나만 있으면 시작일과 종료일이 같습니다.
+    """
+    if value is None or (isinstance(value, float) and value != value):
+        return EMPTY_PERIOD
+    text = str(value)
+    is_always_open = _ALWAYS_OPEN_RE.search(text) is not None
+    left, separator, right = text.partition(_RANGE_SEPARATOR)
+    start = parse_date(left)
+    end = parse_date(right) if separator else start
+    return Period(start, end, is_always_open)
+
+
+def start_month(value) -> Optional[int]:
+    """신청기간의 시작 월 (1~12). 시작일을 알 수 없으면 None."""
+    start = parse_period(value).start
+    return start.month if start else None
+
+
+def days_until_end(value, today: date = None) -> Optional[int]:
+    """종료일까지 남은 일수 (지났으면 음수). 종료일을 알 수 없으면 None."""
+    end = parse_period(value).end
+    if end is None:
+        return None
+    if today is None:
+        today = datetime.now().date()
+    return (end - today).days
+
+
+def _to_number(series: pd.Series) -> pd.Series:
+    return pd.to_numeric(series, errors='coerce').astype('float64')
+
+
+def _extract_dates(series: pd.Series) -> pd.Series:
+    """문자열 Series에서 처음 나오는 날짜를 datetime64 Series로 추출합니다."""
+    parts = series.str.extract(DATE_TOKEN_PATTERN)
+    ymd = parts['ymd']
+    month_first = _to_number(parts['m2'])
+    day_first = _to_number(parts['d2'])
+    swap = month_first > 12
+    year = _to_number(ymd.str[:4]) \
+        .fillna(_to_number(parts['y'])) \
+        .fillna(_to_number(parts['y2']))
+    month = _to_number(ymd.str[4:6]) \
+        .fillna(_to_number(parts['m'])) \
+        .fillna(month_first.where(~swap, day_first))
+    # yyyy년 m월처럼 일이 없으면 1일
+    day_or_first = _to_number(parts['d']).fillna(1).where(parts['y'].notna())
+    day = _to_number(ymd.str[6:8]) \
+        .fillna(day_or_first) \
+        .fillna(day_first.where(~swap, month_first))
+    return pd.to_datetime(pd.DataFrame({'year': year, 'month': month, 'day': day}), errors='coerce')
+
+
+def parse_period_series(series: pd.Series) -> pd.DataFrame:
+    """신청기간 Series를 start_date / end_date(datetime64) / is_always_open 컬럼의 DataFrame으로 변환합니다.
+
+    parse_period와 같은 규칙을 pandas 문자열 연산으로 한 번에 적용합니다.
+    """
+    if series.empty:
+        return pd.DataFrame(
+            {
+                'start_date': pd.Series(dtype='datetime64[ns]'),
+                'end_date': pd.Series(dtype='datetime64[ns]'),
+                'is_always_open': pd.Series(dtype=bool),
+            },
+            index=series.index,
+        )
+    # 같은 신청기간 문자열이 많으므로 고유값만 파싱한 뒤 펼칩니다.
+    codes, uniques = pd.factorize(series.where(series.notna(), '').astype(str))
+    text = pd.Series(uniques, dtype=object)
+    # 숫자 8자리 형식은 잘라서 날짜로 바로 변환하고, 나머지 형식만 날짜 토큰 정규식으로 파싱
+    compact = text.str.extract(_COMPACT_PERIOD_PATTERN)
+    is_compact = compact[0].notna()
+    start = pd.to_datetime(compact[0], format='%Y%m%d', errors='coerce')
+    end = pd.to_datetime(compact[1].fillna(compact[0]), format='%Y%m%d', errors='coerce')
+    if not is_compact.all():
+        parts = text[~is_compact].str.partition(_RANGE_SEPARATOR)
+        has_range = parts[1] == _RANGE_SEPARATOR
+        other_start = _extract_dates(parts[0])
+        other_end = _extract_dates(parts[2]).where(has_range, other_start)
+        start = start.where(is_compact, other_start)
+        end = end.where(is_compact, other_end)
+    always_open = text.str.contains(_ALWAYS_OPEN_RE.pattern, regex=True)
+    start, end, always_open = start.to_numpy()[codes], end.to_numpy()[codes], always_open.to_numpy(dtype=bool)[codes]
+    return pd.DataFrame(
+        {'start_date': start, 'end_date': end, 'is_always_open': always_open},
+        index=series.index,
+    )
@@ -0,0 +1,120 @@
+"""
+사이드바 회사 목록의 추천 공고 예측 prefetch
+
+사이드바에 보이는 회사(처음 20개 또는 검색 결과)와 프로세스 전체에서 많이 선택된 회사의
+추천 공고를 백그라운드에서 prefetch_recommendations로 미리 조회해 회사별 캐시를 채웁니다.
+회사를 바꾸면 Supabase를 기다리지 않고 캐시된 공고로 바로 렌더링됩니다.
+
+화면 요청보다 앞서지 않도록
+    - 작업 스레드 수를 제한하고(PREFETCH_WORKERS, 기본 1) 대기 중인 회사가 많으면 새 요청을 버리며
+    - 묶음 조회를 별도 풀 없이 작업 스레드에서 차례로 실행하고
+    - 작업 스레드의 nice 값을 높이고(Linux)
+    - 화면 요청이 Supabase를 기다리는 중이면 잠시 양보합니다.
+"""
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from supabase_client import supabase_client
+
+PREFETCH_ENABLED = os.environ.get("SUPABASE_PREFETCH", "1") != "0"
+PREFETCH_WORKERS = int(os.environ.get("SUPABASE_PREFETCH_WORKERS", "1"))
+# 대기 중인 prefetch 회사 수 상한 (넘으면 새 요청은 버림)
+PREFETCH_MAX_PENDING = int(os.environ.get("SUPABASE_PREFETCH_MAX_PENDING", "100"))
+# 함께 미리 조회할 많이 선택된 회사 수
+PREFETCH_TOP_SELECTED = int(os.environ.get("SUPABASE_PREFETCH_TOP_SELECTED", "10"))
+PREFETCH_NICE = 10
+
+# 화면 요청이 진행 중일 때 양보하는 시간과 최대 횟수
+_YIELD_SECONDS = 0.05
+_MAX_YIELDS = 20
+
+
+def _lower_priority():
+    """현재 작업 스레드의 스케줄링 우선순위를 낮춥니다 (Linux에서만 스레드 단위로 적용)."""
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), PREFETCH_NICE)
+    except (AttributeError, OSError):
+        pass
+
+
+class Prefetcher:
+    """회사별 추천 공고 캐시를 백그라운드에서 채우는 prefetch 작업기 (프로세스 전역, 스레드 안전)"""
+
+    def __init__(self, client, workers=PREFETCH_WORKERS, max_pending=PREFETCH_MAX_PENDING, enabled=PREFETCH_ENABLED):
+        self.client = client
+        self.workers = workers
+        self.max_pending = max_pending
+        self.enabled = enabled
+        self.selections = Counter()
+        self._pending = set()
+        self._executor = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.dropped = 0
+
+    def record_selection(self, company_name):
+        """사이드바에서 회사가 선택되었음을 기록합니다."""
+        with self._lock:
+            self.selections[company_name] += 1
+
+    def most_selected(self, count=PREFETCH_TOP_SELECTED):
+        with self._lock:
+            return [name for name, _ in self.selections.most_common(count)]
+
+    def prefetch(self, company_names):
+        """캐시에 없는 회사의 전체 추천 공고를 백그라운드에서 조회하도록 예약합니다 (바로 반환)."""
+        if not self.enabled or self.client.is_degraded():
+            return
+        names = [name for name in dict.fromkeys(company_names) if not self._is_cached(name)]
+        with self._lock:
+            names = [name for name in names if name not in self._pending]
+            if not names:
+                return
+            room = self.max_pending - len(self._pending)
+            if room <= 0:
+                self.dropped += len(names)
+                return
+            self.dropped += max(0, len(names) - room)
+            names = names[:room]
+            self._pending.update(names)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix='supabase-prefetch', initializer=_lower_priority
+                )
+            self.submitted += len(names)
+        self._executor.submit(self._run, names)
+
+    def _is_cached(self, company_name):
+        # soft TTL이 지난 값도 있는 것으로 봄 (갱신은 화면 조회 시 get_recommendations_bulk 등이 묶어서 처리)
+        return self.client.cache.contains(('recommend_final', company_name, 'all'))
+
+    def _run(self, names):
+        try:
+            # 화면 요청이 Supabase를 기다리는 중이면 잠시 양보
+            for _ in range(_MAX_YIELDS):
+                if not self.client.flights.stats()['in_flight']:
+                    break
+                time.sleep(_YIELD_SECONDS)
+            # 기다리는 사이 화면 요청이 채운 회사는 prefetch_recommendations가 제외
+            self.client.prefetch_recommendations(names)
+        except Exception as e:
+            print(f"⚠️ 추천 공고 prefetch 실패: {e}")
+        finally:
+            with self._lock:
+                self._pending.difference_update(names)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'submitted': self.submitted,
+                'dropped': self.dropped,
+                'pending': len(self._pending),
+                'top_selected': self.selections.most_common(5),
+            }
+
+
+# 모든 세션이 공유하는 prefetch 작업기
+prefetcher = Prefetcher(supabase_client)
@@ -0,0 +1,100 @@
+"""
+회사/추천 공고 레코드 타입
+
+행마다 dict를 두는 대신 __slots__ 객체로 값만 저장합니다.
+기존 코드와 호환되도록 record['사업명'], record.get('최종 점수', 0)처럼 dict 방식으로도 읽을 수 있습니다.
+"""
+from operator import attrgetter
+
+import pandas as pd
+
+
+class Record:
+    """__slots__ 레코드 공통 기능. FIELDS는 (속성명, 원본 컬럼명) 목록입니다."""
+    __slots__ = ()
+    FIELDS = ()
+
+    def __init__(self, *values):
+        for (attr, _), value in zip(self.FIELDS, values):
+            setattr(self, attr, value)
+
+    @classmethod
+    def from_row(cls, row):
+        """원본 dict 행에서 레코드를 만듭니다 (없는 컬럼은 None)."""
+        return cls(*(row.get(column) for _, column in cls.FIELDS))
+
+    @classmethod
+    def from_rows(cls, rows):
+        return [cls.from_row(row) for row in rows or ()]
+
+    def __getitem__(self, key):
+        attr = self._ATTRS.get(key)
+        if attr is None:
+            raise KeyError(key)
+        return getattr(self, attr)
+
+    def get(self, key, default=None):
+        attr = self._ATTRS.get(key)
+        return default if attr is None else getattr(self, attr)
+
+    def keys(self):
+        return [column for _, column in self.FIELDS]
+
+    def to_dict(self):
+        """원본 컬럼명을 키로 하는 dict"""
+        return {column: getattr(self, attr) for attr, column in self.FIELDS}
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __repr__(self):
+        values = ', '.join(f'{attr}={getattr(self, attr)!r}' for attr, _ in self.FIELDS)
+        return f'{type(self).__name__}({values})'
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # 원본 컬럼명과 속성명 모두로 조회할 수 있도록 매핑
+        cls._ATTRS = {}
+        for attr, column in cls.FIELDS:
+            cls._ATTRS[column] = attr
+            cls._ATTRS[attr] = attr
+
+
+class Company(Record):
+    """company_list 형식의 회사 정보"""
+    __slots__ = (
+        'name', 'business_type', 'industry', 'region', 'founding_year',
+        'employee_count', 'business_stage', 'technology_fields', 'certifications',
+    )
+    FIELDS = tuple((attr, attr) for attr in __slots__)
+
+
+class Recommendation(Record):
+    """recommend_final 추천 공고 한 건"""
+    __slots__ = ('title', 'score', 'region', 'period', 'url', 'company')
+    FIELDS = (
+        ('title', '사업명'),
+        ('score', '최종 점수'),
+        ('region', '지역'),
+        ('period', '사업 연도'),
+        ('url', '상세페이지 URL'),
+        ('company', '기업명'),
+    )
+
+
+def records_to_frame(records, columns=None):
+    """레코드 목록을 원본 컬럼명의 DataFrame으로 변환합니다 (컬럼 단위로 한 번에 구성)."""
+    if columns is None:
+        columns = records[0].keys() if records else []
+    data = {}
+    for column in columns:
+        if records:
+            getter = attrgetter(records[0]._ATTRS[column])
+            data[column] = [getter(record) for record in records]
+        else:
+            data[column] = []
+    return pd.DataFrame(data, columns=list(columns))
@@ -0,0 +1,102 @@
+"""
+세션별 메모리 예산과 세션별 메모리 사용량 보고
+
+session_state에 남는 큰 산출물(추천 결과 DataFrame 등)의 크기를 재실행마다 추정해,
+세션 예산(SESSION_MEMORY_BUDGET_BYTES)을 넘으면 큰 것부터 지웁니다. 지운 산출물은 다음에 필요할 때
+조회 캐시에서 다시 만들어집니다. 공유 회사 목록(company_directory)처럼 여러 세션이 참조하는 객체는 세지 않습니다.
+
+세션별 추정 바이트는 프로세스 전역 보고서에 모여 관리자 패널에서 볼 수 있습니다.
+"""
+import os
+import sys
+import threading
+import time
+
+import pandas as pd
+
+SESSION_MEMORY_BUDGET_BYTES = int(os.environ.get("SESSION_MEMORY_BUDGET_BYTES", str(8 * 1024 * 1024)))
+
+# 예산을 넘으면 지울 수 있는 session_state 키 (다시 만들 수 있는 산출물)
+EVICTABLE_KEYS = ('recommendations', 'roadmap_data')
+
+# 이 시간 동안 재실행이 없던 세션은 보고서에서 뺍니다.
+SESSION_REPORT_TTL_SECONDS = 60 * 60
+
+
+def estimate_bytes(value):
+    """session_state 값 하나의 대략적인 메모리 크기"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_bytes(k) + estimate_bytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(estimate_bytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class SessionMemoryReport:
+    """세션별 session_state 추정 크기 (프로세스 전역, 스레드 안전)"""
+
+    def __init__(self):
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def record(self, session_id, sizes, evicted=()):
+        with self._lock:
+            self._sessions[session_id] = (time.time(), sizes)
+            self.evictions += len(evicted)
+
+    def rows(self):
+        """세션별 총 바이트와 가장 큰 키 (관리자 패널용, 큰 세션 순)"""
+        now = time.time()
+        with self._lock:
+            for session_id in [s for s, (seen, _) in self._sessions.items() if now - seen > SESSION_REPORT_TTL_SECONDS]:
+                del self._sessions[session_id]
+            items = list(self._sessions.items())
+        rows = []
+        for session_id, (seen, sizes) in items:
+            largest = max(sizes, key=sizes.get) if sizes else None
+            rows.append({
+                'session': session_id[:8],
+                'bytes': sum(sizes.values()),
+                'keys': len(sizes),
+                'largest_key': largest,
+                'largest_bytes': sizes.get(largest, 0),
+                'last_seen': time.strftime('%H:%M:%S', time.localtime(seen)),
+            })
+        rows.sort(key=lambda row: row['bytes'], reverse=True)
+        return rows
+
+
+def enforce_budget(session_id, state, shared=(), budget=SESSION_MEMORY_BUDGET_BYTES, report=None):
+    """state(session_state)가 예산을 넘으면 EVICTABLE_KEYS 중 큰 산출물부터 지우고, 키별 크기를 보고서에 기록합니다.
+
+    shared에 있는 객체(모든 세션이 참조하는 공유 객체)는 크기에 넣지 않습니다.
+    """
+    shared_ids = {id(value) for value in shared}
+    sizes = {}
+    for key in list(state.keys()):
+        value = state[key]
+        sizes[key] = 0 if id(value) in shared_ids else estimate_bytes(value)
+    evicted = []
+    total = sum(sizes.values())
+    for key in sorted((k for k in EVICTABLE_KEYS if k in sizes), key=sizes.get, reverse=True):
+        if total <= budget:
+            break
+        total -= sizes.pop(key)
+        del state[key]
+        evicted.append(key)
+    if evicted:
+        print(f"🧹 세션 메모리 예산 초과, 산출물 제거: {', '.join(evicted)}")
+    (report or session_memory_report).record(session_id, sizes, evicted)
+    return evicted
+
+
+# 모든 세션의 메모리 사용량 보고서
+session_memory_report = SessionMemoryReport()
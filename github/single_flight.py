@@ -0,0 +1,61 @@
+"""
+같은 조회가 동시에 여러 번 요청되면 하나만 실행하고 결과를 나눠 주는 single-flight
+
+기본 회사(대박드림스)처럼 여러 세션이 같은 순간 같은 공고를 조회할 때
+(배포 직후, 캐시 만료 직후) Supabase에는 요청이 한 번만 갑니다.
+"""
+import threading
+
+
+class _Call:
+    __slots__ = ('done', 'value', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """키별로 진행 중인 호출을 하나로 합칩니다 (스레드 안전)."""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key, fn):
+        """key에 대해 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 fn()을 실행합니다.
+
+        fn()이 예외를 던지면 기다리던 호출에도 같은 예외가 전달됩니다.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                call.waiters += 1
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+        try:
+            call.value = fn()
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self):
+        with self._lock:
+            return {'executed': self.executed, 'shared': self.shared, 'in_flight': len(self._calls)}
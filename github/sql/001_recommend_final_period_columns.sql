@@ -0,0 +1,32 @@
+-- recommend_final: '사업 연도' 문자열에서 파싱한 시작일/종료일 컬럼 추가
+-- PostgREST가 gte/lte 조건으로 활성/신규 공고를 DB에서 바로 걸러낼 수 있도록 합니다.
+
+-- 잘못된 날짜(예: 20251340)는 오류 대신 NULL로 처리
+create or replace function parse_yyyymmdd(value text)
+returns date
+language plpgsql
+immutable
+as $$
+begin
+    return to_date(value, 'YYYYMMDD');
+exception when others then
+    return null;
+end;
+$$;
+
+alter table recommend_final
+    add column if not exists start_date date,
+    add column if not exists end_date date,
+    add column if not exists is_always_open boolean;
+
+-- 기존 데이터 채우기 ('yyyymmdd ~ yyyymmdd', '상시', '예산 소진시까지')
+update recommend_final
+set start_date = parse_yyyymmdd(substring("사업 연도" from '(\d{8})\s*~')),
+    end_date = parse_yyyymmdd(substring("사업 연도" from '~\s*(\d{8})')),
+    is_always_open = ("사업 연도" like '%상시%' or "사업 연도" like '%예산 소진시까지%')
+where "사업 연도" is not null;
+
+create index if not exists recommend_final_company_start_date_idx
+    on recommend_final ("기업명", start_date);
+create index if not exists recommend_final_company_end_date_idx
+    on recommend_final ("기업명", end_date);
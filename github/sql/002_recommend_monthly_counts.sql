@@ -0,0 +1,20 @@
+-- 월별 공고 수를 DB에서 집계하는 RPC 함수 (001 마이그레이션의 start_date 컬럼 사용)
+-- 호출: POST /rest/v1/rpc/recommend_monthly_counts {"p_company": "대박드림스"}
+-- p_company가 NULL이면 전체 공고를 집계합니다.
+
+create or replace function recommend_monthly_counts(p_company text default null)
+returns table (start_year int, start_month int, announcement_count bigint)
+language sql
+stable
+as $$
+    select extract(year from start_date)::int as start_year,
+           extract(month from start_date)::int as start_month,
+           count(*) as announcement_count
+    from recommend_final
+    where start_date is not null
+      and (p_company is null or "기업명" = p_company)
+    group by 1, 2
+    order by 1, 2;
+$$;
+
+grant execute on function recommend_monthly_counts(text) to anon, authenticated;
@@ -0,0 +1,54 @@
+-- recommend_final: start_date/end_date/is_always_open을 period_derivation.py 배치 작업이 채우도록 준비
+-- 001 마이그레이션의 SQL 정규식은 'yyyymmdd ~ yyyymmdd'만 처리하므로, 나머지 형식(yyyy-mm-dd, yyyy년 m월 등)은
+-- period_parser 규칙으로 한 번 파싱해 저장합니다. period_parsed_at이 NULL인 행이 아직 처리되지 않은 행입니다.
+
+alter table recommend_final
+    add column if not exists period_parsed_at timestamptz;
+
+-- '사업 연도'가 새로 들어오거나 바뀌면 파생 컬럼을 비워 다음 배치 작업에서 다시 파싱
+create or replace function recommend_final_reset_period()
+returns trigger
+language plpgsql
+as $$
+begin
+    if tg_op = 'INSERT' or new."사업 연도" is distinct from old."사업 연도" then
+        new.start_date := null;
+        new.end_date := null;
+        new.is_always_open := null;
+        new.period_parsed_at := null;
+    end if;
+    return new;
+end;
+$$;
+
+drop trigger if exists recommend_final_reset_period on recommend_final;
+create trigger recommend_final_reset_period
+    before insert or update of "사업 연도" on recommend_final
+    for each row execute function recommend_final_reset_period();
+
+-- 처리할 행만 빠르게 찾기 위한 부분 인덱스
+create index if not exists recommend_final_period_pending_idx
+    on recommend_final (id) where period_parsed_at is null;
+
+-- 배치 하나의 파싱 결과를 한 번에 반영하는 RPC
+-- 호출: POST /rest/v1/rpc/apply_recommend_periods {"p_rows": [{"id": 1, "start_date": "2025-09-01", ...}]}
+create or replace function apply_recommend_periods(p_rows jsonb)
+returns integer
+language sql
+as $$
+    with updated as (
+        update recommend_final r
+        set start_date = x.start_date,
+            end_date = x.end_date,
+            is_always_open = x.is_always_open,
+            period_parsed_at = now()
+        from jsonb_to_recordset(p_rows) as x(id bigint, start_date date, end_date date, is_always_open boolean)
+        where r.id = x.id
+        returning 1
+    )
+    select count(*)::int from updated;
+$$;
+
+-- 쓰기 작업이므로 service_role(배치 작업)에만 허용
+revoke execute on function apply_recommend_periods(jsonb) from public, anon, authenticated;
+grant execute on function apply_recommend_periods(jsonb) to service_role;
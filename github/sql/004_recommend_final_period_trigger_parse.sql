@@ -0,0 +1,83 @@
+-- recommend_final: start_date/end_date/is_always_open을 쓰는 시점에 채우기
+-- 001 마이그레이션은 기존 행을 'yyyymmdd ~ yyyymmdd'만 한 번 채웠고, 003 트리거는 새 행을 배치 작업 전까지 NULL로 두어
+-- 그 사이 활성/신규 공고 조건(gte/lte)에서 빠졌습니다. period_parser와 같은 형식을 SQL로 파싱해 INSERT/UPDATE 시 바로 채웁니다.
+-- period_parsed_at은 계속 NULL로 두므로 period_derivation.py 배치 작업이 period_parser 규칙으로 한 번 더 확인합니다.
+
+-- 문자열에서 처음 나오는 날짜 (period_parser.parse_date와 같은 형식, 일이 없으면 1일, 잘못된 날짜는 NULL)
+--     yyyymmdd / yyyy-mm-dd, yyyy.mm.dd, yyyy/mm/dd / yyyy년 m월 (d일) / mm/dd/yyyy (월이 12보다 크면 dd/mm/yyyy)
+create or replace function parse_period_date(value text)
+returns date
+language plpgsql
+immutable
+as $$
+declare
+    parts text[];
+begin
+    parts := regexp_match(
+        value,
+        '(?<![0-9])([0-9]{8})(?![0-9])'
+        '|(?<![0-9])([0-9]{4})\s*[-./년]\s*([0-9]{1,2})(?![0-9])(?:\s*[-./월]\s*(?:([0-9]{1,2})(?![0-9]))?)?'
+        '|(?<![0-9])([0-9]{1,2})/([0-9]{1,2})/([0-9]{4})(?![0-9])'
+    );
+    if parts is null then
+        return null;
+    end if;
+    if parts[1] is not null then
+        return make_date(substr(parts[1], 1, 4)::int, substr(parts[1], 5, 2)::int, substr(parts[1], 7, 2)::int);
+    end if;
+    if parts[2] is not null then
+        return make_date(parts[2]::int, parts[3]::int, coalesce(parts[4]::int, 1));
+    end if;
+    if parts[5]::int > 12 then
+        return make_date(parts[7]::int, parts[6]::int, parts[5]::int);
+    end if;
+    return make_date(parts[7]::int, parts[5]::int, parts[6]::int);
+exception when others then
+    return null;
+end;
+$$;
+
+-- '사업 연도' 하나를 (시작일, 종료일, 상시 여부)로 파싱 (period_parser.parse_period와 같은 규칙)
+-- '~'가 없으면 시작일과 종료일이 같습니다.
+create or replace function parse_recommend_period(
+    value text,
+    out start_date date,
+    out end_date date,
+    out is_always_open boolean
+)
+language sql
+immutable
+as $$
+    select parse_period_date(split_part(value, '~', 1)),
+           case when strpos(value, '~') > 0
+                then parse_period_date(substr(value, strpos(value, '~') + 1))
+                else parse_period_date(value)
+           end,
+           coalesce(value like '%상시%' or value like '%예산 소진시까지%', false);
+$$;
+
+-- 003의 트리거 함수를 교체: 비우는 대신 바로 파싱해 채움 (트리거 정의는 그대로)
+create or replace function recommend_final_reset_period()
+returns trigger
+language plpgsql
+as $$
+declare
+    parsed record;
+begin
+    if tg_op = 'INSERT' or new."사업 연도" is distinct from old."사업 연도" then
+        parsed := parse_recommend_period(new."사업 연도");
+        new.start_date := parsed.start_date;
+        new.end_date := parsed.end_date;
+        new.is_always_open := parsed.is_always_open;
+        new.period_parsed_at := null;
+    end if;
+    return new;
+end;
+$$;
+
+-- 아직 배치 작업이 처리하지 않은 기존 행 채우기 ('사업 연도'를 바꾸지 않으므로 트리거는 실행되지 않음)
+update recommend_final r
+set (start_date, end_date, is_always_open) = (
+    select p.start_date, p.end_date, p.is_always_open from parse_recommend_period(r."사업 연도") as p
+)
+where r.period_parsed_at is null;
@@ -0,0 +1,24 @@
+-- recommend_monthly_counts: start_date가 아직 비어 있는 행도 '사업 연도'를 파싱해 집계
+-- 002의 함수는 start_date가 채워진 행만 세어 클라이언트 집계(period_parser)보다 적게 나올 수 있었습니다.
+-- 004 마이그레이션의 parse_recommend_period가 필요합니다.
+
+create or replace function recommend_monthly_counts(p_company text default null)
+returns table (start_year int, start_month int, announcement_count bigint)
+language sql
+stable
+as $$
+    with periods as (
+        select coalesce(start_date, (parse_recommend_period("사업 연도")).start_date) as start_date
+        from recommend_final
+        where (p_company is null or "기업명" = p_company)
+    )
+    select extract(year from start_date)::int as start_year,
+           extract(month from start_date)::int as start_month,
+           count(*) as announcement_count
+    from periods
+    where start_date is not null
+    group by 1, 2
+    order by 1, 2;
+$$;
+
+grant execute on function recommend_monthly_counts(text) to anon, authenticated;
@@ -1,9 +1,24 @@
 import os
-from supabase import create_client, Client
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+import httpx
+from supabase import create_client, Client, ClientOptions
+from postgrest.exceptions import APIError
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
-import re
 import pandas as pd
+from period_parser import parse_period, parse_period_series, start_month
+from mirror_sync import LocalMirror, MIRROR_PATH
+from company_store import CompanyStore
+from records import Record, Recommendation, records_to_frame
+from circuit_breaker import CircuitBreaker, CircuitOpenError
+from single_flight import SingleFlight
+from metrics import metrics
+from fast_json import ACCEPT_ENCODING, execute_rows, rows_to_frame
 
 load_dotenv()
 
@@ -11,324 +26,1003 @@ SUPABASE_URL = os.environ.get("SUPABASE_URL")
 SUPABASE_ANON_KEY = os.environ.get("SUPABASE_ANON_KEY")
 SUPABASE_SERVICE_ROLE_KEY = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
 
+# recommend_final 조회 결과 캐시 설정 (프로세스 전역, 모든 세션이 공유)
+CACHE_TTL_SECONDS = float(os.environ.get("SUPABASE_CACHE_TTL_SECONDS", "300"))
+# 이 시간이 지난 항목은 그대로 응답하면서 백그라운드에서 새로 조회 (stale-while-revalidate)
+CACHE_SOFT_TTL_SECONDS = float(os.environ.get("SUPABASE_CACHE_SOFT_TTL_SECONDS", "60"))
+CACHE_REFRESH_WORKERS = int(os.environ.get("SUPABASE_CACHE_REFRESH_WORKERS", "2"))
+CACHE_MAX_BYTES = int(os.environ.get("SUPABASE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# 모든 세션이 공유하는 keep-alive HTTP 연결 풀 설정
+HTTP_POOL_SIZE = int(os.environ.get("SUPABASE_HTTP_POOL_SIZE", "20"))
+HTTP_TIMEOUT_SECONDS = float(os.environ.get("SUPABASE_HTTP_TIMEOUT_SECONDS", "30"))
+HTTP_KEEPALIVE_SECONDS = float(os.environ.get("SUPABASE_HTTP_KEEPALIVE_SECONDS", "60"))
+
+# 페이지 단위 조회 설정 (PostgREST 기본 응답 상한은 1000행)
+PAGE_SIZE = int(os.environ.get("SUPABASE_PAGE_SIZE", "1000"))
+# 키셋(keyset) 페이지네이션 기준 고유 키 컬럼. Postgres는 LIMIT/OFFSET 조회 사이에 행 순서를 보장하지 않으므로
+# 기본으로 id 순서로 나눠 읽습니다 (빈 값이면 range 페이지네이션, page_query 참고).
+# id 컬럼이 없는 테이블은 첫 조회에서 확인해 range 페이지네이션으로 전환합니다 (SupabaseClient.iter_rows 참고).
+PAGINATION_KEY = os.environ.get("SUPABASE_PAGINATION_KEY", "id") or None
+
+# 활성/신규 공고 날짜 조건을 DB(start_date/end_date 컬럼)에서 처리할지 여부
+# (sql/001_recommend_final_period_columns.sql 적용 필요)
+PERIOD_PUSHDOWN = os.environ.get("SUPABASE_PERIOD_PUSHDOWN", "1") != "0"
+NEW_ANNOUNCEMENT_DAYS = 5
+
+# 월별 공고 수를 DB RPC 함수로 집계할지 여부 (sql/002_recommend_monthly_counts.sql 적용 필요)
+MONTHLY_COUNTS_RPC = 'recommend_monthly_counts'
+MONTHLY_RPC_ENABLED = os.environ.get("SUPABASE_MONTHLY_RPC", "1") != "0"
+
+# 장애 시 마지막 정상 데이터를 보관하는 시간 (초)
+STALE_TTL_SECONDS = float(os.environ.get("SUPABASE_STALE_TTL_SECONDS", str(24 * 60 * 60)))
+
+# 여러 회사 추천 공고 일괄 조회: in_ 조건 하나에 넣을 회사 수(URL 길이 제한)와 동시 조회 수
+BULK_CHUNK_SIZE = int(os.environ.get("SUPABASE_BULK_CHUNK_SIZE", "50"))
+BULK_WORKERS = int(os.environ.get("SUPABASE_BULK_WORKERS", "4"))
+
+
+def page_query(query, columns, key, last_key, offset, page_size):
+    """iter_rows의 페이지 하나 조건을 붙입니다.
+
+    key가 있으면 key 순서의 키셋 페이지, 없으면 range 페이지입니다. range 페이지도 조회마다 순서가 같도록
+    선택한 모든 컬럼으로 정렬합니다 (완전히 같은 행끼리만 순서가 바뀌므로 결과 행 집합은 같습니다).
+    columns가 '*'이면 정렬할 컬럼을 알 수 없으므로 고유 키 없이 전체를 읽을 때는 컬럼을 지정하세요.
+    """
+    if key:
+        if last_key is not None:
+            query = query.gt(key, last_key)
+        return query.order(key).limit(page_size)
+    for column in columns:
+        if column != '*':
+            query = query.order(column)
+    return query.range(offset, offset + page_size - 1)
+
+
+def _json_default(value):
+    return value.to_dict() if isinstance(value, Record) else str(value)
+
+
+def _estimate_size(value):
+    """캐시 항목의 대략적인 크기(바이트)를 계산합니다."""
+    if hasattr(value, 'nbytes'):
+        return value.nbytes
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=_json_default).encode('utf-8'))
+    except (TypeError, ValueError):
+        return 0
+
+
+class QueryCache:
+    """TTL + 바이트 크기 제한(LRU 제거)을 갖는 스레드 안전 조회 캐시
+
+    soft_ttl_seconds가 지난 항목은 lookup()에서 '갱신 필요'로 표시되지만
+    ttl_seconds(hard TTL)가 지나기 전까지는 계속 응답에 사용할 수 있습니다.
+    """
+
+    def __init__(self, ttl_seconds=CACHE_TTL_SECONDS, max_bytes=CACHE_MAX_BYTES, soft_ttl_seconds=None):
+        self.ttl_seconds = ttl_seconds
+        self.soft_ttl_seconds = ttl_seconds if soft_ttl_seconds is None else min(soft_ttl_seconds, ttl_seconds)
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (refresh_at, expires_at, size, value)
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale_hits = 0
+
+    def lookup(self, key):
+        """(값, 갱신 필요 여부)를 반환합니다. 없거나 hard TTL이 지났으면 (None, True)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, True
+            refresh_at, expires_at, size, value = entry
+            now = time.monotonic()
+            if expires_at <= now:
+                self._remove(key)
+                self.misses += 1
+                return None, True
+            self._entries.move_to_end(key)
+            self.hits += 1
+            needs_refresh = refresh_at <= now
+            if needs_refresh:
+                self.stale_hits += 1
+            return value, needs_refresh
+
+    def get(self, key):
+        """캐시된 값을 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        return self.lookup(key)[0]
+
+    def peek(self, key):
+        """적중/미스 통계와 LRU 순서를 바꾸지 않고 갱신이 필요 없는 값을 반환합니다 (없으면 None)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            return entry[3]
+
+    def contains(self, key):
+        """hard TTL 안의 값이 있는지 여부 (soft TTL이 지나 갱신이 필요한 값 포함, 통계/LRU 순서는 그대로)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[1] > time.monotonic()
+
+    def put(self, key, value):
+        """값을 저장하고 크기 제한을 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다."""
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            now = time.monotonic()
+            self._entries[key] = (now + self.soft_ttl_seconds, now + self.ttl_seconds, size, value)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes and self._entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def invalidate(self, table=None, company_name=None):
+        """테이블/회사 단위로 캐시를 비웁니다. 인자가 없으면 전체를 비웁니다."""
+        with self._lock:
+            for key in list(self._entries):
+                if table is not None and key[0] != table:
+                    continue
+                if company_name is not None and key[1] != company_name:
+                    continue
+                self._remove(key)
+
+    def stats(self):
+        """적중/미스 횟수와 현재 사용량을 반환합니다."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'stale_hits': self.stale_hits,
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+            }
+
+    def _remove(self, key):
+        _, _, size, _ = self._entries.pop(key)
+        self._total_bytes -= size
+
+
+# 모든 SupabaseClient 인스턴스와 Streamlit 세션이 공유하는 캐시
+query_cache = QueryCache(soft_ttl_seconds=CACHE_SOFT_TTL_SECONDS)
+
+
+class StaleEntry(NamedTuple):
+    """장애 시 대신 응답할 마지막 정상 조회 결과"""
+    saved_at: float
+    value: object
+
+    @property
+    def nbytes(self):
+        return _estimate_size(self.value)
+
+
+# 회사 목록(CompanyStore) 캐시 키
+COMPANY_STORE_KEY = ('alpha_companies_final', None, 'store')
+
+# 서킷이 열렸을 때 응답할 마지막 정상 데이터 (TTL이 길고 조회 캐시와 별도로 관리)
+last_known_good_cache = QueryCache(ttl_seconds=STALE_TTL_SECONDS)
+
+
+def monthly_counts_from_rpc(rows):
+    """recommend_monthly_counts RPC 결과(연도/월별 건수)를 1~12월 건수로 합칩니다."""
+    monthly_counts = {i: 0 for i in range(1, 13)}
+    for row in rows or []:
+        month = row.get('start_month')
+        if month in monthly_counts:
+            monthly_counts[month] += int(row.get('announcement_count') or 0)
+    return monthly_counts
+
+
+class ColumnView(NamedTuple):
+    """화면에서 필요한 컬럼 목록과 표시용 컬럼명/기본값 매핑"""
+    columns: tuple
+    rename: dict = {}
+    defaults: dict = {}
+
+    def select_args(self):
+        """PostgREST select 인자 (공백이 포함된 컬럼명은 큰따옴표로 감쌉니다)"""
+        return tuple(f'"{column}"' if ' ' in column else column for column in self.columns)
+
+    def to_frame(self, rows):
+        """조회 결과를 표시용 컬럼명으로 바꾼 DataFrame으로 변환합니다."""
+        if rows and isinstance(rows[0], Record):
+            df = records_to_frame(rows, self.columns)
+        else:
+            df = rows_to_frame(rows, self.columns)
+        df = df.rename(columns=self.rename)
+        for column, value in self.defaults.items():
+            df[column] = value
+        return df
+
+
+# 추천 공고 화면에서 공통으로 사용하는 recommend_final 컬럼
+RECOMMENDATION_COLUMNS = ('사업명', '최종 점수', '지역', '사업 연도', '상세페이지 URL')
+
+# 맞춤 추천 / 월별 상세보기 테이블
+RECOMMENDATION_VIEW = ColumnView(
+    RECOMMENDATION_COLUMNS,
+    rename={
+        '사업명': '공고명',
+        '최종 점수': '총점수',
+        '지역': '지역명',
+        '사업 연도': '신청기간',
+        '상세페이지 URL': '공고URL'
+    },
+    defaults={
+        '데이터소스': 'recommend_final',
+        '지원분야': '기타',
+        '지원대상': '중소기업',
+        '소관기관': '정부기관'
+    }
+)
+
+# 신규 공고 알림 테이블
+NEW_ANNOUNCEMENT_VIEW = ColumnView(
+    RECOMMENDATION_COLUMNS,
+    rename={
+        '사업명': '공고명',
+        '최종 점수': '추천점수',
+        '사업 연도': '신청기간',
+        '상세페이지 URL': '공고URL'
+    },
+    defaults={
+        '지원분야': '기타',
+        '지원대상': '중소기업',
+        '소관기관': '정부기관'
+    }
+)
+
+# 마감 임박 공고 화면
+DEADLINE_VIEW = ColumnView(
+    RECOMMENDATION_COLUMNS,
+    rename={
+        '사업명': '공고명',
+        '최종 점수': '추천점수',
+        '사업 연도': '마감일',
+        '상세페이지 URL': '공고URL'
+    },
+    defaults={
+        '지원분야': '기타',
+        '지원대상': '중소기업'
+    }
+)
+
+# 월별 공고 수 집계
+PERIOD_VIEW = ColumnView(('사업 연도',))
+
+# 회사 목록 (get_companies에서 앱 형식으로 변환)
+COMPANY_VIEW = ColumnView(('기업명', '기업형태', '업종', '지역', '설립일', '고용', '업력', '기술특허', '기업인증'))
+
+
+# PostgREST/Postgres 오류 코드: 컬럼 없음, RPC 함수 없음
+UNDEFINED_COLUMN_CODES = ('42703',)
+UNDEFINED_FUNCTION_CODES = ('PGRST202', '42883')
+
+
+def is_api_error(error, codes):
+    """PostgREST가 codes 중 하나의 오류 코드로 응답한 APIError인지 여부 (네트워크 오류 등은 False)"""
+    return isinstance(error, APIError) and str(error.code) in codes
+
+
+def filter_recommendations(rows, is_active_only=False, is_new_announcements=False, today=None):
+    """'사업 연도' 기준으로 활성 공고 또는 신규 공고만 걸러냅니다. 조건이 없으면 그대로 반환합니다."""
+    if not (is_active_only or is_new_announcements):
+        return rows
+    if today is None:
+        today = datetime.now().date()
+    filtered_data = []
+    for item in rows:
+        period_str = item.get('사업 연도')
+        if not period_str:
+            continue
+        # '사업 연도' 컬럼에서 시작일/종료일/상시('예산 소진시까지' 포함) 여부 파싱
+        start_date, end_date, is_always_active = parse_period(period_str)
+
+        if is_active_only:
+            if is_always_active or (start_date and end_date and start_date <= today <= end_date):
+                filtered_data.append(item)
+        elif is_new_announcements:
+            if start_date and (today - start_date).days <= NEW_ANNOUNCEMENT_DAYS: # 5일 이내 신규 공고
+                filtered_data.append(item)
+    return filtered_data
+
+class _MeteredStream(httpx.SyncByteStream):
+    """응답 본문을 읽으면서 수신 바이트를 현재 계측 중인 호출에 기록하는 스트림"""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def __iter__(self):
+        for chunk in self._stream:
+            metrics.add_bytes(len(chunk))
+            yield chunk
+
+    def close(self):
+        self._stream.close()
+
+
+class MeteredTransport(httpx.HTTPTransport):
+    """응답 수신 바이트를 metrics에 기록하는 HTTP 전송 계층"""
+
+    def handle_request(self, request):
+        response = super().handle_request(request)
+        response.stream = _MeteredStream(response.stream)
+        return response
+
+
+def create_http_client(pool_size: int = HTTP_POOL_SIZE):
+    """여러 세션/스레드가 공유하는 keep-alive 연결 풀 httpx 클라이언트를 만듭니다."""
+    return httpx.Client(
+        transport=MeteredTransport(
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=HTTP_KEEPALIVE_SECONDS,
+            ),
+        ),
+        timeout=HTTP_TIMEOUT_SECONDS,
+        follow_redirects=True,
+        # 큰 응답은 압축해서 받기 (httpx가 자동으로 풀어 줌)
+        headers={'Accept-Encoding': ACCEPT_ENCODING},
+    )
+
+
 class SupabaseClient:
-    def __init__(self):
+    """recommend_final / alpha_companies_final 조회 클라이언트.
+
+    실제 Supabase 클라이언트는 처음 사용할 때 한 번만(스레드 안전하게) 생성되며,
+    모든 Streamlit 스크립트 스레드가 같은 HTTP 연결 풀을 재사용합니다.
+    mirror_path(SUPABASE_MIRROR_PATH)가 지정되면 mirror_sync.py로 동기화된 테이블은 로컬 미러에서 읽습니다.
+    테이블/RPC별 서킷 브레이커가 열려 있으면 Supabase를 기다리지 않고 마지막 정상 데이터로 응답합니다.
+    """
+
+    def __init__(
+        self,
+        cache: QueryCache = None,
+        pool_size: int = HTTP_POOL_SIZE,
+        mirror_path: str = MIRROR_PATH,
+        stale_cache: QueryCache = None,
+    ):
+        # 캐시는 기본적으로 프로세스 전역 query_cache / last_known_good_cache를 공유합니다.
+        self.cache = cache if cache is not None else query_cache
+        self.stale_cache = stale_cache if stale_cache is not None else last_known_good_cache
+        self.breakers = {}
+        self.flights = SingleFlight()
+        self._refreshing = set()
+        self._refresh_executor = None
+        self._refresh_lock = threading.Lock()
+        self.stale_since = {}
+        self._breakers_lock = threading.Lock()
+        # 마지막으로 Supabase 조회가 성공/실패한 시각(epoch 초)과 실패 오류 (health.HealthProbe가 읽음)
+        self.last_success_at = None
+        self.last_failure_at = None
+        self.last_error = None
+        self.period_pushdown = PERIOD_PUSHDOWN
+        self.monthly_rpc = MONTHLY_RPC_ENABLED
+        # 페이지네이션 키 컬럼이 없는 것으로 확인된 (테이블, 키) (이후 range 페이지네이션으로 조회)
+        self.missing_pagination_keys = set()
+        self.pool_size = pool_size
+        self.http_client = None
+        self._client_instance: Client = None
+        self._client_initialized = False
+        self._client_lock = threading.Lock()
+        self.mirror = LocalMirror(mirror_path) if mirror_path else None
+
+    @property
+    def _client(self):
+        """Supabase 클라이언트 (최초 접근 시 생성, 실패하면 None)"""
+        if not self._client_initialized:
+            with self._client_lock:
+                if not self._client_initialized:
+                    self._client_instance = self._create_client()
+                    self._client_initialized = True
+        return self._client_instance
+
+    @_client.setter
+    def _client(self, client):
+        with self._client_lock:
+            self._client_instance = client
+            self._client_initialized = True
+
+    def _create_client(self):
         if not SUPABASE_URL or not SUPABASE_ANON_KEY:
             print("⚠️ Supabase 환경변수가 설정되지 않았습니다. Streamlit Cloud에서 환경변수를 설정해주세요.")
-            self._client = None
-            return
+            return None
         try:
-            self._client: Client = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
-            print("SupabaseClient initialized.")
+            self.http_client = create_http_client(self.pool_size)
+            client = create_client(
+                SUPABASE_URL,
+                SUPABASE_ANON_KEY,
+                options=ClientOptions(httpx_client=self.http_client),
+            )
+            print(f"SupabaseClient initialized. (HTTP 연결 풀: {self.pool_size})")
+            return client
         except Exception as e:
             print(f"❌ Supabase 연결 실패: {e}")
-            self._client = None
+            return None
+
+    def _mirror_for(self, table):
+        """테이블이 로컬 미러에 동기화되어 있으면 미러를, 아니면 None을 반환합니다."""
+        if self.mirror is not None and self.mirror.has_table(table):
+            return self.mirror
+        return None
+
+    def _has_source(self, table):
+        return self._mirror_for(table) is not None or self._client is not None
+
+    def _breaker(self, endpoint):
+        with self._breakers_lock:
+            breaker = self.breakers.get(endpoint)
+            if breaker is None:
+                breaker = self.breakers[endpoint] = CircuitBreaker(endpoint)
+            return breaker
+
+    def _load(self, endpoint, cache_key, fetch):
+        """캐시된 값이 있으면 바로 반환하고, soft TTL이 지났으면 백그라운드에서 새로 조회합니다.
+
+        캐시에 없을 때만 호출한 요청이 Supabase 응답을 기다립니다.
+        """
+        cached, needs_refresh = self.cache.lookup(cache_key)
+        metrics.mark_cache(cached is not None)
+        if cached is None:
+            return self._guarded(endpoint, cache_key, fetch)
+        if needs_refresh:
+            self._refresh_in_background(endpoint, cache_key, fetch)
+        return cached
+
+    def _refresh_in_background(self, endpoint, cache_key, fetch):
+        with self._refresh_lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+            executor = self._refresh_pool()
+        executor.submit(self._refresh, endpoint, cache_key, fetch)
+
+    def _refresh_pool(self):
+        # _refresh_lock을 잡은 상태에서 호출
+        if self._refresh_executor is None:
+            self._refresh_executor = ThreadPoolExecutor(
+                max_workers=CACHE_REFRESH_WORKERS, thread_name_prefix='supabase-refresh'
+            )
+        return self._refresh_executor
+
+    @metrics.instrument('background_refresh')
+    def _refresh(self, endpoint, cache_key, fetch):
+        try:
+            self._guarded(endpoint, cache_key, fetch)
+        except Exception as e:
+            # 갱신에 실패해도 hard TTL까지는 기존 값으로 응답
+            print(f"⚠️ {endpoint} 백그라운드 갱신 실패: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(cache_key)
+
+    def _guarded(self, endpoint, cache_key, fetch):
+        """엔드포인트의 서킷 브레이커를 거쳐 fetch()를 실행하고 결과를 캐시에 저장합니다.
+
+        같은 cache_key 조회가 동시에 들어오면 하나만 실행하고 나머지는 그 결과를 받습니다.
+        호출이 실패하거나 회로가 열려 있으면 마지막 정상 데이터(last known good)를 반환하고,
+        그마저 없으면 예외를 그대로 전달합니다.
+        """
+        return self.flights.do(cache_key, lambda: self._fetch_guarded(endpoint, cache_key, fetch))
+
+    def _fetch_guarded(self, endpoint, cache_key, fetch):
+        # 기다리는 사이 다른 요청이 이미 캐시를 채웠다면 다시 조회하지 않음
+        cached = self.cache.peek(cache_key)
+        if cached is not None:
+            return cached
+        try:
+            value = self._breaker(endpoint).call(fetch)
+        except Exception as e:
+            metrics.mark_error()
+            if not isinstance(e, CircuitOpenError):
+                self._record_failure(e)
+            entry = self._fall_back(endpoint, cache_key)
+            if entry is None:
+                raise
+            if not isinstance(e, CircuitOpenError):
+                print(f"⚠️ {endpoint} 조회 실패, 마지막 정상 데이터를 사용합니다: {e}")
+            return entry.value
+        self._remember(endpoint, cache_key, value)
+        return value
+
+    def _remember(self, endpoint, cache_key, value):
+        """성공한 조회 결과를 캐시와 마지막 정상 데이터에 저장합니다."""
+        with self._breakers_lock:
+            self.stale_since.pop(endpoint, None)
+            self.last_success_at = time.time()
+        self.cache.put(cache_key, value)
+        self.stale_cache.put(cache_key, StaleEntry(time.time(), value))
+
+    def _fall_back(self, endpoint, cache_key):
+        """마지막 정상 데이터(StaleEntry)를 반환하고 stale 응답 시각을 기록합니다. 없으면 None."""
+        entry = self.stale_cache.get(cache_key)
+        if entry is not None:
+            with self._breakers_lock:
+                self.stale_since[endpoint] = min(self.stale_since.get(endpoint, entry.saved_at), entry.saved_at)
+        return entry
+
+    def _record_failure(self, error):
+        with self._breakers_lock:
+            self.last_failure_at = time.time()
+            self.last_error = str(error)
+
+    def last_known_good(self, cache_key):
+        """마지막으로 성공한 조회 결과 (없으면 None)"""
+        entry = self.stale_cache.get(cache_key)
+        return None if entry is None else entry.value
+
+    def serving_stale(self):
+        """마지막 정상 데이터로 응답 중인 엔드포인트와 그 데이터의 저장 시각(epoch 초)"""
+        with self._breakers_lock:
+            return dict(self.stale_since)
+
+    def is_degraded(self):
+        """열려 있거나 복구 확인 중인 서킷이 있는지 여부"""
+        with self._breakers_lock:
+            return any(not breaker.is_closed for breaker in self.breakers.values())
+
+    @metrics.instrument()
+    def ping(self):
+        """alpha_companies_final에서 한 행만 조회해 Supabase 응답을 확인합니다 (실패 시 예외).
+
+        화면 코드는 직접 호출하지 말고 health.health_probe의 캐시된 상태를 읽으세요.
+        """
+        if not self._client:
+            raise RuntimeError("Supabase 클라이언트가 초기화되지 않았습니다.")
+        try:
+            self._breaker('alpha_companies_final').call(
+                lambda: self._client.table('alpha_companies_final').select('기업명').limit(1).execute()
+            )
+        except Exception as e:
+            metrics.mark_error()
+            if not isinstance(e, CircuitOpenError):
+                self._record_failure(e)
+            raise
+        with self._breakers_lock:
+            self.last_success_at = time.time()
 
     def test_connection(self):
         """Supabase 연결을 테스트합니다."""
-        if not self._client:
-            print("❌ Supabase 클라이언트가 초기화되지 않았습니다.")
-            return False
         try:
             print("🔍 Supabase 연결을 테스트합니다...")
-            response = self._client.table('alpha_companies_final').select('count').execute()
+            self.ping()
             print(f"✅ Supabase 연결 성공! 테이블 접근 가능")
             return True
         except Exception as e:
             print(f"❌ Supabase 연결 테스트 실패: {e}")
             return False
 
-    def get_companies(self):
-        """alpha_companies_final 테이블에서 회사 목록을 가져옵니다."""
+    def iter_rows(self, table, columns=('*',), filters=(), page_size=PAGE_SIZE, key=PAGINATION_KEY):
+        """테이블을 page_size 단위로 나눠 조회하며 행 목록(배치)을 하나씩 반환합니다.
+
+        filters는 (연산자, 컬럼, 값) 튜플 목록입니다. 예: [('eq', '기업명', '대박드림스')], [('in_', '기업명', [...])]
+        key(기본 id)가 주어지면 해당 고유 컬럼 기준 키셋 페이지네이션, None이면 range 페이지네이션을 사용합니다.
+        컬럼을 지정했는데 테이블에 key 컬럼이 없으면(42703) 지정한 컬럼으로 정렬하는 range 페이지네이션으로 다시 조회합니다.
+        columns가 '*'이거나 key 컬럼을 직접 선택한 경우에는 그대로 오류를 냅니다.
+        서버의 응답 상한이 page_size보다 작아도 빈 페이지가 나올 때까지 조회하므로 누락되지 않습니다.
+        로컬 미러에 동기화된 테이블은 네트워크 대신 미러에서 읽습니다.
+        응답 본문은 orjson이 설치되어 있으면 fast_json.execute_rows로 디코딩합니다.
+        """
+        mirror = self._mirror_for(table)
+        if mirror is not None:
+            yield from mirror.iter_rows(table, columns, filters, page_size)
+            return
         if not self._client:
+            return
+        selected = columns
+        if '*' not in columns and (table, key) in self.missing_pagination_keys:
+            key = None
+        if key and '*' not in columns and key not in columns:
+            columns = tuple(columns) + (key,)
+        offset = 0
+        last_key = None
+        while True:
+            query = self._client.table(table).select(*columns)
+            for op, column, value in filters:
+                # or_처럼 컬럼 없이 조건식만 받는 연산자는 column을 None으로 넘깁니다.
+                query = getattr(query, op)(value) if column is None else getattr(query, op)(column, value)
+            query = page_query(query, columns, key, last_key, offset, page_size)
+            try:
+                batch = execute_rows(query)
+            except Exception as e:
+                if not (key and last_key is None and columns != selected and is_api_error(e, UNDEFINED_COLUMN_CODES)):
+                    raise
+                # key 없이 다시 조회해 성공할 때만 key 컬럼이 없는 테이블로 기록 (다른 컬럼이 없는 경우는 그대로 오류)
+                rows = self.iter_rows(table, selected, filters, page_size, key=None)
+                first = next(rows, None)
+                print(f"⚠️ {table}: '{key}' 컬럼이 없어 range 페이지네이션으로 조회합니다: {e}")
+                self.missing_pagination_keys.add((table, key))
+                if first is not None:
+                    yield first
+                    yield from rows
+                return
+            if not batch:
+                return
+            yield batch
+            offset += len(batch)
+            if key:
+                last_key = batch[-1][key]
+
+    @metrics.instrument()
+    def get_company_store(self):
+        """alpha_companies_final 테이블을 컬럼형 CompanyStore로 가져옵니다 (캐시 공유)."""
+        if not self._has_source('alpha_companies_final'):
             print("❌ Supabase 클라이언트가 초기화되지 않았습니다.")
-            return []
+            return CompanyStore.from_rows([])
         try:
-            print("🔍 alpha_companies_final 테이블에서 데이터를 조회합니다...")
-            response = self._client.table('alpha_companies_final').select('*').execute()
-            print(f"📊 조회 결과: {len(response.data) if response.data else 0}개 레코드")
-            if response.data:
-                # Supabase에서 가져온 데이터를 앱의 company_list 형식에 맞게 변환
-                companies = []
-                for item in response.data:
-                    # '설립일' 컬럼이 연도만 있는 경우 처리
-                    founding_year = None
-                    if '설립일' in item and item['설립일']:
-                        try:
-                            # '설립일'이 숫자만 있는 경우 (예: 4)
-                            if str(item['설립일']).isdigit():
-                                founding_year = int(item['설립일'])
-                            # '설립일'이 'YYYY.MM.DD.' 형식인 경우 (예: 2020.01.01.)
-                            elif re.match(r'^\d{4}\.\d{2}\.\d{2}\.$', item['설립일']):
-                                founding_year = int(item['설립일'].split('.')[0])
-                            # '설립일'이 'YYYY' 형식인 경우
-                            elif re.match(r'^\d{4}$', item['설립일']):
-                                founding_year = int(item['설립일'])
-                        except ValueError:
-                            pass # 변환 실패 시 None 유지
-
-                    # '고용' 컬럼 처리 (예: '6명' -> '6-10명' 범위로 매핑)
-                    employee_count_str = item.get('고용', '0명').replace('명', '').strip()
-                    employee_count = '0명'
-                    if employee_count_str.isdigit():
-                        count = int(employee_count_str)
-                        if count <= 5:
-                            employee_count = '1-5명'
-                        elif count <= 10:
-                            employee_count = '6-10명'
-                        elif count <= 50:
-                            employee_count = '11-50명'
-                        elif count <= 100:
-                            employee_count = '51-100명'
-                        elif count <= 300:
-                            employee_count = '101-300명'
-                        else:
-                            employee_count = '300명 이상'
-                    
-                    # '업력' 컬럼을 'business_stage'로 매핑
-                    business_stage = '예비창업자'
-                    if '업력' in item and item['업력']:
-                        if '3년 미만' in item['업력'] or '초기' in item['업력']:
-                            business_stage = '초기창업(3년 미만)'
-                        elif '3-7년' in item['업력'] or '성장' in item['업력']:
-                            business_stage = '성장기(3-7년)'
-                        elif '7년 이상' in item['업력'] or '성숙' in item['업력']:
-                            business_stage = '성숙기(7년 이상)'
-                        elif '예비' in item['업력']:
-                            business_stage = '예비창업자'
-                    
-                    # '기술특허'와 '기업인증'을 리스트로 변환
-                    technology_fields = [f.strip() for f in item.get('기술특허', '').split(',') if f.strip()]
-                    certifications = [c.strip() for c in item.get('기업인증', '').split(',') if c.strip()]
-
-                    companies.append({
-                        'name': item.get('기업명', '알 수 없음'),
-                        'business_type': item.get('기업형태', '법인사업자'),
-                        'industry': item.get('업종', '기타'),
-                        'region': item.get('지역', '전국'),
-                        'founding_year': founding_year,
-                        'employee_count': employee_count,
-                        'business_stage': business_stage,
-                        'technology_fields': technology_fields,
-                        'certifications': certifications
-                    })
-                return companies
-            return []
+            return self._load('alpha_companies_final', COMPANY_STORE_KEY, self._fetch_company_store)
         except Exception as e:
             print(f"❌ Supabase에서 회사 데이터 조회 실패: {e}")
             print(f"❌ 오류 타입: {type(e)}")
-            return []
+            return CompanyStore.from_rows([])
 
+    def _fetch_company_store(self):
+        print("🔍 alpha_companies_final 테이블에서 데이터를 조회합니다...")
+        # 페이지 단위로 받은 행을 한 번에 정규화
+        store = CompanyStore.from_batches(self.iter_rows('alpha_companies_final', COMPANY_VIEW.select_args()))
+        print(f"📊 조회 결과: {len(store)}개 레코드")
+        return store
+
+    @metrics.instrument()
+    def get_companies(self):
+        """alpha_companies_final 테이블에서 회사 목록(Company 레코드 목록)을 가져옵니다."""
+        return self.get_company_store().to_records()
+
+    @staticmethod
+    def _recommendation_filter_name(is_active_only, is_new_announcements):
+        if is_active_only:
+            return 'active'
+        if is_new_announcements:
+            return 'new'
+        return 'all'
+
+    @metrics.instrument()
     def get_recommendations(self, company_name: str, is_active_only: bool = False, is_new_announcements: bool = False):
-        """recommend_final 테이블에서 추천 공고를 가져옵니다."""
-        if not self._client:
+        """recommend_final 테이블에서 추천 공고(Recommendation 목록)를 가져옵니다."""
+        if not self._has_source('recommend_final'):
             return []
+        filter_name = self._recommendation_filter_name(is_active_only, is_new_announcements)
+        cache_key = ('recommend_final', company_name, filter_name)
         try:
-            query = self._client.table('recommend_final').select('*').eq('기업명', company_name)
-
-            if is_active_only or is_new_announcements:
-                today = datetime.now().date()
-                # '사업 연도' 컬럼에서 시작일과 종료일 파싱
-                response = query.execute()
-                filtered_data = []
-                for item in response.data:
-                    period_str = item.get('사업 연도')
-                    if not period_str:
-                        continue
-
-                    start_date_match = re.search(r'(\d{8})\s*~', period_str)
-                    end_date_match = re.search(r'~\s*(\d{8})', period_str)
-
-                    start_date = None
-                    end_date = None
-
-                    if start_date_match:
-                        try:
-                            start_date = datetime.strptime(start_date_match.group(1), '%Y%m%d').date()
-                        except ValueError:
-                            pass
-                    if end_date_match:
-                        try:
-                            end_date = datetime.strptime(end_date_match.group(1), '%Y%m%d').date()
-                        except ValueError:
-                            pass
-                    
-                    # '예산 소진시까지' 또는 '상시' 처리
-                    if '예산 소진시까지' in period_str or '상시' in period_str:
-                        is_always_active = True
-                    else:
-                        is_always_active = False
-
-                    if is_active_only:
-                        if is_always_active or (start_date and end_date and start_date <= today <= end_date):
-                            filtered_data.append(item)
-                    elif is_new_announcements:
-                        if start_date and (today - start_date).days <= 5: # 5일 이내 신규 공고
-                            filtered_data.append(item)
-                    else: # 전체 공고
-                        filtered_data.append(item)
-                return filtered_data
-            
-            response = query.execute()
-            return response.data
+            filtered_data = self._load(
+                'recommend_final',
+                cache_key,
+                lambda: self._fetch_recommendations([company_name], is_active_only, is_new_announcements)[company_name],
+            )
+            return list(filtered_data)
         except Exception as e:
             print(f"Error fetching recommendations from Supabase: {e}")
             return []
 
+    @metrics.instrument()
+    def get_recommendations_bulk(self, company_names, is_active_only: bool = False, is_new_announcements: bool = False):
+        """여러 회사의 추천 공고를 {회사명: Recommendation 목록}으로 가져옵니다 (포트폴리오 화면용).
+
+        캐시에 없는 회사만 BULK_CHUNK_SIZE개씩 in_ 조건으로 묶어 최대 BULK_WORKERS개를 동시에 조회하고,
+        결과는 회사별로 get_recommendations와 같은 캐시 키에 저장합니다.
+        조회에 실패한 묶음의 회사는 마지막 정상 데이터(없으면 빈 목록)로 채웁니다.
+        """
+        names = list(dict.fromkeys(company_names))
+        results = {name: [] for name in names}
+        if not names or not self._has_source('recommend_final'):
+            return results
+        filter_name = self._recommendation_filter_name(is_active_only, is_new_announcements)
+
+        missing, stale = [], []
+        for name in names:
+            cached, needs_refresh = self.cache.lookup(('recommend_final', name, filter_name))
+            if cached is None:
+                missing.append(name)
+                continue
+            results[name] = list(cached)
+            if needs_refresh:
+                stale.append(name)
+        if stale:
+            # soft TTL이 지난 회사들은 회사별로 따로가 아니라 묶음 in_ 조회로 함께 갱신
+            self._refresh_recommendations_in_background(stale, is_active_only, is_new_announcements, filter_name)
+        metrics.mark_cache(not missing)
+        if not missing:
+            return results
+
+        chunks = [missing[i:i + BULK_CHUNK_SIZE] for i in range(0, len(missing), BULK_CHUNK_SIZE)]
+
+        def fetch(chunk):
+            # 실패 기록(계측 포함)은 호출한 스레드에서 하도록 예외를 결과로 돌려줌
+            try:
+                return self._fetch_recommendation_chunk(chunk, is_active_only, is_new_announcements, filter_name)
+            except Exception as e:
+                return e
+
+        if len(chunks) == 1:
+            grouped = [fetch(chunks[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(BULK_WORKERS, len(chunks)), thread_name_prefix='supabase-bulk') as executor:
+                grouped = list(executor.map(fetch, chunks))
+        for chunk, group in zip(chunks, grouped):
+            if isinstance(group, Exception):
+                group = self._recommendation_chunk_failed(chunk, group, filter_name, serve_stale=True)
+            for name, rows in group.items():
+                results[name] = list(rows)
+        print(f"📊 추천 공고 일괄 조회: {len(names)}개 회사 (조회 {len(missing)}개, 요청 묶음 {len(chunks)}개)")
+        return results
+
+    def _refresh_recommendations_in_background(self, names, is_active_only, is_new_announcements, filter_name):
+        with self._refresh_lock:
+            names = [name for name in names if ('recommend_final', name, filter_name) not in self._refreshing]
+            if not names:
+                return
+            self._refreshing.update(('recommend_final', name, filter_name) for name in names)
+            executor = self._refresh_pool()
+        executor.submit(self._refresh_recommendations, names, is_active_only, is_new_announcements, filter_name)
+
+    @metrics.instrument('background_refresh')
+    def _refresh_recommendations(self, names, is_active_only, is_new_announcements, filter_name):
+        try:
+            self._fill_recommendations(names, is_active_only, is_new_announcements, filter_name)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.difference_update(('recommend_final', name, filter_name) for name in names)
+
+    @metrics.instrument('prefetch')
+    def prefetch_recommendations(self, company_names, is_active_only: bool = False, is_new_announcements: bool = False):
+        """캐시에 없는 회사들의 추천 공고를 미리 조회해 회사별 캐시를 채웁니다 (prefetch 작업 스레드용).
+
+        get_recommendations_bulk와 달리 supabase-bulk 풀을 쓰지 않고 호출한 스레드에서 묶음을 차례로 조회하며,
+        실패해도 마지막 정상 데이터로 채우지 않습니다 (화면에 stale 표시 없음).
+        """
+        if not self._has_source('recommend_final'):
+            return
+        filter_name = self._recommendation_filter_name(is_active_only, is_new_announcements)
+        names = [
+            name for name in dict.fromkeys(company_names)
+            if not self.cache.contains(('recommend_final', name, filter_name))
+        ]
+        self._fill_recommendations(names, is_active_only, is_new_announcements, filter_name)
+
+    def _fill_recommendations(self, names, is_active_only, is_new_announcements, filter_name):
+        """회사들을 BULK_CHUNK_SIZE개씩 호출한 스레드에서 차례로 조회해 캐시에 저장합니다 (화면에 보여 주지 않는 조회용)."""
+        for i in range(0, len(names), BULK_CHUNK_SIZE):
+            chunk = names[i:i + BULK_CHUNK_SIZE]
+            try:
+                self._fetch_recommendation_chunk(chunk, is_active_only, is_new_announcements, filter_name)
+            except Exception as e:
+                # 화면은 기존 캐시로 응답 중이므로 마지막 정상 데이터로 바꾸지 않음 (stale 표시 없음)
+                self._recommendation_chunk_failed(chunk, e, filter_name, serve_stale=False)
+
+    def _fetch_recommendation_chunk(self, names, is_active_only, is_new_announcements, filter_name):
+        """회사 묶음 하나를 서킷 브레이커를 거쳐 조회하고 회사별로 캐시에 저장합니다 (실패하면 예외)."""
+        grouped = self._breaker('recommend_final').call(
+            lambda: self._fetch_recommendations(names, is_active_only, is_new_announcements)
+        )
+        for name, rows in grouped.items():
+            self._remember('recommend_final', ('recommend_final', name, filter_name), rows)
+        return grouped
+
+    def _recommendation_chunk_failed(self, names, error, filter_name, serve_stale):
+        """묶음 조회 실패를 기록합니다 (_fetch_guarded와 같은 계측/상태 기록).
+
+        serve_stale이면 화면에 보여 줄 마지막 정상 데이터(없으면 빈 목록)를 회사별로 반환하고 stale 응답으로 표시합니다.
+        백그라운드 갱신/prefetch처럼 결과를 화면에 보여 주지 않으면 빈 dict를 반환합니다.
+        """
+        metrics.mark_error()
+        if not isinstance(error, CircuitOpenError):
+            self._record_failure(error)
+            print(f"⚠️ 추천 공고 일괄 조회 실패 ({len(names)}개 회사): {error}")
+        if not serve_stale:
+            return {}
+        grouped = {}
+        for name in names:
+            entry = self._fall_back('recommend_final', ('recommend_final', name, filter_name))
+            grouped[name] = [] if entry is None else entry.value
+        return grouped
+
+    def _fetch_recommendations(self, company_names, is_active_only, is_new_announcements):
+        """company_names 회사들의 추천 공고를 한 번의 in_ 조건(페이지 단위)으로 조회해 회사별로 나눕니다."""
+        columns = RECOMMENDATION_VIEW.select_args() + ('기업명',)
+        filters = [('in_', '기업명', list(company_names))]
+        rows = None
+        pushdown = self.period_pushdown and self._mirror_for('recommend_final') is None
+        if pushdown and (is_active_only or is_new_announcements):
+            try:
+                # 날짜 조건을 DB에서 처리해 후보 행만 받고, 날짜 컬럼이 아직 비어 있던 행까지 Python 필터로 확정
+                rows = filter_recommendations(
+                    self._select_recommendations(columns, filters + self._period_filters(is_active_only)),
+                    is_active_only, is_new_announcements,
+                )
+            except APIError as e:
+                # start_date/end_date 컬럼이 없는 DB라면 이후로는 Python 필터만 사용
+                # (네트워크 오류 등 다른 실패는 서킷 브레이커가 한 번만 세도록 그대로 전달)
+                if not is_api_error(e, UNDEFINED_COLUMN_CODES):
+                    raise
+                print(f"⚠️ 날짜 컬럼이 없어 Python 필터로 전환합니다: {e}")
+                self.period_pushdown = False
+        if rows is None:
+            rows = filter_recommendations(
+                self._select_recommendations(columns, filters), is_active_only, is_new_announcements
+            )
+
+        grouped = {name: [] for name in company_names}
+        for row in rows:
+            grouped.setdefault(row.company, []).append(row)
+        return grouped
+
+    def _select_recommendations(self, columns, filters):
+        """iter_rows로 모든 페이지를 받아 Recommendation 목록으로 반환합니다."""
+        return [row for batch in self.iter_rows('recommend_final', columns, filters) for row in Recommendation.from_rows(batch)]
+
+    @staticmethod
+    def _period_filters(is_active_only, today=None):
+        """활성/신규 공고 후보 조건을 start_date/end_date 컬럼에 대한 iter_rows 조건 목록으로 만듭니다.
+
+        날짜 컬럼이 아직 채워지지 않은 행(NULL)도 후보에 넣으므로, 결과는 filter_recommendations로 한 번 더 거릅니다.
+        """
+        if today is None:
+            today = datetime.now().date()
+        if is_active_only:
+            today_str = today.isoformat()
+            return [(
+                'or_', None,
+                f'is_always_open.is.true,and(start_date.lte.{today_str},end_date.gte.{today_str}),'
+                'start_date.is.null,end_date.is.null',
+            )]
+        since = today - timedelta(days=NEW_ANNOUNCEMENT_DAYS)
+        return [('or_', None, f'start_date.gte.{since.isoformat()},start_date.is.null')]
+
+    @metrics.instrument()
     def get_monthly_recommendations(self, company_name: str = None):
         """월별 공고 수를 가져옵니다. 회사명이 지정되면 해당 회사의 추천 공고만 대상으로 합니다."""
-        if not self._client:
+        if not self._has_source('recommend_final'):
             return {i: 0 for i in range(1, 13)}
+        cache_key = ('recommend_final', company_name, 'monthly_counts')
         try:
-            if company_name:
-                # 특정 회사의 추천 공고만 가져오기 (전체 데이터 가져온 후 필터링)
-                response = self._client.table('recommend_final').select('*').eq('기업명', company_name).execute()
-            else:
-                # 모든 공고 가져오기 (전체 데이터 가져온 후 필터링)
-                response = self._client.table('recommend_final').select('*').execute()
-            
-            monthly_counts = {i: 0 for i in range(1, 13)}
-            
-            for item in response.data:
-                period_str = item.get('사업 연도', '')
-                if not period_str:
-                    continue
-                
-                # 더 포괄적인 날짜 패턴 시도
-                date_patterns = [
-                    r'"(\d{8})"',  # "yyyymmdd" 형식
-                    r'(\d{8})\s*~',  # yyyymmdd ~ 형식  
-                    r'(\d{8})',  # 일반 yyyymmdd 형식
-                    r'(\d{4})년\s*(\d{1,2})월',  # 2025년 1월 형식
-                    r'(\d{4})\.(\d{1,2})\.(\d{1,2})',  # 2025.01.15 형식
-                ]
-                
-                parsed = False
-                for pattern in date_patterns:
-                    match = re.search(pattern, period_str)
-                    if match:
-                        try:
-                            if pattern == r'(\d{4})년\s*(\d{1,2})월':
-                                # 2025년 1월 형식
-                                year = int(match.group(1))
-                                month = int(match.group(2))
-                                monthly_counts[month] += 1
-                                parsed = True
-                                break
-                            elif pattern == r'(\d{4})\.(\d{1,2})\.(\d{1,2})':
-                                # 2025.01.15 형식
-                                year = int(match.group(1))
-                                month = int(match.group(2))
-                                monthly_counts[month] += 1
-                                parsed = True
-                                break
-                            else:
-                                # yyyymmdd 형식
-                                start_date_str = match.group(1)
-                                start_date = datetime.strptime(start_date_str, '%Y%m%d').date()
-                                month = start_date.month
-                                monthly_counts[month] += 1
-                                parsed = True
-                                break
-                        except:
-                            continue
-                
-                # 연도만 있는 경우 (예: "2025")는 제외 - yyyymmdd ~ yyyymmdd 형식만 사용
-                # if not parsed and period_str.isdigit() and len(period_str) == 4:
-                #     # 연도만 있는 데이터는 제외
-                #     pass
-            
-            return monthly_counts
+            monthly_counts = self._load(
+                'recommend_final', cache_key, lambda: self._fetch_monthly_counts(company_name)
+            )
+            return dict(monthly_counts)
         except Exception as e:
             print(f"Error fetching monthly recommendations from Supabase: {e}")
             return {i: 0 for i in range(1, 13)}
 
-    def get_monthly_details(self, month: int, company_name: str = None):
-        """특정 월의 상세 공고 목록을 가져옵니다. 회사명이 지정되면 해당 회사의 추천 공고만 대상으로 합니다."""
-        if not self._client:
-            return []
-        try:
-            if company_name:
-                # 특정 회사의 추천 공고만 가져오기
-                response = self._client.table('recommend_final').select('*').eq('기업명', company_name).execute()
-            else:
-                # 모든 공고 가져오기
-                response = self._client.table('recommend_final').select('*').execute()
-            
-            monthly_details = []
-            for item in response.data:
+    def _fetch_monthly_counts(self, company_name):
+        if self.monthly_rpc and self._mirror_for('recommend_final') is None:
+            try:
+                # DB에서 연도/월별로 집계한 작은 결과만 받기
+                response = self._client.rpc(MONTHLY_COUNTS_RPC, {'p_company': company_name}).execute()
+                return monthly_counts_from_rpc(response.data)
+            except APIError as e:
+                # RPC 함수가 없는 DB라면 이후로는 클라이언트 집계만 사용
+                # (네트워크 오류 등 다른 실패는 서킷 브레이커가 한 번만 세도록 그대로 전달)
+                if not is_api_error(e, UNDEFINED_FUNCTION_CODES):
+                    raise
+                print(f"⚠️ 월별 집계 RPC가 없어 클라이언트 집계로 전환합니다: {e}")
+                self.monthly_rpc = False
+        # 특정 회사 또는 전체 공고를 페이지 단위로 집계 (전체 목록을 메모리에 올리지 않음)
+        filters = [('eq', '기업명', company_name)] if company_name else []
+        monthly_counts = {i: 0 for i in range(1, 13)}
+        for batch in self.iter_rows('recommend_final', PERIOD_VIEW.select_args(), filters):
+            for item in batch:
                 period_str = item.get('사업 연도', '')
                 if not period_str:
                     continue
-                
-                # 더 포괄적인 날짜 패턴 시도
-                date_patterns = [
-                    r'"(\d{8})"',  # "yyyymmdd" 형식
-                    r'(\d{8})\s*~',  # yyyymmdd ~ 형식  
-                    r'(\d{8})',  # 일반 yyyymmdd 형식
-                    r'(\d{4})년\s*(\d{1,2})월',  # 2025년 1월 형식
-                    r'(\d{4})\.(\d{1,2})\.(\d{1,2})',  # 2025.01.15 형식
-                ]
-                
-                parsed = False
-                for pattern in date_patterns:
-                    match = re.search(pattern, period_str)
-                    if match:
-                        try:
-                            if pattern == r'(\d{4})년\s*(\d{1,2})월':
-                                # 2025년 1월 형식
-                                year = int(match.group(1))
-                                item_month = int(match.group(2))
-                                if item_month == month:
-                                    monthly_details.append(item)
-                                parsed = True
-                                break
-                            elif pattern == r'(\d{4})\.(\d{1,2})\.(\d{1,2})':
-                                # 2025.01.15 형식
-                                year = int(match.group(1))
-                                item_month = int(match.group(2))
-                                if item_month == month:
-                                    monthly_details.append(item)
-                                parsed = True
-                                break
-                            else:
-                                # yyyymmdd 형식
-                                start_date_str = match.group(1)
-                                start_date = datetime.strptime(start_date_str, '%Y%m%d').date()
-                                if start_date.month == month:
-                                    monthly_details.append(item)
-                                parsed = True
-                                break
-                        except:
-                            continue
-                
-                # 연도만 있는 경우 (예: "2025")는 제외 - yyyymmdd ~ yyyymmdd 형식만 사용
-                # if not parsed and period_str.isdigit() and len(period_str) == 4:
-                #     # 연도만 있는 데이터는 제외
-                #     pass
-            
-            # 컬럼명 변경
-            df = pd.DataFrame(monthly_details)
-            if not df.empty:
-                df = df.rename(columns={
-                    '사업명': '공고명',
-                    '최종 점수': '총점수',
-                    '지역': '지역명',
-                    '사업 연도': '신청기간',
-                    '상세페이지 URL': '공고URL'
-                })
-                # 순위 추가
-                df['순위'] = range(1, len(df) + 1)
-                # 데이터소스 컬럼 추가 (기본값)
-                df['데이터소스'] = 'recommend_final'
-                # 지원분야, 지원대상, 소관기관 컬럼 추가 (기본값)
-                df['지원분야'] = '기타'
-                df['지원대상'] = '중소기업'
-                df['소관기관'] = '정부기관'
-                return df.to_dict('records')
+                month = start_month(period_str)
+                if month:
+                    monthly_counts[month] += 1
+        return monthly_counts
+
+    @metrics.instrument()
+    def get_monthly_frame(self, company_name: str):
+        """회사의 추천 공고를 시작 월별로 나눈 MonthlyRecommendations를 반환합니다 (캐시 공유)."""
+        cache_key = ('recommend_final', company_name, 'monthly_frame')
+        cached, needs_refresh = self.cache.lookup(cache_key)
+        metrics.mark_cache(cached is not None and not needs_refresh)
+        if cached is not None and not needs_refresh:
+            return cached
+        rows = self.get_recommendations(company_name)
+        monthly_frame = MonthlyRecommendations(rows)
+        if rows:
+            self.cache.put(cache_key, monthly_frame)
+        return monthly_frame
+
+    @metrics.instrument()
+    def get_monthly_details(self, month: int, company_name: str = None):
+        """특정 월의 상세 공고 목록을 가져옵니다. 회사명이 지정되면 해당 회사의 추천 공고만 대상으로 합니다."""
+        if not self._has_source('recommend_final'):
             return []
+        if company_name:
+            # 회사별 월 인덱스 프레임에서 바로 꺼내기
+            return self.get_monthly_frame(company_name).month(month).to_dict('records')
+        cache_key = ('recommend_final', company_name, f'month={month}')
+        try:
+            monthly_details = self._load(
+                'recommend_final', cache_key, lambda: self._fetch_monthly_details(month, company_name)
+            )
+            return list(monthly_details)
         except Exception as e:
             print(f"Error fetching monthly details from Supabase: {e}")
             return []
 
+    def _fetch_monthly_details(self, month, company_name):
+        # 특정 회사 또는 전체 공고 중 해당 월에 시작하는 공고만 모으기
+        filters = [('eq', '기업명', company_name)] if company_name else []
+        monthly_details = []
+        for batch in self.iter_rows('recommend_final', RECOMMENDATION_VIEW.select_args(), filters):
+            for item in batch:
+                period_str = item.get('사업 연도', '')
+                if period_str and start_month(period_str) == month:
+                    monthly_details.append(item)
+
+        # 컬럼명 변경 및 기본값 컬럼 추가
+        if monthly_details:
+            df = RECOMMENDATION_VIEW.to_frame(monthly_details)
+            # 순위 추가
+            df['순위'] = range(1, len(df) + 1)
+            monthly_details = df.to_dict('records')
+        return monthly_details
+
+
+class MonthlyRecommendations:
+    """회사 추천 공고를 한 번 파싱해 시작 월별로 나눠 둔 프레임.
+
+    로드맵 차트의 월별 건수와 월별 상세보기를 추가 조회 없이 바로 제공합니다.
+    """
+
+    def __init__(self, rows):
+        df = RECOMMENDATION_VIEW.to_frame(rows)
+        start_dates = parse_period_series(df['신청기간'])['start_date']
+        self._by_month = {}
+        for month, group in df.groupby(start_dates.dt.month):
+            group = group.reset_index(drop=True)
+            # 순위 추가
+            group['순위'] = range(1, len(group) + 1)
+            self._by_month[int(month)] = group
+        self._empty = df.iloc[0:0].assign(순위=pd.Series(dtype='int64'))
+        self.counts = {i: len(self._by_month.get(i, ())) for i in range(1, 13)}
+
+    def month(self, month: int):
+        """해당 월에 시작하는 공고 DataFrame"""
+        return self._by_month.get(month, self._empty)
+
+    @property
+    def nbytes(self):
+        return int(sum(group.memory_usage(deep=True).sum() for group in self._by_month.values()))
+
+
+class RecommendationContext:
+    """Streamlit 재실행(rerun) 한 번 동안 회사별 추천 공고를 한 번만 조회하는 요청 범위 컨텍스트.
+
+    전체/활성/신규 공고는 한 번 가져온 행에서 로컬로 계산합니다.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._rows = {}
+        self.fetch_count = 0
+
+    def rows(self, company_name):
+        """회사의 전체 추천 공고를 반환합니다. 재실행당 최초 호출에서만 조회합니다."""
+        if company_name not in self._rows:
+            self._rows[company_name] = self._client.get_recommendations(company_name=company_name)
+            self.fetch_count += 1
+        return self._rows[company_name]
+
+    def active(self, company_name):
+        """현재 신청 가능한 공고"""
+        return filter_recommendations(self.rows(company_name), is_active_only=True)
+
+    def new(self, company_name):
+        """5일 이내 신규 공고"""
+        return filter_recommendations(self.rows(company_name), is_new_announcements=True)
+
 supabase_client = SupabaseClient()
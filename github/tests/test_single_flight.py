@@ -0,0 +1,108 @@
+"""
+SingleFlight / SupabaseClient._guarded 동시성 테스트
+
+가짜 백엔드(benchmarks/fake_backend.py)에 요청당 지연을 넣고, 64개 스레드가 Barrier로 동시에
+같은 조회를 시작해도 Supabase 조회는 한 번만 실행되는지 확인합니다.
+
+실행:
+    python -m pytest -q tests
+"""
+import os
+import sys
+import threading
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TESTS_DIR, '..'))
+sys.path.insert(0, os.path.join(TESTS_DIR, '..', 'benchmarks'))
+
+import pytest  # noqa: E402
+
+from fake_backend import FakeSupabase  # noqa: E402
+from single_flight import SingleFlight  # noqa: E402
+from supabase_client import QueryCache, SupabaseClient  # noqa: E402
+from synthetic import DEFAULT_COMPANY_NAME, make_tables  # noqa: E402
+
+THREADS = 64
+
+
+def _run_concurrently(target, threads=THREADS):
+    """threads개 스레드가 Barrier에서 동시에 target()을 호출하고 (결과 목록, 예외 목록)을 반환합니다."""
+    barrier = threading.Barrier(threads)
+    results, errors = [None] * threads, []
+
+    def worker(index):
+        barrier.wait()
+        try:
+            results[index] = target()
+        except Exception as e:
+            errors.append(e)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join(timeout=30)
+    return results, errors
+
+
+def _client(fake):
+    client = SupabaseClient(cache=QueryCache(), stale_cache=QueryCache(), mirror_path=None)
+    client._client = fake
+    return client
+
+
+@pytest.fixture(scope='module')
+def tables():
+    return make_tables(2000)
+
+
+def test_single_flight_executes_once():
+    flights = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        # 다른 스레드가 모두 합류할 때까지 진행 중 상태 유지
+        while flights.stats()['shared'] < THREADS - 1:
+            started.wait(0.01)
+        return 'value'
+
+    results, errors = _run_concurrently(lambda: flights.do('key', slow))
+
+    assert not errors
+    assert results == ['value'] * THREADS
+    assert len(calls) == 1
+    assert flights.stats() == {'executed': 1, 'shared': THREADS - 1, 'in_flight': 0}
+
+
+def test_single_flight_shares_errors():
+    flights = SingleFlight()
+
+    def failing():
+        while flights.stats()['shared'] < THREADS - 1:
+            threading.Event().wait(0.01)
+        raise ConnectionError('refused')
+
+    results, errors = _run_concurrently(lambda: flights.do('key', failing))
+
+    assert len(errors) == THREADS
+    assert all(isinstance(e, ConnectionError) for e in errors)
+    assert flights.stats()['executed'] == 1
+
+
+def test_concurrent_get_recommendations_hits_backend_once(tables):
+    # 같은 조회를 한 번만 실행했을 때의 요청 수와 결과
+    expected_fake = FakeSupabase(tables)
+    expected = _client(expected_fake).get_recommendations(DEFAULT_COMPANY_NAME)
+    requests_per_fetch = expected_fake.requests
+
+    fake = FakeSupabase(tables, latency_ms=50)
+    client = _client(fake)
+    results, errors = _run_concurrently(lambda: client.get_recommendations(DEFAULT_COMPANY_NAME))
+
+    assert not errors
+    assert client.flights.stats()['executed'] == 1
+    assert fake.requests == requests_per_fetch
+    assert all(result == expected for result in results)